@@ -0,0 +1,9 @@
+"""
+Benchmarks of ``orient.planar`` functions on deterministic fixtures.
+
+Run with
+    python -m benchmarks run --output results.json
+and compare with previous results with
+    python -m benchmarks compare baseline.json results.json
+which exits with non-zero status if there are regressions.
+"""
@@ -0,0 +1,71 @@
+import json
+import sys
+from argparse import ArgumentParser
+from typing import (List,
+                    Optional)
+
+from ground.base import get_context
+
+from .comparison import (compare,
+                         to_regressions)
+from .runner import (DEFAULT_SIZES,
+                     SIZES,
+                     run)
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    parser = ArgumentParser(prog='python -m benchmarks',
+                            description='Benchmarks of orient.planar.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    run_parser = subparsers.add_parser(
+            'run',
+            help='time functions and store results as JSON'
+    )
+    run_parser.add_argument('--functions', nargs='+', default=['*'],
+                            help='glob patterns of functions names')
+    run_parser.add_argument(
+            '--sizes', nargs='+', type=int,
+            default=list(DEFAULT_SIZES),
+            help=('numbers of vertices of fixtures, all functions take '
+                  'minutes for the default ones & hours for {} {}'
+                  .format(*SIZES[len(DEFAULT_SIZES):]))
+    )
+    run_parser.add_argument('--repeat', type=int, default=3,
+                            help='number of timings to take the best of')
+    run_parser.add_argument('--output', required=True,
+                            help='path of JSON results file')
+    compare_parser = subparsers.add_parser(
+            'compare',
+            help='compare results and flag regressions'
+    )
+    compare_parser.add_argument('baseline', help='path of baseline results')
+    compare_parser.add_argument('current', help='path of current results')
+    compare_parser.add_argument('--threshold', type=float, default=0.2,
+                                help='fraction of slowdown to flag')
+    namespace = parser.parse_args(arguments)
+    if namespace.command == 'run':
+        report = run(namespace.functions, namespace.sizes, namespace.repeat,
+                     get_context())
+        with open(namespace.output, 'w') as file:
+            json.dump(report, file,
+                      indent=2)
+        return 0
+    with open(namespace.baseline) as file:
+        baseline = json.load(file)
+    with open(namespace.current) as file:
+        current = json.load(file)
+    changes = compare(baseline, current)
+    for (function_name, shape, size), ratio in changes:
+        print('{} {} {}: {:.2f}x'.format(function_name, shape, size, ratio))
+    regressions = to_regressions(changes, namespace.threshold)
+    if regressions:
+        print('Regressions over {:.0%}:'.format(namespace.threshold))
+        for (function_name, shape, size), ratio in regressions:
+            print('  {} {} {}: {:.2f}x'.format(function_name, shape, size,
+                                               ratio))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,45 @@
+"""
+Comparison of benchmarks results to flag regressions.
+"""
+from typing import (Any,
+                    Dict,
+                    List,
+                    Tuple)
+
+from .runner import Case
+
+# ratio of current time to baseline one with its case
+Change = Tuple[Case, float]
+
+
+def to_times(report: Dict[str, Any]) -> Dict[Case, float]:
+    return {to_case(result): result['seconds']
+            for result in report['results']}
+
+
+def to_case(result: Dict[str, Any]) -> Case:
+    return result['function'], result['shape'], result['size']
+
+
+def compare(baseline: Dict[str, Any],
+            current: Dict[str, Any]) -> List[Change]:
+    """
+    Returns ratios of current times to baseline ones
+    for cases present in both reports,
+    ordered from the largest slowdown.
+    """
+    baseline_times, current_times = to_times(baseline), to_times(current)
+    return sorted(((case, current_times[case] / baseline_times[case])
+                   for case in baseline_times.keys() & current_times.keys()
+                   if baseline_times[case]),
+                  key=lambda change: -change[1])
+
+
+def to_regressions(changes: List[Change],
+                   threshold: float) -> List[Change]:
+    """
+    Returns changes which slow down more than by the threshold fraction.
+    """
+    return [(case, ratio)
+            for case, ratio in changes
+            if ratio > 1 + threshold]
@@ -0,0 +1,288 @@
+"""
+Deterministic geometries of given kinds, shapes & sizes.
+
+Sizes are numbers of vertices (or segments' endpoints)
+of a geometry, multi-geometries split them between their parts.
+Coordinates are integers, so relations are computed exactly.
+"""
+from fractions import Fraction
+from math import (cos,
+                  gcd,
+                  pi,
+                  sin)
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    List,
+                    Sequence,
+                    Tuple)
+
+from ground.base import Context
+from ground.hints import (Box,
+                          Contour,
+                          Point,
+                          Polygon)
+
+# shapes of regions, polygons' borders & multiregions' parts
+CONVEX = 'convex'
+STAR = 'star'
+COMB = 'comb'
+# square polygons with grid of square holes
+HOLES = 'holes'
+# crossing diagonals of grid cells
+DENSE = 'dense'
+
+KINDS = ('point', 'segment', 'multisegment', 'contour', 'region',
+         'multiregion', 'polygon', 'multipolygon')
+MULTIPARTS_COUNT = 4
+REGIONS_SHAPES = (CONVEX, STAR, COMB)
+SHAPES: Dict[str, Sequence[str]] = {
+    'point': (CONVEX,),
+    'segment': (CONVEX,),
+    'multisegment': (DENSE,),
+    'contour': REGIONS_SHAPES,
+    'region': REGIONS_SHAPES,
+    'multiregion': REGIONS_SHAPES,
+    'polygon': (*REGIONS_SHAPES, HOLES),
+    'multipolygon': (*REGIONS_SHAPES, HOLES)
+}
+
+
+def to_convex_vertices(size: int) -> List[Tuple[int, int]]:
+    # edges are primitive vectors of the smallest norms ordered by angle,
+    # so the polygon is strictly convex with small coordinates
+    quarter_size = max(size // 4, 1)
+    quarter_edges = []
+    norm = 1
+    while len(quarter_edges) < quarter_size:
+        quarter_edges += [(x, norm - x)
+                          for x in range(1, norm + 1)
+                          if gcd(x, norm - x) == 1]
+        norm += 1
+    quarter_edges = sorted(quarter_edges[:quarter_size],
+                           key=lambda edge: Fraction(edge[1], edge[0]))
+    edges = (quarter_edges
+             + [(-y, x) for x, y in quarter_edges]
+             + [(-x, -y) for x, y in quarter_edges]
+             + [(y, -x) for x, y in quarter_edges])
+    result = []
+    x = y = 0
+    for step_x, step_y in edges:
+        result.append((x, y))
+        x, y = x + step_x, y + step_y
+    return result
+
+
+def to_star_vertices(size: int) -> List[Tuple[int, int]]:
+    # vertices alternate between inner & outer circles
+    # with spacing large enough to keep them distinct after rounding
+    size = max(size - size % 2, 4)
+    radius = 8 * size
+    return [(round(radius * ((index % 2) + 1) * cos(2 * pi * index / size)),
+             round(radius * ((index % 2) + 1) * sin(2 * pi * index / size)))
+            for index in range(size)]
+
+
+def to_comb_vertices(size: int) -> List[Tuple[int, int]]:
+    # teeth of unit width grow from the base & are separated by unit gaps
+    teeth_count = max(size // 4, 1)
+    height = 2 * teeth_count
+    result = [(0, 0), (2 * teeth_count - 1, 0)]
+    for index in range(teeth_count - 1, -1, -1):
+        result += [(2 * index + 1, height), (2 * index, height)]
+        if index:
+            result += [(2 * index, 1), (2 * index - 1, 1)]
+    return result
+
+
+REGIONS_VERTICES: Dict[str, Callable[[int], List[Tuple[int, int]]]] = {
+    CONVEX: to_convex_vertices,
+    STAR: to_star_vertices,
+    COMB: to_comb_vertices
+}
+
+
+def to_region(shape: str, size: int, context: Context) -> Contour:
+    point_cls = context.point_cls
+    return context.contour_cls([point_cls(x, y)
+                                for x, y in REGIONS_VERTICES[shape](size)])
+
+
+def to_holed_polygon(size: int, context: Context) -> Polygon:
+    contour_cls, point_cls = context.contour_cls, context.point_cls
+    holes_per_side = max(int((max(size - 4, 0) // 4) ** .5), 1)
+    side = 3 * holes_per_side + 1
+    border = contour_cls([point_cls(0, 0), point_cls(side, 0),
+                          point_cls(side, side), point_cls(0, side)])
+    holes = [contour_cls([point_cls(3 * column + 1, 3 * row + 1),
+                          point_cls(3 * column + 1, 3 * row + 3),
+                          point_cls(3 * column + 3, 3 * row + 3),
+                          point_cls(3 * column + 3, 3 * row + 1)])
+             for row in range(holes_per_side)
+             for column in range(holes_per_side)]
+    return context.polygon_cls(border, holes)
+
+
+def to_polygon(shape: str, size: int, context: Context) -> Polygon:
+    return (to_holed_polygon(size, context)
+            if shape == HOLES
+            else context.polygon_cls(to_region(shape, size, context), []))
+
+
+def to_dense_multisegment(size: int, context: Context) -> Any:
+    point_cls, segment_cls = context.point_cls, context.segment_cls
+    cells_per_side = max(int((size // 4) ** .5), 1)
+    return context.multisegment_cls(
+            [segment
+             for row in range(cells_per_side)
+             for column in range(cells_per_side)
+             for segment in (
+                 segment_cls(point_cls(column, row),
+                             point_cls(column + 1, row + 1)),
+                 segment_cls(point_cls(column + 1, row),
+                             point_cls(column, row + 1))
+             )]
+    )
+
+
+def to_geometry(kind: str, shape: str, size: int, context: Context) -> Any:
+    """
+    Returns geometry of given kind & shape
+    with given number of vertices in the first quadrant.
+    """
+    if kind == 'point':
+        return context.point_cls(0, 0)
+    elif kind == 'segment':
+        return context.segment_cls(context.point_cls(0, 0),
+                                   context.point_cls(size, size))
+    elif kind == 'multisegment':
+        return to_dense_multisegment(size, context)
+    elif kind in ('contour', 'region'):
+        return to_region(shape, size, context)
+    elif kind == 'polygon':
+        return to_polygon(shape, size, context)
+    part_size = max(size // MULTIPARTS_COUNT, 3)
+    if kind == 'multiregion':
+        return tile([to_region(shape, part_size, context)
+                     for _ in range(MULTIPARTS_COUNT)], context)
+    else:
+        assert kind == 'multipolygon', kind
+        return context.multipolygon_cls(
+                tile([to_polygon(shape, part_size, context)
+                      for _ in range(MULTIPARTS_COUNT)], context)
+        )
+
+
+def tile(geometries: List[Any], context: Context) -> List[Any]:
+    """Translates geometries to disjoint cells of a square grid."""
+    boxes = [to_box(geometry, context) for geometry in geometries]
+    step = 1 + max(max(box.max_x - box.min_x, box.max_y - box.min_y)
+                   for box in boxes)
+    columns_count = max(int(len(geometries) ** .5), 1)
+    return [translate(geometry,
+                      step * (index % columns_count) - box.min_x,
+                      step * (index // columns_count) - box.min_y,
+                      context)
+            for index, (geometry, box) in enumerate(zip(geometries, boxes))]
+
+
+def to_box(geometry: Any, context: Context) -> Box:
+    if hasattr(geometry, 'polygons'):
+        return context.polygons_box(geometry.polygons)
+    elif hasattr(geometry, 'border'):
+        return context.polygon_box(geometry)
+    elif hasattr(geometry, 'vertices'):
+        return context.contour_box(geometry)
+    elif hasattr(geometry, 'segments'):
+        return context.segments_box(geometry.segments)
+    elif hasattr(geometry, 'start'):
+        return context.segment_box(geometry)
+    elif hasattr(geometry, 'x'):
+        return context.box_cls(geometry.x, geometry.x, geometry.y,
+                               geometry.y)
+    else:
+        return context.contours_box(geometry)
+
+
+def translate(geometry: Any, step_x: int, step_y: int,
+              context: Context) -> Any:
+    def translate_point(point: Point) -> Point:
+        return context.point_cls(point.x + step_x, point.y + step_y)
+
+    def translate_contour(contour: Contour) -> Contour:
+        return context.contour_cls([translate_point(vertex)
+                                    for vertex in contour.vertices])
+
+    def translate_polygon(polygon: Polygon) -> Polygon:
+        return context.polygon_cls(translate_contour(polygon.border),
+                                   [translate_contour(hole)
+                                    for hole in polygon.holes])
+
+    if hasattr(geometry, 'polygons'):
+        return context.multipolygon_cls([translate_polygon(polygon)
+                                         for polygon in geometry.polygons])
+    elif hasattr(geometry, 'border'):
+        return translate_polygon(geometry)
+    elif hasattr(geometry, 'vertices'):
+        return translate_contour(geometry)
+    elif hasattr(geometry, 'segments'):
+        return context.multisegment_cls(
+                [context.segment_cls(translate_point(segment.start),
+                                     translate_point(segment.end))
+                 for segment in geometry.segments]
+        )
+    elif hasattr(geometry, 'start'):
+        return context.segment_cls(translate_point(geometry.start),
+                                   translate_point(geometry.end))
+    elif hasattr(geometry, 'x'):
+        return translate_point(geometry)
+    else:
+        return [translate_contour(contour) for contour in geometry]
+
+
+def to_operands(test_kind: str,
+                goal_kind: str,
+                shape: str,
+                size: int,
+                context: Context) -> Tuple[Any, Any]:
+    """
+    Returns test & goal geometries of given kinds & size
+    with the test one starting at the center of the goal one
+    (of its first part for multiregions & multipolygons),
+    so their relation is not decided by bounding boxes.
+
+    Shape applies to the goal, region-like tests are convex,
+    so number of their crossings with the goal grows linearly with size.
+    """
+    goal = to_geometry(goal_kind, shape, size, context)
+    test = to_geometry(test_kind,
+                       (shape
+                        if shape in (DENSE, HOLES)
+                        and shape in SHAPES[test_kind]
+                        else SHAPES[test_kind][0]),
+                       size, context)
+    anchor_box = to_box(to_anchor(goal), context)
+    test_box = to_box(test, context)
+    return translate(test,
+                     (anchor_box.min_x + anchor_box.max_x) // 2
+                     - test_box.min_x,
+                     (anchor_box.min_y + anchor_box.max_y) // 2
+                     - test_box.min_y,
+                     context), goal
+
+
+def to_anchor(geometry: Any) -> Any:
+    """
+    Returns the first part of tiled multi-geometries
+    & the geometry itself otherwise.
+
+    Parts are laid out in disjoint cells of a grid,
+    so the center of the whole multi-geometry
+    lies on a corner of a cell or in a gap between cells.
+    """
+    if hasattr(geometry, 'polygons'):
+        return geometry.polygons[0]
+    elif isinstance(geometry, list):
+        return geometry[0]
+    else:
+        return geometry
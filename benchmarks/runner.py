@@ -0,0 +1,77 @@
+"""
+Timing of ``orient.planar`` functions on generated fixtures.
+"""
+import platform
+from fnmatch import fnmatch
+from functools import partial
+from timeit import Timer
+from typing import (Any,
+                    Dict,
+                    Iterator,
+                    List,
+                    Sequence,
+                    Tuple)
+
+from ground.base import Context
+
+import orient
+from orient import planar
+from .fixtures import (SHAPES,
+                       to_operands)
+
+SIZES = (10, 10 ** 3, 10 ** 5, 10 ** 6)
+# all cases take minutes for these sizes,
+# but hours for the larger ones, so those are opted in explicitly
+DEFAULT_SIZES = SIZES[:2]
+FUNCTIONS_NAMES = sorted(name
+                         for name in vars(planar)
+                         if '_in_' in name and not name.startswith('_'))
+
+# benchmark case is a triplet of function name, goal shape & size
+Case = Tuple[str, str, int]
+
+
+def to_cases(patterns: Sequence[str], sizes: Sequence[int]) -> Iterator[Case]:
+    for function_name in FUNCTIONS_NAMES:
+        if not any(fnmatch(function_name, pattern) for pattern in patterns):
+            continue
+        goal_kind = function_name.split('_in_')[1]
+        for shape in SHAPES[goal_kind]:
+            for size in sizes:
+                yield function_name, shape, size
+
+
+def time_case(case: Case, repeat: int, context: Context) -> float:
+    """
+    Returns the best time in seconds of a single call
+    of the function on the case's fixtures.
+    """
+    function_name, shape, size = case
+    test_kind, goal_kind = function_name.split('_in_')
+    test, goal = to_operands(test_kind, goal_kind, shape, size, context)
+    timer = Timer(partial(getattr(planar, function_name), test, goal,
+                          context=context))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def run(patterns: Sequence[str],
+        sizes: Sequence[int],
+        repeat: int,
+        context: Context) -> Dict[str, Any]:
+    results: List[Dict[str, Any]] = []
+    for case in to_cases(patterns, sizes):
+        function_name, shape, size = case
+        seconds = time_case(case, repeat, context)
+        print('{} {} {}: {:.6g}s'.format(function_name, shape, size,
+                                         seconds),
+              flush=True)
+        results.append({'function': function_name,
+                        'shape': shape,
+                        'size': size,
+                        'seconds': seconds})
+    return {'orient': orient.__version__,
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'machine': platform.machine(),
+            'results': results}
@@ -0,0 +1,125 @@
+"""
+Relations of geometries which can be awaited in ``asyncio`` event loop.
+
+Relations run in threads of an executor,
+so long sweeps do not block the event loop
+which keeps serving other tasks meanwhile.
+Settings from ``orient.sweep_line`` of the current context
+are propagated to executor's threads.
+"""
+from concurrent.futures import Executor as _Executor
+from typing import (Iterable as _Iterable,
+                    List as _List,
+                    Optional as _Optional,
+                    Tuple as _Tuple)
+
+from ground.base import (Context as _Context,
+                         Relation as _Relation,
+                         get_context as _get_context)
+
+from .core import parallel as _parallel
+from .join import Geometry
+
+
+async def relate(test: Geometry,
+                 goal: Geometry,
+                 *,
+                 executor: _Optional[_Executor] = None,
+                 context: _Optional[_Context] = None) -> _Relation:
+    """
+    Finds relation of test geometry with goal geometry
+    without blocking the event loop.
+
+    Relation is the same as the one given
+    by ``orient.join.relate_pairs`` for the pair.
+
+    :param test: geometry to check for.
+    :param goal: geometry to check in.
+    :param executor:
+        thread pool executor to run the relation in,
+        defaults to the default executor of the running event loop.
+    :param context: geometric context.
+    :returns: relation of the test geometry with the goal one.
+
+    >>> import asyncio
+    >>> from ground.base import Relation, get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> outer_square = Polygon(Contour([Point(0, 0), Point(4, 0),
+    ...                                 Point(4, 4), Point(0, 4)]), [])
+    >>> inner_square = Polygon(Contour([Point(1, 1), Point(3, 1),
+    ...                                 Point(3, 3), Point(1, 3)]), [])
+    >>> (asyncio.run(relate(inner_square, outer_square))
+    ...  is Relation.WITHIN)
+    True
+    """
+    relations = await _parallel.relate_many_asynchronously(
+            [(test, goal)], executor, 1, 1,
+            _get_context() if context is None else context
+    )
+    return relations[0]
+
+
+async def relate_many(pairs: _Iterable[_Tuple[Geometry, Geometry]],
+                      *,
+                      executor: _Optional[_Executor] = None,
+                      workers: int = 1,
+                      chunk_size: int = 64,
+                      context: _Optional[_Context] = None
+                      ) -> _List[_Relation]:
+    """
+    Finds relations of test geometries with goal geometries
+    in pairs of ``(test, goal)`` without blocking the event loop.
+
+    Goals are prepared once & pairs are related in chunks
+    which are offloaded to the executor,
+    with at most ``workers`` chunks submitted to it at once,
+    so jobs submitted to the executor meanwhile
+    wait for chunks in flight rather than for the whole batch
+    and a large batch does not starve other users of the executor.
+    Relation of a pair is the same as the one given
+    by ``orient.join.relate_pairs`` for it.
+
+    :param pairs: pairs of geometries to check for and to check in.
+    :param executor:
+        thread pool executor to run chunks in,
+        defaults to the default executor of the running event loop.
+    :param workers:
+        number of chunks submitted to the executor at once,
+        with more workers than executor's threads
+        a batch can occupy all of them.
+    :param chunk_size: number of pairs related in a single executor call.
+    :param context: geometric context.
+    :returns: relations of pairs in the same order.
+
+    >>> import asyncio
+    >>> from ground.base import Relation, get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> Segment = context.segment_cls
+    >>> square = Polygon(Contour([Point(0, 0), Point(2, 0), Point(2, 2),
+    ...                           Point(0, 2)]), [])
+    >>> segments = [Segment(Point(1, 1), Point(3, 1)),
+    ...             Segment(Point(5, 5), Point(6, 6)),
+    ...             Segment(Point(0, 0), Point(2, 0))]
+    >>> asyncio.run(relate_many([(segment, square)
+    ...                          for segment in segments],
+    ...                         chunk_size=2)) == [Relation.CROSS,
+    ...                                            Relation.DISJOINT,
+    ...                                            Relation.COMPONENT]
+    True
+    """
+    if workers < 1:
+        raise ValueError('Number of workers should be positive, '
+                         'but got {!r}.'.format(workers))
+    if chunk_size < 1:
+        raise ValueError('Chunk size should be positive, '
+                         'but got {!r}.'.format(chunk_size))
+    return await _parallel.relate_many_asynchronously(
+            pairs, executor, workers, chunk_size,
+            _get_context() if context is None else context
+    )
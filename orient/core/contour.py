@@ -15,6 +15,7 @@ from .events_queue import (CompoundEventsQueue,
                            LinearEventsQueue)
 from .hints import SegmentEndpoints
 from .multisegment import to_segments_endpoints
+from .orienteer import to_orienteer
 from .processing import (process_closed_linear_queue,
                          process_open_linear_queue)
 from .segment import (locate_point as locate_point_in_segment,
@@ -32,7 +33,7 @@ def locate_point(contour: Contour, point: Point, context: Context) -> Location:
 def relate_segment(contour: Contour,
                    segment: Segment,
                    context: Context) -> Relation:
-    angle_orientation = context.angle_orientation
+    angle_orientation = to_orienteer(context)
     has_no_touch = has_no_cross = True
     last_touched_edge_index = last_touched_edge_start = None
     start, end = segment.start, segment.end
@@ -106,9 +107,11 @@ def relate_multisegment(contour: Contour,
         return Relation.DISJOINT
     events_queue = LinearEventsQueue(context)
     events_queue.register(to_edges_endpoints(contour),
-                          from_test=False)
+                          from_test=False,
+                          window=multisegment_bounding_box)
     events_queue.register(to_segments_endpoints(multisegment),
-                          from_test=True)
+                          from_test=True,
+                          window=contour_bounding_box)
     return process_open_linear_queue(events_queue,
                                      min(contour_bounding_box.max_x,
                                          multisegment_bounding_box.max_x))
@@ -123,9 +126,11 @@ def relate_contour(goal: Contour, test: Contour, context: Context) -> Relation:
         return Relation.EQUAL
     events_queue = CompoundEventsQueue(context)
     events_queue.register(to_oriented_edges_endpoints(goal, context),
-                          from_test=False)
+                          from_test=False,
+                          window=test_bounding_box)
     events_queue.register(to_oriented_edges_endpoints(test, context),
-                          from_test=True)
+                          from_test=True,
+                          window=goal_bounding_box)
     return process_closed_linear_queue(events_queue,
                                        min(goal_bounding_box.max_x,
                                            test_bounding_box.max_x))
@@ -171,11 +176,18 @@ def to_edges_endpoints(contour: Contour) -> Iterable[SegmentEndpoints]:
 
 def to_oriented_edges_endpoints(
         contour: Contour, context: Context, clockwise: bool = False
+) -> Iterable[SegmentEndpoints]:
+    return _to_oriented_edges_endpoints(contour, orientation(contour, context),
+                                        clockwise)
+
+
+def _to_oriented_edges_endpoints(
+        contour: Contour, contour_orientation: Orientation, clockwise: bool
 ) -> Iterable[SegmentEndpoints]:
     vertices = contour.vertices
     return (((vertices[index - 1], vertices[index])
              for index in range(len(vertices)))
-            if (orientation(contour, context)
+            if (contour_orientation
                 is (Orientation.CLOCKWISE
                     if clockwise
                     else Orientation.COUNTERCLOCKWISE))
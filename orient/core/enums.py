@@ -15,3 +15,33 @@ class OverlapKind(IntEnum):
     NONE = 0
     SAME_ORIENTATION = 1
     DIFFERENT_ORIENTATION = 2
+
+
+@unique
+class Arithmetic(IntEnum):
+    FLOAT = 0
+    INTEGER = 1
+    SCALAR = 2
+
+
+@unique
+class NodeKind(IntEnum):
+    LEAF = 0
+    X = 1
+    Y = 2
+
+
+@unique
+class GeometryKind(IntEnum):
+    SEGMENT = 0
+    MULTISEGMENT = 1
+    CONTOUR = 2
+    REGION = 3
+    POLYGON = 4
+    MULTIPOLYGON = 5
+
+
+@unique
+class SweepLineKind(IntEnum):
+    RED_BLACK_TREE = 0
+    SORTED_BLOCKS = 1
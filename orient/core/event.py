@@ -1,9 +1,5 @@
-from __future__ import annotations
-
-from abc import (ABC,
-                 abstractmethod)
-from reprlib import recursive_repr
-from typing import Optional
+from array import array
+from typing import List
 
 from ground.hints import Point
 from reprit.base import generate_repr
@@ -12,255 +8,129 @@ from .enums import (OverlapKind,
                     SegmentsRelation)
 from .hints import SegmentEndpoints
 
-
-class Event(ABC):
-    left: Optional[LeftEvent] = None
-    right: Optional[RightEvent] = None
-
-    __slots__ = ()
-
-    @property
-    @abstractmethod
-    def end(self) -> Point:
-        """Returns end of the event."""
-
-    @property
-    @abstractmethod
-    def from_goal(self) -> bool:
-        """Checks if the event's segment is from goal geometry."""
-
-    @property
-    @abstractmethod
-    def from_test(self) -> bool:
-        """Checks if the event's segment is from test geometry."""
-
-    @property
-    @abstractmethod
-    def is_left(self) -> bool:
-        """
-        Checks if the event corresponds to a leftmost endpoint of the segment.
-        """
-
-    @property
-    @abstractmethod
-    def original_end(self) -> Point:
-        """Returns original end of the event's segment."""
-
-    @property
-    @abstractmethod
-    def original_start(self) -> Point:
-        """Returns original start of the event's segment."""
-
-    @property
-    @abstractmethod
-    def start(self) -> Point:
-        """Returns start of the event."""
-
-
-class LeftEvent(Event):
-    is_left = True
-
-    @abstractmethod
-    def divide(self, break_point: Point) -> 'LeftEvent':
-        """Divides the event at given break point and returns tail."""
-
-
-class RightEvent(Event):
-    is_left = False
-
-    __slots__ = 'left', '_original_start', '_start'
-
-    def __init__(self,
-                 start: Point,
-                 left: LeftEvent,
-                 original_start: Point) -> None:
-        self.left, self._original_start, self._start = (
-            left, original_start, start
-        )
-
-    __repr__ = recursive_repr()(generate_repr(__init__))
-
-    @property
-    def end(self) -> Point:
-        return self.left.start
-
-    @property
-    def from_goal(self) -> bool:
-        return self.left.from_goal
-
-    @property
-    def from_test(self) -> bool:
-        return self.left.from_test
-
-    @property
-    def original_end(self) -> Point:
-        return self.left.original_start
-
-    @property
-    def original_start(self) -> Point:
-        return self._original_start
-
-    @property
-    def start(self) -> Point:
-        return self._start
-
-
-class LinearLeftEvent(LeftEvent):
-    @classmethod
-    def from_endpoints(cls, endpoints, from_test: bool) -> 'LinearLeftEvent':
-        start, end = endpoints
-        if start > end:
-            start, end = end, start
-        result = cls(start, None, start, from_test, SegmentsRelation.DISJOINT)
-        result.right = RightEvent(end, result, end)
-        return result
-
-    __slots__ = '_from_test', '_original_start', '_start', 'relation', 'right'
-
-    def __init__(self,
-                 start: Point,
-                 right: Optional[RightEvent],
-                 original_start: Point,
-                 from_test: bool,
-                 relation: SegmentsRelation) -> None:
-        self.right, self._original_start, self._start = (
-            right, original_start, start
-        )
-        self._from_test = from_test
-        self.relation = relation
-
-    __repr__ = recursive_repr()(generate_repr(__init__))
-
-    @property
-    def end(self) -> Point:
-        return self.right.start
-
-    @property
-    def from_goal(self) -> bool:
-        return not self.from_test
-
-    @property
-    def from_test(self) -> bool:
-        return self._from_test
-
-    @property
-    def original_end(self) -> Point:
-        return self.right.original_start
-
-    @property
-    def original_start(self) -> Point:
-        return self._original_start
-
-    @property
-    def start(self) -> Point:
-        return self._start
-
-    def divide(self, break_point: Point) -> 'LinearLeftEvent':
-        tail = self.right.left = LinearLeftEvent(
-                break_point, self.right, self.original_start, self.from_test,
-                self.relation
-        )
-        self.right = RightEvent(break_point, self, self.original_end)
-        return tail
-
-
-class CompoundLeftEvent(LeftEvent):
-    @classmethod
-    def from_endpoints(cls,
-                       segment_endpoints: SegmentEndpoints,
-                       from_test: bool) -> 'CompoundLeftEvent':
+# events are integer identifiers of their data in an arena,
+# left event of the segment has even identifier
+# and right event of the segment has odd one
+Event = int
+
+# flags of events
+FROM_TEST = 1 << 0
+INTERIOR_TO_LEFT = 1 << 1
+OTHER_INTERIOR_TO_LEFT = 1 << 2
+
+
+class EventsArena:
+    """
+    Storage of events' data in parallel columns indexed by events.
+    """
+    __slots__ = ('flags', 'opposites', 'original_starts', 'overlap_kinds',
+                 'relations', 'starts')
+
+    def __init__(self) -> None:
+        self.flags = bytearray()
+        # left events for right ones and vice versa
+        self.opposites = array('q')
+        self.original_starts: List[Point] = []
+        self.overlap_kinds = bytearray()
+        self.relations = bytearray()
+        self.starts: List[Point] = []
+
+    __repr__ = generate_repr(__init__)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def add(self, segment_endpoints: SegmentEndpoints, from_test: bool
+            ) -> Event:
+        """Adds events of the segment and returns its left event."""
         start, end = segment_endpoints
-        inside_on_left = True
+        flags = FROM_TEST if from_test else 0
         if start > end:
             start, end = end, start
-            inside_on_left = False
-        result = cls(start, None, start, from_test, SegmentsRelation.DISJOINT,
-                     inside_on_left)
-        result.right = RightEvent(end, result, end)
+        else:
+            flags |= INTERIOR_TO_LEFT
+        result = len(self.starts)
+        self.starts += (start, end)
+        self.original_starts += (start, end)
+        self.opposites.extend((result + 1, result))
+        self.flags.extend((flags, flags))
+        self.relations.extend((SegmentsRelation.DISJOINT,) * 2)
+        self.overlap_kinds.extend((OverlapKind.NONE,) * 2)
         return result
 
-    __slots__ = (
-        'right', 'interior_to_left', 'other_interior_to_left', 'overlap_kind',
-        'relation', '_from_test', '_original_start', '_start'
-    )
-
-    def __init__(self,
-                 start: Point,
-                 right: Optional[RightEvent],
-                 original_start: Point,
-                 from_test: bool,
-                 relation: SegmentsRelation,
-                 interior_to_left: bool) -> None:
-        self.right, self._original_start, self._start = (
-            right, original_start, start
-        )
-        self._from_test = from_test
-        self.relation = relation
-        self.overlap_kind = OverlapKind.NONE
-        self.interior_to_left = interior_to_left
-        self.other_interior_to_left = False
-
-    __repr__ = recursive_repr()(generate_repr(__init__))
-
-    @property
-    def end(self) -> Point:
-        return self.right.start
+    def divide(self, event: Event, break_point: Point) -> Event:
+        """Divides the left event at given break point and returns tail."""
+        right = self.opposites[event]
+        result = len(self.starts)
+        self.starts += (break_point, break_point)
+        self.original_starts += (self.original_starts[event],
+                                 self.original_starts[right])
+        self.opposites.extend((right, event))
+        self.opposites[event], self.opposites[right] = result + 1, result
+        flags = self.flags[event]
+        self.flags.extend((flags & ~OTHER_INTERIOR_TO_LEFT, flags))
+        self.relations.extend((self.relations[event],) * 2)
+        self.overlap_kinds.extend((OverlapKind.NONE,) * 2)
+        return result
 
-    @property
-    def from_goal(self) -> bool:
-        return not self.from_test
+    def end(self, event: Event) -> Point:
+        return self.starts[self.opposites[event]]
 
-    @property
-    def from_test(self) -> bool:
-        return self._from_test
+    def from_test(self, event: Event) -> bool:
+        """Checks if the event's segment is from test geometry."""
+        return bool(self.flags[event] & FROM_TEST)
 
-    @property
-    def inside(self) -> bool:
+    def inside(self, event: Event) -> bool:
         """
         Checks if the segment enclosed by
         or lies within the region of the intersection.
         """
-        return (self.other_interior_to_left
-                and self.overlap_kind is OverlapKind.NONE)
+        return bool(self.flags[event] & OTHER_INTERIOR_TO_LEFT
+                    and not self.overlap_kinds[event])
+
+    def interior_to_left(self, event: Event) -> bool:
+        return bool(self.flags[event] & INTERIOR_TO_LEFT)
 
-    @property
-    def is_common_polyline_component(self) -> bool:
+    def is_common_polyline_component(self, event: Event) -> bool:
         """
         Checks if the segment is a component of intersection's polyline.
         """
-        return self.overlap_kind is OverlapKind.DIFFERENT_ORIENTATION
+        return self.overlap_kinds[event] == OverlapKind.DIFFERENT_ORIENTATION
 
-    @property
-    def is_common_region_boundary(self) -> bool:
+    def is_common_region_boundary(self, event: Event) -> bool:
         """
         Checks if the segment is a boundary of intersection's region.
         """
-        return self.overlap_kind is OverlapKind.SAME_ORIENTATION
+        return self.overlap_kinds[event] == OverlapKind.SAME_ORIENTATION
+
+    @staticmethod
+    def is_left(event: Event) -> bool:
+        """
+        Checks if the event corresponds to a leftmost endpoint of the segment.
+        """
+        return not event & 1
+
+    def left(self, event: Event) -> Event:
+        return self.opposites[event] if event & 1 else event
 
-    @property
-    def original_end(self) -> Point:
-        return self.right.original_start
+    def original_end(self, event: Event) -> Point:
+        return self.original_starts[self.opposites[event]]
 
-    @property
-    def original_start(self) -> Point:
-        return self._original_start
+    def other_interior_to_left(self, event: Event) -> bool:
+        return bool(self.flags[event] & OTHER_INTERIOR_TO_LEFT)
 
-    @property
-    def outside(self) -> bool:
+    def outside(self, event: Event) -> bool:
         """
         Checks if the segment touches or disjoint with the intersection.
         """
-        return (not self.other_interior_to_left
-                and self.overlap_kind is OverlapKind.NONE)
+        return not (self.flags[event] & OTHER_INTERIOR_TO_LEFT
+                    or self.overlap_kinds[event])
 
-    @property
-    def start(self) -> Point:
-        return self._start
+    def right(self, event: Event) -> Event:
+        return event if event & 1 else self.opposites[event]
 
-    def divide(self, break_point: Point) -> 'CompoundLeftEvent':
-        tail = self.right.left = CompoundLeftEvent(
-                break_point, self.right, self.original_start, self.from_test,
-                self.relation, self.interior_to_left
-        )
-        self.right = RightEvent(break_point, self, self.original_end)
-        return tail
+    def set_other_interior_to_left(self, event: Event, value: bool) -> None:
+        self.flags[event] = ((self.flags[event] | OTHER_INTERIOR_TO_LEFT)
+                             if value
+                             else (self.flags[event]
+                                   & ~OTHER_INTERIOR_TO_LEFT))
@@ -1,37 +1,137 @@
 from abc import abstractmethod
+from array import array
 from functools import partial
-from typing import (Iterable,
+from itertools import groupby
+from typing import (Dict,
+                    Iterable,
                     List,
                     Optional,
-                    Sequence)
+                    Sequence,
+                    Tuple)
 
 from ground.base import (Context,
+                         Mode,
                          Orientation,
                          Relation)
-from ground.hints import (Point,
+from ground.hints import (Box,
+                          Point,
                           Scalar)
 from prioq.base import PriorityQueue
 from reprit.base import generate_repr
 
 from .enums import (OverlapKind,
                     SegmentsRelation)
-from .event import (CompoundLeftEvent as CompoundEvent,
-                    Event,
-                    LeftEvent,
-                    LinearLeftEvent as LinearEvent)
+from .event import (Event,
+                    EventsArena)
 from .hints import (Orienteer,
                     SegmentEndpoints)
-from .sweep_line import SweepLine
+from .homogeneous import (intersect_segments as intersect_integral_segments,
+                          relate_segments as relate_integral_segments)
+from .monotone_chains import (MonotoneChain,
+                              monotone_chains,
+                              to_monotone_chains)
+from .orienteer import to_orienteer
+from .sweep_line import to_sweep_line
 from .utils import all_equal
 
 
+class EventsPriorityQueue:
+    """
+    Priority queue of events which sorts registered events in bulk
+    and keeps in a heap only events pushed after that.
+    """
+    __slots__ = ('events', 'key', 'orienteer', '_heap', '_heap_is_next',
+                 '_pending', '_sorted')
+
+    def __init__(self, events: EventsArena, orienteer: Orienteer) -> None:
+        self.events, self.orienteer = events, orienteer
+        key = self.key = partial(to_events_queue_key, orienteer, events)
+        self._heap = PriorityQueue(key=key)
+        self._heap_is_next: Optional[bool] = None
+        self._pending = array('q')
+        # sorted events in descending order,
+        # so the next event is at the end
+        self._sorted = array('q')
+
+    __repr__ = generate_repr(__init__)
+
+    def __bool__(self) -> bool:
+        return bool(self._sorted or self._pending or self._heap)
+
+    def extend(self, events: Iterable[Event]) -> None:
+        self._pending.extend(events)
+        self._heap_is_next = None
+
+    def peek(self) -> Event:
+        return self._heap.peek() if self._is_heap_next() else self._sorted[-1]
+
+    def pop(self) -> Event:
+        result = (self._heap.pop()
+                  if self._is_heap_next()
+                  else self._sorted.pop())
+        self._heap_is_next = None
+        return result
+
+    def push(self, event: Event) -> None:
+        self._heap.push(event)
+        self._heap_is_next = None
+
+    def _is_heap_next(self) -> bool:
+        if self._heap_is_next is None:
+            if self._pending:
+                self._sort_pending()
+            self._heap_is_next = (bool(self._heap)
+                                  and (not self._sorted
+                                       or (self.key(self._heap.peek())
+                                           < self.key(self._sorted[-1]))))
+        return self._heap_is_next
+
+    def _sort_pending(self) -> None:
+        events = self.events
+        starts = events.starts
+        sorted_events = [*self._sorted, *self._pending]
+        # stable sorts from the least significant part of the key
+        # avoid allocating keys for every event
+        sorted_events.sort(key=events.is_left,
+                           reverse=True)
+        sorted_events.sort(key=lambda event: starts[event].y,
+                           reverse=True)
+        sorted_events.sort(key=lambda event: starts[event].x,
+                           reverse=True)
+        result = array('q')
+        tie_breaker = partial(EventsTieBreaker, self.orienteer, events)
+        for _, same_position_events in groupby(
+                sorted_events,
+                key=lambda event: (starts[event], events.is_left(event))
+        ):
+            same_position_events = list(same_position_events)
+            if len(same_position_events) > 1:
+                same_position_events.sort(key=tie_breaker,
+                                          reverse=True)
+            result.extend(same_position_events)
+        self._sorted = result
+        self._pending = array('q')
+
+
 class EventsQueue:
-    __slots__ = 'context', 'key', '_queue'
+    __slots__ = ('context', 'events', 'goal_clipped', 'integral', 'key',
+                 'orienteer', 'test_clipped', '_chains_tails', '_queue')
 
     def __init__(self, context: Context) -> None:
         self.context = context
-        key = self.key = partial(EventsQueueKey, context.angle_orientation)
-        self._queue = PriorityQueue(key=key)
+        self.events = EventsArena()
+        # whether some segments of the goal/test were not registered
+        # since they lie outside of the other geometry's bounding box
+        self.goal_clipped = self.test_clipped = False
+        # segments with integer endpoints are processed
+        # with integer arithmetic and homogeneous break points
+        self.integral = context.mode is Mode.EXACT
+        self.orienteer = to_orienteer(context)
+        # not yet registered segments of monotone chains
+        # by right events of the chains' last registered segments
+        self._chains_tails: Dict[Event, Tuple[MonotoneChain, int, bool]] = {}
+        self._queue = EventsPriorityQueue(self.events, self.orienteer)
+        self.key = self._queue.key
 
     __repr__ = generate_repr(__init__)
 
@@ -41,52 +141,154 @@ class EventsQueue:
     def peek(self) -> Event:
         return self._queue.peek()
 
-    @abstractmethod
     def register(self, segments_endpoints: Iterable[SegmentEndpoints],
                  *,
-                 from_test: bool) -> None:
+                 from_test: bool,
+                 window: Optional[Box] = None) -> None:
         """
         Registers segments in the events queue.
+
+        If window (bounding box of the other geometry) is given,
+        segments which can not affect the sweep inside of it are skipped
+        and only mark their geometry as clipped.
+
+        If monotone chains are enabled in the current context,
+        only the first segment of each monotone chain is registered
+        and the next one is registered when the sweep reaches its start.
         """
+        events = self.events
+        first_event = len(events)
+        if window is not None:
+            segments_endpoints = self._clip(segments_endpoints, window,
+                                            from_test)
+        if monotone_chains.get():
+            chains = to_monotone_chains(segments_endpoints)
+            self.integral = self.integral and all(
+                    int is type(start.x) is type(start.y)
+                    is type(end.x) is type(end.y)
+                    for chain in chains
+                    for start, end in chain
+            )
+            for chain in chains:
+                self._add_chain_segment(chain, 0, from_test)
+        else:
+            for segment_endpoints in segments_endpoints:
+                events.add(segment_endpoints, from_test)
+            self.integral = self.integral and all(
+                    int is type(start.x) is type(start.y)
+                    for start in events.starts[first_event:]
+            )
+        self._queue.extend(range(first_event, len(events)))
 
     @abstractmethod
-    def sweep(self, stop_x: Scalar) -> Iterable[LeftEvent]:
+    def sweep(self, stop_x: Scalar) -> Iterable[Event]:
         """
-        Sweeps plane and emits processed segments' events.
+        Sweeps plane and emits processed segments' left events.
         """
 
-    def _divide_segment(self, event: LeftEvent, break_point: Point) -> None:
-        self._queue.push(event.divide(break_point))
-        self._queue.push(event.right)
+    @staticmethod
+    @abstractmethod
+    def is_clipped(segment_endpoints: SegmentEndpoints, window: Box) -> bool:
+        """
+        Checks if the segment can be skipped by the sweep
+        without affecting relations of segments inside of the window.
+        """
 
+    def _add_chain_segment(self,
+                           chain: MonotoneChain,
+                           index: int,
+                           from_test: bool) -> Event:
+        event = self.events.add(chain[index], from_test)
+        if index + 1 < len(chain):
+            self._chains_tails[self.events.right(event)] = (chain, index + 1,
+                                                            from_test)
+        return event
 
-class CompoundEventsQueue(EventsQueue):
-    def register(self, segments_endpoints: Iterable[SegmentEndpoints],
-                 *,
-                 from_test: bool) -> None:
-        push = self._queue.push
+    def _clip(self,
+              segments_endpoints: Iterable[SegmentEndpoints],
+              window: Box,
+              from_test: bool) -> Iterable[SegmentEndpoints]:
+        is_clipped = self.is_clipped
         for segment_endpoints in segments_endpoints:
-            event = CompoundEvent.from_endpoints(segment_endpoints, from_test)
-            push(event)
-            push(event.right)
-
-    def sweep(self, stop_x: Scalar) -> Iterable[CompoundEvent]:
-        sweep_line: SweepLine[CompoundEvent] = SweepLine(self.context)
-        queue = self._queue
-        start: Optional[Point] = queue.peek().start if queue else None
+            if is_clipped(segment_endpoints, window):
+                if from_test:
+                    self.test_clipped = True
+                else:
+                    self.goal_clipped = True
+            else:
+                yield segment_endpoints
+
+    def _continue_chain(self, right_event: Event) -> None:
+        """
+        Registers the next segment of the monotone chain
+        which starts at the right endpoint of the processed segment.
+        """
+        event = self._add_chain_segment(*self._chains_tails.pop(right_event))
+        self._queue.push(event)
+        self._queue.push(self.events.right(event))
+
+    def _divide_segment(self, event: Event, break_point: Point) -> None:
+        self._queue.push(self.events.divide(event, break_point))
+        self._queue.push(self.events.right(event))
+
+    def _intersect_segments(self, first: Event, second: Event) -> Point:
+        if self.integral:
+            return intersect_integral_segments(self.events, first, second,
+                                               self.context.point_cls)
+        segment_cls = self.context.segment_cls
+        return self.context.segments_intersection(
+                segment_cls(self.events.starts[first],
+                            self.events.end(first)),
+                segment_cls(self.events.starts[second],
+                            self.events.end(second))
+        )
+
+    def _relate_segments(self, first: Event, second: Event) -> Relation:
+        events = self.events
+        if self.integral:
+            return relate_integral_segments(
+                    events.starts[first], events.end(first),
+                    events.starts[second], events.end(second), self.orienteer
+            )
+        segment_cls = self.context.segment_cls
+        return self.context.segments_relation(
+                segment_cls(events.starts[first], events.end(first)),
+                segment_cls(events.starts[second], events.end(second))
+        )
+
+
+class CompoundEventsQueue(EventsQueue):
+    @staticmethod
+    def is_clipped(segment_endpoints: SegmentEndpoints, window: Box) -> bool:
+        # segments below the window are kept,
+        # since they define positions of segments above
+        start, end = segment_endpoints
+        return (max(start.x, end.x) < window.min_x
+                or window.max_x < min(start.x, end.x)
+                or window.max_y < min(start.y, end.y))
+
+    def sweep(self, stop_x: Scalar) -> Iterable[Event]:
+        events = self.events
+        starts = events.starts
+        sweep_line = to_sweep_line(events, self.context)
+        queue, chains_tails = self._queue, self._chains_tails
+        start: Optional[Point] = starts[queue.peek()] if queue else None
         same_start_events: List[Event] = []
         while queue:
             event = queue.peek()
-            if event.start.x > stop_x:
+            if starts[event].x > stop_x:
                 # no intersection segments left
                 break
             queue.pop()
-            if event.start == start:
+            if event in chains_tails:
+                self._continue_chain(event)
+            if starts[event] == start:
                 same_start_events.append(event)
             else:
-                yield from complete_events_relations(same_start_events)
-                same_start_events, start = [event], event.start
-            if event.is_left:
+                yield from complete_events_relations(events,
+                                                     same_start_events)
+                same_start_events, start = [event], starts[event]
+            if events.is_left(event):
                 sweep_line.add(event)
                 above_event, below_event = (sweep_line.above(event),
                                             sweep_line.below(event))
@@ -99,108 +301,118 @@ class CompoundEventsQueue(EventsQueue):
                     self.compute_position(sweep_line.below(below_event),
                                           below_event)
             else:
-                event = event.left
+                event = events.left(event)
                 if event in sweep_line:
                     above_event, below_event = (sweep_line.above(event),
                                                 sweep_line.below(event))
                     sweep_line.remove(event)
                     if above_event is not None and below_event is not None:
                         self.detect_intersection(below_event, above_event)
-        yield from complete_events_relations(same_start_events)
+        yield from complete_events_relations(events, same_start_events)
 
-    def detect_intersection(self,
-                            below_event: CompoundEvent,
-                            event: CompoundEvent) -> bool:
+    def detect_intersection(self, below_event: Event, event: Event) -> bool:
         """
         Populates events queue with intersection events.
         Checks if events' segments overlap and have the same start.
         """
-        relation = self.context.segments_relation(below_event, event)
+        events = self.events
+        relation = self._relate_segments(below_event, event)
         if relation is Relation.TOUCH or relation is Relation.CROSS:
-            point = self.context.segments_intersection(below_event, event)
-            if point != below_event.start and point != below_event.end:
+            point = self._intersect_segments(below_event, event)
+            if (point != events.starts[below_event]
+                    and point != events.end(below_event)):
                 self._divide_segment(below_event, point)
-            if point != event.start and point != event.end:
+            if point != events.starts[event] and point != events.end(event):
                 self._divide_segment(event, point)
         elif relation is not Relation.DISJOINT:
             # segments overlap
-            if event.from_test is below_event.from_test:
+            if events.from_test(event) is events.from_test(below_event):
                 raise ValueError('Segments of the same geometry '
                                  'should not overlap.')
-            starts_equal = below_event.start == event.start
-            ends_equal = below_event.end == event.end
+            starts_equal = events.starts[below_event] == events.starts[event]
+            ends_equal = events.end(below_event) == events.end(event)
             start_min, start_max = (
                 (event, below_event)
                 if starts_equal or self.key(event) < self.key(below_event)
                 else (below_event, event)
             )
             end_min, end_max = (
-                (event.right, below_event.right)
-                if ends_equal or (self.key(event.right)
-                                  < self.key(below_event.right))
-                else (below_event.right, event.right)
+                (events.right(event), events.right(below_event))
+                if ends_equal or (self.key(events.right(event))
+                                  < self.key(events.right(below_event)))
+                else (events.right(below_event), events.right(event))
             )
             if starts_equal:
                 # both line segments are equal or share the left endpoint
-                below_event.overlap_kind = event.overlap_kind = (
-                    OverlapKind.SAME_ORIENTATION
-                    if event.interior_to_left is below_event.interior_to_left
-                    else OverlapKind.DIFFERENT_ORIENTATION
-                )
+                events.overlap_kinds[below_event] = (
+                    events.overlap_kinds[event]
+                ) = (OverlapKind.SAME_ORIENTATION
+                     if (events.interior_to_left(event)
+                         is events.interior_to_left(below_event))
+                     else OverlapKind.DIFFERENT_ORIENTATION)
                 if not ends_equal:
-                    self._divide_segment(end_max.left, end_min.start)
+                    self._divide_segment(events.left(end_max),
+                                         events.starts[end_min])
                 return True
             elif ends_equal:
                 # the line segments share the right endpoint
-                self._divide_segment(start_min, start_max.start)
-            elif start_min is end_max.left:
+                self._divide_segment(start_min, events.starts[start_max])
+            elif start_min == events.left(end_max):
                 # one line segment includes the other one
-                self._divide_segment(start_min, end_min.start)
-                self._divide_segment(start_min, start_max.start)
+                self._divide_segment(start_min, events.starts[end_min])
+                self._divide_segment(start_min, events.starts[start_max])
             else:
                 # no line segment includes the other one
-                self._divide_segment(start_max, end_min.start)
-                self._divide_segment(start_min, start_max.start)
+                self._divide_segment(start_max, events.starts[end_min])
+                self._divide_segment(start_min, events.starts[start_max])
         return False
 
-    @staticmethod
-    def compute_position(below_event: Optional[CompoundEvent],
-                         event: CompoundEvent) -> None:
+    def compute_position(self,
+                         below_event: Optional[Event],
+                         event: Event) -> None:
         if below_event is not None:
-            event.other_interior_to_left = (below_event.other_interior_to_left
-                                            if (event.from_test
-                                                is below_event.from_test)
-                                            else below_event.interior_to_left)
+            events = self.events
+            events.set_other_interior_to_left(
+                    event,
+                    events.other_interior_to_left(below_event)
+                    if (events.from_test(event)
+                        is events.from_test(below_event))
+                    else events.interior_to_left(below_event)
+            )
 
 
 class LinearEventsQueue(EventsQueue):
-    def register(self, segments_endpoints: Iterable[SegmentEndpoints],
-                 *,
-                 from_test: bool) -> None:
-        push = self._queue.push
-        for segment_endpoints in segments_endpoints:
-            event = LinearEvent.from_endpoints(segment_endpoints, from_test)
-            push(event)
-            push(event.right)
-
-    def sweep(self, stop_x: Scalar) -> Iterable[LinearEvent]:
-        sweep_line: SweepLine[LinearEvent] = SweepLine(self.context)
-        queue = self._queue
-        start: Optional[Point] = queue.peek().start if queue else None
+    @staticmethod
+    def is_clipped(segment_endpoints: SegmentEndpoints, window: Box) -> bool:
+        start, end = segment_endpoints
+        return (max(start.x, end.x) < window.min_x
+                or window.max_x < min(start.x, end.x)
+                or max(start.y, end.y) < window.min_y
+                or window.max_y < min(start.y, end.y))
+
+    def sweep(self, stop_x: Scalar) -> Iterable[Event]:
+        events = self.events
+        starts = events.starts
+        sweep_line = to_sweep_line(events, self.context)
+        queue, chains_tails = self._queue, self._chains_tails
+        start: Optional[Point] = starts[queue.peek()] if queue else None
         same_start_events: List[Event] = []
         while queue:
             event = queue.peek()
-            if event.start.x > stop_x:
+            if starts[event].x > stop_x:
                 # no intersection segments left
                 break
             queue.pop()
-            if event.start == start:
+            if event in chains_tails:
+                self._continue_chain(event)
+            if starts[event] == start:
                 same_start_events.append(event)
             else:
                 self.detect_crossing_angles(same_start_events)
-                yield from complete_events_relations(same_start_events)
-                same_start_events, start = [event], event.start
-            if event.is_left:
+                yield from complete_events_relations(events,
+                                                     same_start_events)
+                same_start_events, start = [event], starts[event]
+            if events.is_left(event):
                 sweep_line.add(event)
                 above_event, below_event = (sweep_line.above(event),
                                             sweep_line.below(event))
@@ -209,7 +421,7 @@ class LinearEventsQueue(EventsQueue):
                 if below_event is not None:
                     self.detect_intersection(below_event, event)
             else:
-                event = event.left
+                event = events.left(event)
                 if event in sweep_line:
                     above_event, below_event = (sweep_line.above(event),
                                                 sweep_line.below(event))
@@ -217,12 +429,14 @@ class LinearEventsQueue(EventsQueue):
                     if above_event is not None and below_event is not None:
                         self.detect_intersection(below_event, above_event)
         self.detect_crossing_angles(same_start_events)
-        yield from complete_events_relations(same_start_events)
+        yield from complete_events_relations(events, same_start_events)
 
     def detect_crossing_angles(self,
                                same_start_events: Sequence[Event]) -> None:
+        events = self.events
         if (len(same_start_events) < 4
-                or not (1 < sum(event.from_test for event in same_start_events)
+                or not (1 < sum(events.from_test(event)
+                                for event in same_start_events)
                         < len(same_start_events) - 1)):
             # for crossing angles there should be at least two pairs
             # of segments from different origins
@@ -230,75 +444,77 @@ class LinearEventsQueue(EventsQueue):
         from_test_events, from_goal_events = [], []
         for event in same_start_events:
             (from_test_events
-             if event.from_test
+             if events.from_test(event)
              else from_goal_events).append(event)
-        start = same_start_events[0].start
+        start = events.starts[same_start_events[0]]
         point_event_cosine = self._to_signed_point_event_squared_cosine
         base_event = min(from_goal_events,
                          key=partial(point_event_cosine,
-                                     from_goal_events[0].end))
-        base_end = base_event.end
+                                     events.end(from_goal_events[0])))
+        base_end = events.end(base_event)
         largest_angle_event = min(from_goal_events,
                                   key=partial(point_event_cosine, base_end))
-        largest_angle_end = largest_angle_event.end
-        base_orientation = self.context.angle_orientation(
+        largest_angle_end = events.end(largest_angle_event)
+        base_orientation = self.orienteer(
                 start, base_end, largest_angle_end
         )
-        if not all_equal(self._point_in_angle(test_event.end, start, base_end,
-                                              largest_angle_end,
+        if not all_equal(self._point_in_angle(events.end(test_event), start,
+                                              base_end, largest_angle_end,
                                               base_orientation)
                          for test_event in from_test_events):
+            relations = events.relations
             for event in same_start_events:
-                left_event = event if event.is_left else event.left
-                left_event.relation = max(left_event.relation,
-                                          SegmentsRelation.CROSS)
+                left_event = events.left(event)
+                relations[left_event] = max(relations[left_event],
+                                            SegmentsRelation.CROSS)
 
-    def detect_intersection(self,
-                            below_event: LinearEvent,
-                            event: LinearEvent) -> None:
+    def detect_intersection(self, below_event: Event, event: Event) -> None:
         """
         Populates events queue with intersection events.
         """
-        relation = self.context.segments_relation(below_event, event)
+        events = self.events
+        relation = self._relate_segments(below_event, event)
         if relation is Relation.TOUCH or relation is Relation.CROSS:
-            point = self.context.segments_intersection(below_event, event)
-            if point != below_event.start and point != below_event.end:
+            point = self._intersect_segments(below_event, event)
+            if (point != events.starts[below_event]
+                    and point != events.end(below_event)):
                 self._divide_segment(below_event, point)
-            if point != event.start and point != event.end:
+            if point != events.starts[event] and point != events.end(event):
                 self._divide_segment(event, point)
         elif relation is not Relation.DISJOINT:
             # segments overlap
-            if event.from_test is below_event.from_test:
+            if events.from_test(event) is events.from_test(below_event):
                 raise ValueError('Segments of the same geometry '
                                  'should not overlap.')
-            starts_equal = below_event.start == event.start
-            ends_equal = below_event.end == event.end
+            starts_equal = events.starts[below_event] == events.starts[event]
+            ends_equal = events.end(below_event) == events.end(event)
             start_min, start_max = (
                 (event, below_event)
                 if starts_equal or self.key(event) < self.key(below_event)
                 else (below_event, event)
             )
             end_min, end_max = (
-                (event.right, below_event.right)
-                if ends_equal or (self.key(event.right)
-                                  < self.key(below_event.right))
-                else (below_event.right, event.right)
+                (events.right(event), events.right(below_event))
+                if ends_equal or (self.key(events.right(event))
+                                  < self.key(events.right(below_event)))
+                else (events.right(below_event), events.right(event))
             )
             if starts_equal:
                 # both line segments are equal or share the left endpoint
                 if not ends_equal:
-                    self._divide_segment(end_max.left, end_min.start)
+                    self._divide_segment(events.left(end_max),
+                                         events.starts[end_min])
             elif ends_equal:
                 # the line segments share the right endpoint
-                self._divide_segment(start_min, start_max.start)
-            elif start_min is end_max.left:
+                self._divide_segment(start_min, events.starts[start_max])
+            elif start_min == events.left(end_max):
                 # one line segment includes the other one
-                self._divide_segment(start_min, end_min.start)
-                self._divide_segment(start_min, start_max.start)
+                self._divide_segment(start_min, events.starts[end_min])
+                self._divide_segment(start_min, events.starts[start_max])
             else:
                 # no line segment includes the other one
-                self._divide_segment(start_max, end_min.start)
-                self._divide_segment(start_min, start_max.start)
+                self._divide_segment(start_max, events.starts[end_min])
+                self._divide_segment(start_min, events.starts[start_max])
 
     def _point_in_angle(self,
                         point: Point,
@@ -306,10 +522,10 @@ class LinearEventsQueue(EventsQueue):
                         first_ray_point: Point,
                         second_ray_point: Point,
                         angle_orientation: Orientation) -> bool:
-        first_half_orientation = self.context.angle_orientation(
+        first_half_orientation = self.orienteer(
                 vertex, first_ray_point, point
         )
-        second_half_orientation = self.context.angle_orientation(
+        second_half_orientation = self.orienteer(
                 second_ray_point, vertex, point
         )
         return (second_half_orientation is angle_orientation
@@ -324,71 +540,84 @@ class LinearEventsQueue(EventsQueue):
     def _to_signed_point_event_squared_cosine(self,
                                               point: Point,
                                               event: Event) -> Scalar:
-        dot_product = self.context.dot_product(event.start, point, event.start,
-                                               event.end)
+        start, end = self.events.starts[event], self.events.end(event)
+        dot_product = self.context.dot_product(start, point, start, end)
         return ((2 * (dot_product > 0) - 1) * (dot_product * dot_product)
-                / self.context.points_squared_distance(event.start, event.end))
+                / self.context.points_squared_distance(start, end))
 
 
-class EventsQueueKey:
-    __slots__ = 'orienteer', 'event'
+EventsQueueKey = Tuple[Scalar, Scalar, bool, 'EventsTieBreaker']
 
-    def __init__(self, orienteer: Orienteer, event: Event) -> None:
-        self.orienteer, self.event = orienteer, event
+
+def to_events_queue_key(orienteer: Orienteer,
+                        events: EventsArena,
+                        event: Event) -> EventsQueueKey:
+    """
+    Returns key of the event in the events queue:
+    the event with lower x-coordinate is processed first,
+    then the event with lower y-coordinate,
+    then the right endpoint (since ``False < True``),
+    other ties are broken with orientation-based comparison.
+    """
+    start = events.starts[event]
+    return (start.x, start.y, events.is_left(event),
+            EventsTieBreaker(orienteer, events, event))
+
+
+class EventsTieBreaker:
+    """
+    Orders events which have the same start
+    and both are either left endpoints or right endpoints.
+    """
+    __slots__ = 'event', 'events', 'orienteer'
+
+    def __init__(self,
+                 orienteer: Orienteer,
+                 events: EventsArena,
+                 event: Event) -> None:
+        self.event, self.events, self.orienteer = event, events, orienteer
 
     __repr__ = generate_repr(__init__)
 
-    def __lt__(self, other: 'EventsQueueKey') -> bool:
-        event, other_event = self.event, other.event
-        start, other_start = event.start, other_event.start
-        if start.x != other_start.x:
-            # different x-coordinate,
-            # the event with lower x-coordinate is processed first
-            return start.x < other_start.x
-        elif start.y != other_start.y:
-            # different points, but same x-coordinate,
-            # the event with lower y-coordinate is processed first
-            return start.y < other_start.y
-        elif event.is_left is not other_event.is_left:
-            # same start, but one is a left endpoint
-            # and the other a right endpoint,
-            # the right endpoint is processed first
-            return other_event.is_left
-        # same start, both events are left endpoints
-        # or both are right endpoints
-        else:
-            other_end_orientation = self.orienteer(event.start, event.end,
-                                                   other_event.end)
-            return (other_event.from_test
-                    if other_end_orientation is Orientation.COLLINEAR
-                    else (other_end_orientation
-                          # the lowest segment is processed first
-                          is (Orientation.COUNTERCLOCKWISE
-                              if event.is_left
-                              else Orientation.CLOCKWISE)))
-
-
-def complete_events_relations(
-        same_start_events: Sequence[Event]
-) -> Iterable[Event]:
+    def __lt__(self, other: 'EventsTieBreaker') -> bool:
+        event, other_event, events = self.event, other.event, self.events
+        other_end_orientation = self.orienteer(events.starts[event],
+                                               events.end(event),
+                                               events.end(other_event))
+        return (events.from_test(other_event)
+                if other_end_orientation is Orientation.COLLINEAR
+                else (other_end_orientation
+                      # the lowest segment is processed first
+                      is (Orientation.COUNTERCLOCKWISE
+                          if events.is_left(event)
+                          else Orientation.CLOCKWISE)))
+
+
+def complete_events_relations(events: EventsArena,
+                              same_start_events: Sequence[Event]
+                              ) -> Iterable[Event]:
+    starts, original_starts, relations = (events.starts,
+                                          events.original_starts,
+                                          events.relations)
     for offset, first in enumerate(same_start_events,
                                    start=1):
-        first_left = first if first.is_left else first.left
+        first_left = events.left(first)
         for second_index in range(offset, len(same_start_events)):
             second = same_start_events[second_index]
-            second_left = second if second.is_left else second.left
-            if second_left.from_test is first_left.from_test:
+            second_left = events.left(second)
+            if events.from_test(second_left) is events.from_test(first_left):
                 continue
-            elif (first_left.start == second_left.start
-                  and first_left.end == second_left.end):
-                first_left.relation = second_left.relation = (
+            elif (starts[first_left] == starts[second_left]
+                  and events.end(first_left) == events.end(second_left)):
+                relations[first_left] = relations[second_left] = (
                     SegmentsRelation.OVERLAP
                 )
             else:
                 relation = (SegmentsRelation.TOUCH
-                            if (first.start == first.original_start
-                                or second.start == second.original_start)
+                            if (starts[first] == original_starts[first]
+                                or starts[second] == original_starts[second])
                             else SegmentsRelation.CROSS)
-                first_left.relation = max(first_left.relation, relation)
-                second_left.relation = max(second_left.relation, relation)
+                relations[first_left] = max(relations[first_left], relation)
+                relations[second_left] = max(relations[second_left],
+                                             relation)
         yield first_left
@@ -0,0 +1,220 @@
+from fractions import Fraction
+from typing import (Any,
+                    Optional,
+                    Tuple,
+                    Type)
+
+from ground.base import (Orientation,
+                         Relation)
+from ground.hints import Point
+from reprit.base import generate_repr
+
+from .event import (Event,
+                    EventsArena)
+from .hints import Orienteer
+
+Triple = Tuple[int, int, int]
+
+
+class HomogeneousPoint:
+    """
+    Point with rational coordinates represented by integer
+    homogeneous coordinates ``(scaled_x, scaled_y, scale)``
+    with positive scale,
+    its cartesian coordinates are computed only on demand.
+    """
+    __slots__ = 'scaled_x', 'scaled_y', 'scale', '_x', '_y'
+
+    def __init__(self, scaled_x: int, scaled_y: int, scale: int) -> None:
+        self.scaled_x, self.scaled_y, self.scale = scaled_x, scaled_y, scale
+        self._x: Optional[Fraction] = None
+        self._y: Optional[Fraction] = None
+
+    __repr__ = generate_repr(__init__)
+
+    @property
+    def x(self) -> Fraction:
+        if self._x is None:
+            self._x = Fraction(self.scaled_x, self.scale)
+        return self._x
+
+    @property
+    def y(self) -> Fraction:
+        if self._y is None:
+            self._y = Fraction(self.scaled_y, self.scale)
+        return self._y
+
+    def __eq__(self, other: Any) -> bool:
+        if not hasattr(other, 'x'):
+            return NotImplemented
+        other_x, other_y, other_scale = to_triple(other)
+        return (self.scaled_x * other_scale == other_x * self.scale
+                and self.scaled_y * other_scale == other_y * self.scale)
+
+    def __hash__(self) -> int:
+        return hash((self.x, self.y))
+
+    def __ge__(self, other: Point) -> bool:
+        return not self < other
+
+    def __gt__(self, other: Point) -> bool:
+        return compare(to_triple(other), to_triple(self)) < 0
+
+    def __le__(self, other: Point) -> bool:
+        return not other < self
+
+    def __lt__(self, other: Point) -> bool:
+        return compare(to_triple(self), to_triple(other)) < 0
+
+
+def compare(first: Triple, second: Triple) -> int:
+    """
+    Compares points given by homogeneous coordinates lexicographically,
+    returns negative number if the first point is less than the second one,
+    zero if they are equal and positive number otherwise.
+    """
+    first_x, first_y, first_scale = first
+    second_x, second_y, second_scale = second
+    return ((first_x * second_scale - second_x * first_scale)
+            or (first_y * second_scale - second_y * first_scale))
+
+
+def intersect_segments(events: EventsArena,
+                       first: Event,
+                       second: Event,
+                       point_cls: Type[Point]) -> Point:
+    """
+    Returns the single common point of left events' segments
+    with integer original endpoints.
+    """
+    first_start, first_end = events.starts[first], events.end(first)
+    second_start, second_end = events.starts[second], events.end(second)
+    first_line_start, first_line_end = (events.original_starts[first],
+                                        events.original_end(first))
+    second_line_start, second_line_end = (events.original_starts[second],
+                                          events.original_end(second))
+    first_dx, first_dy = (first_line_end.x - first_line_start.x,
+                          first_line_end.y - first_line_start.y)
+    second_dx, second_dy = (second_line_end.x - second_line_start.x,
+                            second_line_end.y - second_line_start.y)
+    scale = first_dx * second_dy - first_dy * second_dx
+    if not scale:
+        # segments are collinear and touch at the endpoint
+        return (first_start
+                if first_start == second_start or first_start == second_end
+                else first_end)
+    scale_numerator = ((second_line_start.x - first_line_start.x) * second_dy
+                       - (second_line_start.y - first_line_start.y)
+                       * second_dx)
+    scaled_x = first_line_start.x * scale + first_dx * scale_numerator
+    scaled_y = first_line_start.y * scale + first_dy * scale_numerator
+    if scale < 0:
+        scaled_x, scaled_y, scale = -scaled_x, -scaled_y, -scale
+    point = (point_cls(scaled_x // scale, scaled_y // scale)
+             if not (scaled_x % scale or scaled_y % scale)
+             else HomogeneousPoint(scaled_x, scaled_y, scale))
+    for endpoint in (first_start, first_end, second_start, second_end):
+        if endpoint == point:
+            return endpoint
+    return point
+
+
+def orientation(vertex: Point,
+                first_ray_point: Point,
+                second_ray_point: Point) -> Orientation:
+    vertex_x, vertex_y, vertex_scale = to_triple(vertex)
+    first_ray_point_x, first_ray_point_y, first_ray_point_scale = (
+        to_triple(first_ray_point)
+    )
+    second_ray_point_x, second_ray_point_y, second_ray_point_scale = (
+        to_triple(second_ray_point)
+    )
+    # scales are positive, so the sign of the determinant
+    # is the sign of the cartesian cross product
+    determinant = (vertex_x * (first_ray_point_y * second_ray_point_scale
+                               - first_ray_point_scale * second_ray_point_y)
+                   - vertex_y * (first_ray_point_x * second_ray_point_scale
+                                 - first_ray_point_scale * second_ray_point_x)
+                   + vertex_scale * (first_ray_point_x * second_ray_point_y
+                                     - first_ray_point_y * second_ray_point_x))
+    return (Orientation.COUNTERCLOCKWISE
+            if determinant > 0
+            else (Orientation.CLOCKWISE
+                  if determinant < 0
+                  else Orientation.COLLINEAR))
+
+
+def relate_segments(test_start: Point,
+                    test_end: Point,
+                    goal_start: Point,
+                    goal_end: Point,
+                    orienteer: Orienteer) -> Relation:
+    """
+    Returns relation between segments given by endpoints
+    which are either integer or homogeneous points.
+    """
+    if test_start > test_end:
+        test_start, test_end = test_end, test_start
+    if goal_start > goal_end:
+        goal_start, goal_end = goal_end, goal_start
+    starts_equal = test_start == goal_start
+    ends_equal = test_end == goal_end
+    if starts_equal and ends_equal:
+        return Relation.EQUAL
+    test_start_orientation = orienteer(goal_end, goal_start, test_start)
+    test_end_orientation = orienteer(goal_end, goal_start, test_end)
+    if (test_start_orientation
+            is not Orientation.COLLINEAR
+            is not test_end_orientation):
+        if test_start_orientation is test_end_orientation:
+            return Relation.DISJOINT
+        goal_start_orientation = orienteer(test_start, test_end, goal_start)
+        goal_end_orientation = orienteer(test_start, test_end, goal_end)
+        if (goal_start_orientation
+                is not Orientation.COLLINEAR
+                is not goal_end_orientation):
+            return (Relation.DISJOINT
+                    if goal_start_orientation is goal_end_orientation
+                    else Relation.CROSS)
+        elif goal_start_orientation is not Orientation.COLLINEAR:
+            return (Relation.TOUCH
+                    if test_start < goal_end < test_end
+                    else Relation.DISJOINT)
+        else:
+            return (Relation.TOUCH
+                    if test_start < goal_start < test_end
+                    else Relation.DISJOINT)
+    elif test_start_orientation is not Orientation.COLLINEAR:
+        return (Relation.TOUCH
+                if goal_start <= test_end <= goal_end
+                else Relation.DISJOINT)
+    elif test_end_orientation is not Orientation.COLLINEAR:
+        return (Relation.TOUCH
+                if goal_start <= test_start <= goal_end
+                else Relation.DISJOINT)
+    elif starts_equal:
+        return (Relation.COMPONENT
+                if test_end < goal_end
+                else Relation.COMPOSITE)
+    elif ends_equal:
+        return (Relation.COMPOSITE
+                if test_start < goal_start
+                else Relation.COMPONENT)
+    elif test_start == goal_end or test_end == goal_start:
+        return Relation.TOUCH
+    elif goal_start < test_start < goal_end:
+        return (Relation.COMPONENT
+                if test_end < goal_end
+                else Relation.OVERLAP)
+    elif test_start < goal_start < test_end:
+        return (Relation.COMPOSITE
+                if goal_end < test_end
+                else Relation.OVERLAP)
+    else:
+        return Relation.DISJOINT
+
+
+def to_triple(point: Point) -> Triple:
+    return ((point.scaled_x, point.scaled_y, point.scale)
+            if type(point) is HomogeneousPoint
+            else (point.x, point.y, 1))
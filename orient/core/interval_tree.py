@@ -0,0 +1,112 @@
+from typing import (List,
+                    Optional,
+                    Sequence,
+                    Tuple)
+
+from ground.hints import Scalar
+from reprit.base import generate_repr
+
+Interval = Tuple[Scalar, Scalar]
+
+
+class Node:
+    __slots__ = 'center', 'by_highs', 'by_lows', 'left', 'right'
+
+    def __init__(self,
+                 center: Scalar,
+                 by_lows: List[Tuple[Scalar, int]],
+                 by_highs: List[Tuple[Scalar, int]],
+                 left: Optional['Node'],
+                 right: Optional['Node']) -> None:
+        self.center, self.by_highs, self.by_lows, self.left, self.right = (
+            center, by_highs, by_lows, left, right
+        )
+
+    __repr__ = generate_repr(__init__)
+
+
+class IntervalTree:
+    """
+    Centered interval tree over closed intervals,
+    reports indices of intervals containing given value
+    or intersecting given interval.
+    """
+
+    __slots__ = 'root',
+
+    def __init__(self, intervals: Sequence[Interval]) -> None:
+        self.root = _create_node([(low, high, index)
+                                  for index, (low, high)
+                                  in enumerate(intervals)])
+
+    __repr__ = generate_repr(__init__)
+
+    def find_containing(self, value: Scalar) -> List[int]:
+        result = []
+        node = self.root
+        while node is not None:
+            if value < node.center:
+                for low, index in node.by_lows:
+                    if value < low:
+                        break
+                    result.append(index)
+                node = node.left
+            elif node.center < value:
+                for high, index in node.by_highs:
+                    if high < value:
+                        break
+                    result.append(index)
+                node = node.right
+            else:
+                result.extend(index for _, index in node.by_lows)
+                break
+        return result
+
+    def find_intersecting(self, low: Scalar, high: Scalar) -> List[int]:
+        result = []
+        queue = [self.root]
+        while queue:
+            node = queue.pop()
+            if node is None:
+                continue
+            elif high < node.center:
+                for interval_low, index in node.by_lows:
+                    if high < interval_low:
+                        break
+                    result.append(index)
+                queue.append(node.left)
+            elif node.center < low:
+                for interval_high, index in node.by_highs:
+                    if interval_high < low:
+                        break
+                    result.append(index)
+                queue.append(node.right)
+            else:
+                result.extend(index for _, index in node.by_lows)
+                queue += (node.left, node.right)
+        return result
+
+
+def _create_node(intervals: List[Tuple[Scalar, Scalar, int]]
+                 ) -> Optional[Node]:
+    if not intervals:
+        return None
+    endpoints = sorted([endpoint
+                        for low, high, _ in intervals
+                        for endpoint in (low, high)])
+    center = endpoints[len(endpoints) // 2]
+    left_intervals, middle_intervals, right_intervals = [], [], []
+    for interval in intervals:
+        low, high, _ = interval
+        if high < center:
+            left_intervals.append(interval)
+        elif center < low:
+            right_intervals.append(interval)
+        else:
+            middle_intervals.append(interval)
+    return Node(center,
+                sorted([(low, index) for low, _, index in middle_intervals]),
+                sorted([(high, index) for _, high, index in middle_intervals],
+                       reverse=True),
+                _create_node(left_intervals),
+                _create_node(right_intervals))
@@ -0,0 +1,168 @@
+from typing import (Any,
+                    Callable,
+                    Dict,
+                    Iterable,
+                    Iterator,
+                    Sequence,
+                    Tuple)
+
+from ground.base import (Context,
+                         Relation)
+from ground.hints import Box
+
+from . import (contour,
+               multipolygon,
+               multisegment,
+               polygon,
+               region,
+               segment)
+from .enums import GeometryKind
+from .prepared import (PreparedMultipolygon,
+                       PreparedPolygon,
+                       PreparedRegion,
+                       to_multipolygon_box,
+                       to_polygon_box,
+                       to_region_box)
+from .r_tree import RTree
+
+Relater = Callable[[Any, Any, Context], Relation]
+RELATERS: Dict[GeometryKind, Dict[GeometryKind, Relater]] = {
+    GeometryKind.SEGMENT: {
+        GeometryKind.SEGMENT: segment.relate_segment
+    },
+    GeometryKind.MULTISEGMENT: {
+        GeometryKind.SEGMENT: multisegment.relate_segment,
+        GeometryKind.MULTISEGMENT: multisegment.relate_multisegment
+    },
+    GeometryKind.CONTOUR: {
+        GeometryKind.SEGMENT: contour.relate_segment,
+        GeometryKind.MULTISEGMENT: contour.relate_multisegment,
+        GeometryKind.CONTOUR: contour.relate_contour
+    },
+    GeometryKind.REGION: {
+        GeometryKind.SEGMENT: region.relate_segment,
+        GeometryKind.MULTISEGMENT: region.relate_multisegment,
+        GeometryKind.CONTOUR: region.relate_contour,
+        GeometryKind.REGION: region.relate_region
+    },
+    GeometryKind.POLYGON: {
+        GeometryKind.SEGMENT: polygon.relate_segment,
+        GeometryKind.MULTISEGMENT: polygon.relate_multisegment,
+        GeometryKind.CONTOUR: polygon.relate_contour,
+        GeometryKind.REGION: polygon.relate_region,
+        GeometryKind.POLYGON: polygon.relate_polygon
+    },
+    GeometryKind.MULTIPOLYGON: {
+        GeometryKind.SEGMENT: multipolygon.relate_segment,
+        GeometryKind.MULTISEGMENT: multipolygon.relate_multisegment,
+        GeometryKind.CONTOUR: multipolygon.relate_contour,
+        GeometryKind.REGION: multipolygon.relate_region,
+        GeometryKind.POLYGON: multipolygon.relate_polygon,
+        GeometryKind.MULTIPOLYGON: multipolygon.relate_multipolygon
+    }
+}
+
+
+def relate_pairs(tests: Iterable[Any],
+                 goals: Sequence[Any],
+                 skip_disjoint: bool,
+                 context: Context) -> Iterator[Tuple[int, int, Relation]]:
+    goals_kinds = [to_kind(goal) for goal in goals]
+    raw_goals = [to_raw(goal) for goal in goals]
+    # goals are queried repeatedly, so their derived structures are cached
+    goals = [to_prepared(goal, kind, context)
+             for goal, kind in zip(goals, goals_kinds)]
+    goals_tree = RTree([to_box(goal, kind, context)
+                        for goal, kind in zip(goals, goals_kinds)],
+                       context)
+    for test_index, test in enumerate(tests):
+        test_kind = to_kind(test)
+        test = to_raw(test)
+        candidates_indices = goals_tree.find_intersecting(
+                to_box(test, test_kind, context)
+        )
+        if skip_disjoint:
+            for goal_index in candidates_indices:
+                relation = relate(goals[goal_index], raw_goals[goal_index],
+                                  goals_kinds[goal_index], test, test_kind,
+                                  context)
+                if relation is not Relation.DISJOINT:
+                    yield test_index, goal_index, relation
+        else:
+            candidates_indices = iter(candidates_indices)
+            candidate_index = next(candidates_indices, None)
+            for goal_index in range(len(goals)):
+                if goal_index == candidate_index:
+                    yield test_index, goal_index, relate(
+                            goals[goal_index], raw_goals[goal_index],
+                            goals_kinds[goal_index], test, test_kind, context
+                    )
+                    candidate_index = next(candidates_indices, None)
+                else:
+                    yield test_index, goal_index, Relation.DISJOINT
+
+
+def relate(goal: Any,
+           raw_goal: Any,
+           goal_kind: GeometryKind,
+           test: Any,
+           test_kind: GeometryKind,
+           context: Context) -> Relation:
+    return (RELATERS[goal_kind][test_kind](goal, test, context)
+            if test_kind <= goal_kind
+            else RELATERS[test_kind][goal_kind](test, raw_goal,
+                                                context).complement)
+
+
+def to_box(geometry: Any, kind: GeometryKind, context: Context) -> Box:
+    if kind is GeometryKind.SEGMENT:
+        return context.segment_box(geometry)
+    elif kind is GeometryKind.MULTISEGMENT:
+        return context.segments_box(geometry.segments)
+    elif kind is GeometryKind.MULTIPOLYGON:
+        return to_multipolygon_box(geometry, context)
+    elif kind is GeometryKind.POLYGON:
+        return to_polygon_box(geometry, context)
+    else:
+        return to_region_box(geometry, context)
+
+
+def to_kind(geometry: Any) -> GeometryKind:
+    if isinstance(geometry, PreparedRegion):
+        return GeometryKind.REGION
+    elif hasattr(geometry, 'polygons'):
+        return GeometryKind.MULTIPOLYGON
+    elif hasattr(geometry, 'border'):
+        return GeometryKind.POLYGON
+    elif hasattr(geometry, 'vertices'):
+        return GeometryKind.CONTOUR
+    elif hasattr(geometry, 'segments'):
+        return GeometryKind.MULTISEGMENT
+    elif hasattr(geometry, 'start'):
+        return GeometryKind.SEGMENT
+    raise TypeError('Expected segment, multisegment, contour, '
+                    'prepared region, polygon or multipolygon, '
+                    'but got {!r}.'.format(geometry))
+
+
+def to_prepared(geometry: Any, kind: GeometryKind, context: Context) -> Any:
+    if isinstance(geometry, (PreparedMultipolygon, PreparedPolygon,
+                             PreparedRegion)):
+        return geometry
+    elif kind is GeometryKind.MULTIPOLYGON:
+        return PreparedMultipolygon(geometry, context)
+    elif kind is GeometryKind.POLYGON:
+        return PreparedPolygon(geometry, context)
+    else:
+        return geometry
+
+
+def to_raw(geometry: Any) -> Any:
+    if isinstance(geometry, PreparedMultipolygon):
+        return geometry.multipolygon
+    elif isinstance(geometry, PreparedPolygon):
+        return geometry.polygon
+    elif isinstance(geometry, PreparedRegion):
+        return geometry.region
+    else:
+        return geometry
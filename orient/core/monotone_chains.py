@@ -0,0 +1,40 @@
+from contextvars import ContextVar
+from typing import (Iterable,
+                    List)
+
+from .hints import SegmentEndpoints
+
+# whether consecutive edges are registered in the events queue
+# as monotone chains advancing edge by edge
+monotone_chains = ContextVar('monotone_chains', default=False)
+
+MonotoneChain = List[SegmentEndpoints]
+
+
+def to_monotone_chains(segments_endpoints: Iterable[SegmentEndpoints]
+                       ) -> List[MonotoneChain]:
+    """
+    Splits sequence of segments into maximal chains of consecutive segments
+    which are monotone in the sweep order,
+    i.e. the left endpoint of each segment of the chain
+    is the right endpoint of the previous one.
+
+    Segments of chains keep their orientation,
+    chains are ordered as they are swept.
+    """
+    result = []
+    chain: MonotoneChain = []
+    previous_end = previous_is_forward = None
+    for start, end in segments_endpoints:
+        is_forward = start < end
+        if not (chain
+                and start == previous_end
+                and is_forward is previous_is_forward):
+            if chain:
+                result.append(chain if previous_is_forward else chain[::-1])
+            chain = []
+        chain.append((start, end))
+        previous_end, previous_is_forward = end, is_forward
+    if chain:
+        result.append(chain if previous_is_forward else chain[::-1])
+    return result
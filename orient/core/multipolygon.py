@@ -1,13 +1,19 @@
-from typing import Iterable
+from typing import (Iterable,
+                    List,
+                    Optional,
+                    Sequence,
+                    Tuple)
 
 from ground.base import (Context,
                          Location,
                          Relation)
-from ground.hints import (Contour,
+from ground.hints import (Box,
+                          Contour,
                           Multipolygon,
                           Multisegment,
                           Point,
                           Polygon,
+                          Scalar,
                           Segment)
 
 from . import box
@@ -17,11 +23,16 @@ from .hints import (Multiregion,
                     Region,
                     SegmentEndpoints)
 from .multiregion import (to_oriented_edges_endpoints
-                          as multiregion_to_oriented_segments)
+                          as multiregion_to_oriented_segments,
+                          unite_segment_relations)
 from .multisegment import to_segments_endpoints
 from .polygon import (locate_point as locate_point_in_polygon,
+                      relate_segment as relate_segment_to_polygon,
                       to_oriented_edges_endpoints
                       as polygon_to_oriented_segments)
+from .prepared import (PreparedMultipolygon,
+                       to_multipolygon_box,
+                       to_polygon_box)
 from .processing import (process_compound_queue,
                          process_linear_compound_queue)
 from .region import to_oriented_segments as region_to_oriented_segments
@@ -30,109 +41,103 @@ from .region import to_oriented_segments as region_to_oriented_segments
 def locate_point(multipolygon: Multipolygon,
                  point: Point,
                  context: Context) -> Location:
-    for polygon in multipolygon.polygons:
+    _, location = _locate_point(multipolygon, point, context)
+    return location
+
+
+def _locate_point(multipolygon: Multipolygon,
+                  point: Point,
+                  context: Context) -> Tuple[Optional[int], Location]:
+    if isinstance(multipolygon, PreparedMultipolygon):
+        return multipolygon.trapezoidal_map.locate(point)
+    for index, polygon in enumerate(multipolygon.polygons):
         location_in_polygon = locate_point_in_polygon(polygon, point, context)
         if location_in_polygon is not Location.EXTERIOR:
-            return location_in_polygon
-    return Location.EXTERIOR
+            return index, location_in_polygon
+    return None, Location.EXTERIOR
 
 
 def relate_segment(multipolygon: Multipolygon,
                    segment: Segment,
                    context: Context) -> Relation:
-    return relate_multisegment(multipolygon,
-                               context.multisegment_cls([segment]), context)
+    result = unite_segment_relations(
+            relate_segment_to_polygon(polygon, segment, context)
+            for polygon, _ in to_boxed_polygons_not_disjoint_with(
+                    multipolygon, context.segment_box(segment), context
+            )
+    )
+    return (relate_multisegment(multipolygon,
+                                context.multisegment_cls([segment]), context)
+            if result is None
+            else result)
 
 
 def relate_multisegment(multipolygon: Multipolygon,
                         multisegment: Multisegment,
                         context: Context) -> Relation:
     multisegment_bounding_box = context.segments_box(multisegment.segments)
-    disjoint, multipolygon_max_x, events_queue = True, None, None
-    for polygon in multipolygon.polygons:
-        polygon_bounding_box = context.polygon_box(polygon)
-        if not box.disjoint_with(polygon_bounding_box,
-                                 multisegment_bounding_box):
-            if disjoint:
-                disjoint = False
-                multipolygon_max_x = polygon_bounding_box.max_x
-                events_queue = CompoundEventsQueue(context)
-                events_queue.register(to_segments_endpoints(multisegment),
-                                      from_test=True)
-            else:
-                multipolygon_max_x = max(multipolygon_max_x,
-                                         polygon_bounding_box.max_x)
-            events_queue.register(polygon_to_oriented_segments(polygon,
-                                                               context),
-                                  from_test=False)
-    return (Relation.DISJOINT
-            if disjoint
-            else
-            process_linear_compound_queue(events_queue,
-                                          min(multisegment_bounding_box.max_x,
-                                              multipolygon_max_x)))
+    boxed_polygons = to_boxed_polygons_not_disjoint_with(
+            multipolygon, multisegment_bounding_box, context
+    )
+    if not boxed_polygons:
+        return Relation.DISJOINT
+    events_queue = CompoundEventsQueue(context)
+    events_queue.register(to_segments_endpoints(multisegment),
+                          from_test=True)
+    for polygon, _ in boxed_polygons:
+        events_queue.register(polygon_to_oriented_segments(polygon, context),
+                              from_test=False,
+                              window=multisegment_bounding_box)
+    return process_linear_compound_queue(
+            events_queue, min(multisegment_bounding_box.max_x,
+                              to_boxed_polygons_max_x(boxed_polygons))
+    )
 
 
 def relate_contour(multipolygon: Multipolygon,
                    contour: Contour,
                    context: Context) -> Relation:
     contour_bounding_box = context.contour_box(contour)
-    disjoint, multipolygon_max_x, events_queue = True, None, None
-    for polygon in multipolygon.polygons:
-        polygon_bounding_box = context.polygon_box(polygon)
-        if not box.disjoint_with(polygon_bounding_box, contour_bounding_box):
-            if disjoint:
-                disjoint = False
-                multipolygon_max_x = polygon_bounding_box.max_x
-                events_queue = CompoundEventsQueue(context)
-                events_queue.register(contour_to_edges_endpoints(contour),
-                                      from_test=True)
-            else:
-                multipolygon_max_x = max(multipolygon_max_x,
-                                         polygon_bounding_box.max_x)
-            events_queue.register(polygon_to_oriented_segments(polygon,
-                                                               context),
-                                  from_test=False)
-    return (Relation.DISJOINT
-            if disjoint
-            else process_linear_compound_queue(events_queue,
-                                               min(contour_bounding_box.max_x,
-                                                   multipolygon_max_x)))
+    boxed_polygons = to_boxed_polygons_not_disjoint_with(
+            multipolygon, contour_bounding_box, context
+    )
+    if not boxed_polygons:
+        return Relation.DISJOINT
+    events_queue = CompoundEventsQueue(context)
+    events_queue.register(contour_to_edges_endpoints(contour),
+                          from_test=True)
+    for polygon, _ in boxed_polygons:
+        events_queue.register(polygon_to_oriented_segments(polygon, context),
+                              from_test=False,
+                              window=contour_bounding_box)
+    return process_linear_compound_queue(
+            events_queue, min(contour_bounding_box.max_x,
+                              to_boxed_polygons_max_x(boxed_polygons))
+    )
 
 
 def relate_region(multipolygon: Multipolygon,
                   region: Region,
                   context: Context) -> Relation:
     region_bounding_box = context.contour_box(region)
-    all_disjoint, none_disjoint, multipolygon_max_x, events_queue = (
-        True, True, None, None
+    boxed_polygons = to_boxed_polygons_not_disjoint_with(
+            multipolygon, region_bounding_box, context
     )
-    for polygon in multipolygon.polygons:
-        polygon_bounding_box = context.polygon_box(polygon)
-        if box.disjoint_with(region_bounding_box, polygon_bounding_box):
-            if none_disjoint:
-                none_disjoint = False
-        else:
-            if all_disjoint:
-                all_disjoint = False
-                multipolygon_max_x = polygon_bounding_box.max_x
-                events_queue = CompoundEventsQueue(context)
-                events_queue.register(region_to_oriented_segments(region,
-                                                                  context),
-                                      from_test=True)
-            else:
-                multipolygon_max_x = max(multipolygon_max_x,
-                                         polygon_bounding_box.max_x)
-            events_queue.register(polygon_to_oriented_segments(polygon,
-                                                               context),
-                                  from_test=False)
-    if all_disjoint:
+    if not boxed_polygons:
         return Relation.DISJOINT
-    relation = process_compound_queue(events_queue,
-                                      min(multipolygon_max_x,
-                                          region_bounding_box.max_x))
+    events_queue = CompoundEventsQueue(context)
+    events_queue.register(region_to_oriented_segments(region, context),
+                          from_test=True)
+    for polygon, _ in boxed_polygons:
+        events_queue.register(polygon_to_oriented_segments(polygon, context),
+                              from_test=False,
+                              window=region_bounding_box)
+    relation = process_compound_queue(
+            events_queue, min(to_boxed_polygons_max_x(boxed_polygons),
+                              region_bounding_box.max_x)
+    )
     return (relation
-            if none_disjoint
+            if len(boxed_polygons) == len(multipolygon.polygons)
             else (Relation.COMPONENT
                   if relation is Relation.EQUAL
                   else (Relation.OVERLAP
@@ -146,15 +151,17 @@ def relate_multiregion(multipolygon: Multipolygon,
                        multiregion: Multiregion,
                        context: Context) -> Relation:
     multiregion_bounding_box = context.contours_box(multiregion)
-    multipolygon_bounding_box = context.polygons_box(multipolygon.polygons)
+    multipolygon_bounding_box = to_multipolygon_box(multipolygon, context)
     if box.disjoint_with(multipolygon_bounding_box, multiregion_bounding_box):
         return Relation.DISJOINT
     events_queue = CompoundEventsQueue(context)
     events_queue.register(to_oriented_segments(multipolygon, context),
-                          from_test=False)
+                          from_test=False,
+                          window=multiregion_bounding_box)
     events_queue.register(multiregion_to_oriented_segments(multiregion,
                                                            context),
-                          from_test=True)
+                          from_test=True,
+                          window=multipolygon_bounding_box)
     return process_compound_queue(events_queue,
                                   min(multipolygon_bounding_box.max_x,
                                       multiregion_bounding_box.max_x))
@@ -163,36 +170,26 @@ def relate_multiregion(multipolygon: Multipolygon,
 def relate_polygon(multipolygon: Multipolygon,
                    polygon: Polygon,
                    context: Context) -> Relation:
-    polygon_bounding_box = context.polygon_box(polygon)
-    all_disjoint, none_disjoint, multipolygon_max_x, events_queue = (
-        True, True, None, None
+    polygon_bounding_box = to_polygon_box(polygon, context)
+    boxed_polygons = to_boxed_polygons_not_disjoint_with(
+            multipolygon, polygon_bounding_box, context
     )
-    for sub_polygon in multipolygon.polygons:
-        sub_polygon_bounding_box = context.polygon_box(sub_polygon)
-        if box.disjoint_with(sub_polygon_bounding_box, polygon_bounding_box):
-            if none_disjoint:
-                none_disjoint = False
-        else:
-            if all_disjoint:
-                all_disjoint = False
-                multipolygon_max_x = sub_polygon_bounding_box.max_x
-                events_queue = CompoundEventsQueue(context)
-                events_queue.register(polygon_to_oriented_segments(polygon,
-                                                                   context),
-                                      from_test=True)
-            else:
-                multipolygon_max_x = max(multipolygon_max_x,
-                                         sub_polygon_bounding_box.max_x)
-            events_queue.register(polygon_to_oriented_segments(sub_polygon,
-                                                               context),
-                                  from_test=False)
-    if all_disjoint:
+    if not boxed_polygons:
         return Relation.DISJOINT
-    relation = process_compound_queue(events_queue,
-                                      min(multipolygon_max_x,
-                                          polygon_bounding_box.max_x))
+    events_queue = CompoundEventsQueue(context)
+    events_queue.register(polygon_to_oriented_segments(polygon, context),
+                          from_test=True)
+    for sub_polygon, _ in boxed_polygons:
+        events_queue.register(polygon_to_oriented_segments(sub_polygon,
+                                                           context),
+                              from_test=False,
+                              window=polygon_bounding_box)
+    relation = process_compound_queue(
+            events_queue, min(to_boxed_polygons_max_x(boxed_polygons),
+                              polygon_bounding_box.max_x)
+    )
     return (relation
-            if none_disjoint
+            if len(boxed_polygons) == len(multipolygon.polygons)
             else (Relation.COMPONENT
                   if relation is Relation.EQUAL
                   else (Relation.OVERLAP
@@ -205,13 +202,15 @@ def relate_polygon(multipolygon: Multipolygon,
 def relate_multipolygon(goal: Multipolygon,
                         test: Multipolygon,
                         context: Context) -> Relation:
-    goal_bounding_box = context.polygons_box(goal.polygons)
-    test_bounding_box = context.polygons_box(test.polygons)
+    goal_bounding_box = to_multipolygon_box(goal, context)
+    test_bounding_box = to_multipolygon_box(test, context)
     events_queue = CompoundEventsQueue(context)
     events_queue.register(to_oriented_segments(goal, context),
-                          from_test=False)
+                          from_test=False,
+                          window=test_bounding_box)
     events_queue.register(to_oriented_segments(test, context),
-                          from_test=True)
+                          from_test=True,
+                          window=goal_bounding_box)
     return process_compound_queue(events_queue,
                                   min(goal_bounding_box.max_x,
                                       test_bounding_box.max_x))
@@ -223,3 +222,25 @@ def to_oriented_segments(multipolygon: Multipolygon,
                          ) -> Iterable[SegmentEndpoints]:
     for polygon in multipolygon.polygons:
         yield from polygon_to_oriented_segments(polygon, context, clockwise)
+
+
+def to_boxed_polygons_max_x(boxed_polygons: Sequence[Tuple[Polygon, Box]]
+                            ) -> Scalar:
+    return max(polygon_box.max_x for _, polygon_box in boxed_polygons)
+
+
+def to_boxed_polygons_not_disjoint_with(multipolygon: Multipolygon,
+                                        bounding_box: Box,
+                                        context: Context
+                                        ) -> List[Tuple[Polygon, Box]]:
+    if isinstance(multipolygon, PreparedMultipolygon):
+        polygons = multipolygon.polygons
+        return [(polygons[index], polygons[index].box)
+                for index
+                in multipolygon.polygons_tree.find_intersecting(bounding_box)]
+    result = []
+    for polygon in multipolygon.polygons:
+        polygon_bounding_box = to_polygon_box(polygon, context)
+        if not box.disjoint_with(polygon_bounding_box, bounding_box):
+            result.append((polygon, polygon_bounding_box))
+    return result
@@ -1,4 +1,5 @@
-from typing import Iterable
+from typing import (Iterable,
+                    Optional)
 
 from ground.base import (Context,
                          Location, Relation)
@@ -15,9 +16,11 @@ from .hints import (Multiregion,
                     Region,
                     SegmentEndpoints)
 from .multisegment import to_segments_endpoints
+from .prepared import to_region_box
 from .processing import (process_compound_queue,
                          process_linear_compound_queue)
 from .region import (locate_point as locate_point_to_region,
+                     relate_segment as relate_segment_to_region,
                      to_oriented_segments as region_to_oriented_segments)
 
 
@@ -34,9 +37,47 @@ def locate_point(multiregion: Multiregion,
 def relate_segment(multiregion: Multiregion,
                    segment: Segment,
                    context: Context) -> Relation:
-    return _relate_multisegment(multiregion,
-                                context.multisegment_cls([segment]),
-                                context.segment_box(segment), context)
+    segment_bounding_box = context.segment_box(segment)
+    result = unite_segment_relations(
+            relate_segment_to_region(region, segment, context)
+            for region in multiregion
+            if not box.disjoint_with(to_region_box(region, context),
+                                     segment_bounding_box)
+    )
+    return (_relate_multisegment(multiregion,
+                                 context.multisegment_cls([segment]),
+                                 segment_bounding_box, context)
+            if result is None
+            else result)
+
+
+def unite_segment_relations(relations: Iterable[Relation]
+                            ) -> Optional[Relation]:
+    """
+    Returns relation of the segment with the union of shapes
+    with disjoint interiors given its relations with each of shapes
+    or ``None`` if it can not be decided without the sweep,
+    e.g. when the segment passes from one shape to another
+    through their common vertex.
+    """
+    result = Relation.DISJOINT
+    for relation in relations:
+        if relation is Relation.DISJOINT:
+            continue
+        elif relation is Relation.WITHIN:
+            return relation
+        elif result is Relation.DISJOINT:
+            result = relation
+        elif ((result is Relation.ENCLOSED and relation is Relation.TOUCH)
+              or (result is Relation.TOUCH
+                  and relation is Relation.ENCLOSED)):
+            # touches of other shapes are at the common vertices
+            result = Relation.ENCLOSED
+        else:
+            # e.g. touches of different shapes can form a component
+            # of the union's boundary
+            return None
+    return result
 
 
 def relate_multisegment(multiregion: Multiregion,
@@ -53,7 +94,7 @@ def _relate_multisegment(multiregion: Multiregion,
                          context: Context) -> Relation:
     disjoint, multiregion_max_x, events_queue = True, None, None
     for region in multiregion:
-        region_bounding_box = context.contour_box(region)
+        region_bounding_box = to_region_box(region, context)
         if not box.disjoint_with(region_bounding_box,
                                  multisegment_bounding_box):
             if disjoint:
@@ -66,7 +107,8 @@ def _relate_multisegment(multiregion: Multiregion,
                 multiregion_max_x = max(multiregion_max_x,
                                         region_bounding_box.max_x)
             events_queue.register(region_to_oriented_segments(region, context),
-                                  from_test=False)
+                                  from_test=False,
+                                  window=multisegment_bounding_box)
     return (Relation.DISJOINT
             if disjoint
             else
@@ -88,7 +130,7 @@ def _relate_contour(multiregion: Multiregion,
                     context: Context) -> Relation:
     disjoint, multiregion_max_x, events_queue = True, None, None
     for region in multiregion:
-        region_bounding_box = context.contour_box(region)
+        region_bounding_box = to_region_box(region, context)
         if not box.disjoint_with(region_bounding_box, contour_bounding_box):
             if disjoint:
                 disjoint = False
@@ -100,7 +142,8 @@ def _relate_contour(multiregion: Multiregion,
                 multiregion_max_x = max(multiregion_max_x,
                                         region_bounding_box.max_x)
             events_queue.register(region_to_oriented_segments(region, context),
-                                  from_test=False)
+                                  from_test=False,
+                                  window=contour_bounding_box)
     return (Relation.DISJOINT
             if disjoint
             else process_linear_compound_queue(events_queue,
@@ -123,7 +166,7 @@ def _relate_region(goal_regions: Iterable[Region],
         True, True, None, None
     )
     for goal_region in goal_regions:
-        goal_region_bounding_box = context.contour_box(goal_region)
+        goal_region_bounding_box = to_region_box(goal_region, context)
         if box.disjoint_with(region_bounding_box, goal_region_bounding_box):
             if none_disjoint:
                 none_disjoint = False
@@ -140,7 +183,8 @@ def _relate_region(goal_regions: Iterable[Region],
                                          goal_region_bounding_box.max_x)
             events_queue.register(region_to_oriented_segments(goal_region,
                                                               context),
-                                  from_test=False)
+                                  from_test=False,
+                                  window=region_bounding_box)
     if all_disjoint:
         return Relation.DISJOINT
     relation = process_compound_queue(events_queue,
@@ -166,9 +210,11 @@ def relate_multiregion(goal: Multiregion,
         return Relation.DISJOINT
     events_queue = CompoundEventsQueue(context)
     events_queue.register(to_oriented_edges_endpoints(goal, context),
-                          from_test=False)
+                          from_test=False,
+                          window=test_bounding_box)
     events_queue.register(to_oriented_edges_endpoints(test, context),
-                          from_test=True)
+                          from_test=True,
+                          window=goal_bounding_box)
     return process_compound_queue(events_queue, min(goal_bounding_box.max_x,
                                                     test_bounding_box.max_x))
 
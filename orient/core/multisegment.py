@@ -149,9 +149,11 @@ def relate_multisegment(goal: Multisegment, test: Multisegment,
         return Relation.DISJOINT
     events_queue = LinearEventsQueue(context)
     events_queue.register(to_segments_endpoints(goal),
-                          from_test=False)
+                          from_test=False,
+                          window=test_bounding_box)
     events_queue.register(to_segments_endpoints(test),
-                          from_test=True)
+                          from_test=True,
+                          window=goal_bounding_box)
     return process_open_linear_queue(events_queue,
                                      min(goal_bounding_box.max_x,
                                          test_bounding_box.max_x))
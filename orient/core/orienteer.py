@@ -0,0 +1,80 @@
+from ground.base import (Context,
+                         Mode,
+                         Orientation)
+from ground.hints import Point
+
+from .hints import Orienteer
+from .homogeneous import (HomogeneousPoint,
+                          orientation as homogeneous_orientation)
+
+# error bound coefficient of floating point orientation,
+# as in J. R. Shewchuk's "Adaptive Precision Floating-Point Arithmetic
+# and Fast Robust Geometric Predicates"
+ORIENTATION_ERROR_BOUND_COEFFICIENT = (3. + 16. * 2. ** -53) * 2. ** -53
+# absolute error bound covering possible underflows
+UNDERFLOW_ERROR_BOUND = 2. ** -1000
+
+
+def to_orienteer(context: Context) -> Orienteer:
+    """
+    Returns angle orientation function of the context
+    which gives the same results, but for exact mode
+    first tries to decide orientation of ``float`` coordinates
+    with plain floating point arithmetic
+    and computes orientation of ``int`` coordinates
+    and homogeneous points with plain integer arithmetic.
+    """
+    if context.mode is not Mode.EXACT:
+        return context.angle_orientation
+    exact_orienteer = context.angle_orientation
+
+    def orienteer(vertex: Point,
+                  first_ray_point: Point,
+                  second_ray_point: Point) -> Orientation:
+        vertex_x, vertex_y = vertex.x, vertex.y
+        first_ray_point_x, first_ray_point_y = (first_ray_point.x,
+                                                first_ray_point.y)
+        second_ray_point_x, second_ray_point_y = (second_ray_point.x,
+                                                  second_ray_point.y)
+        if (float is type(vertex_x) is type(vertex_y)
+                is type(first_ray_point_x) is type(first_ray_point_y)
+                is type(second_ray_point_x) is type(second_ray_point_y)):
+            first_dx, first_dy = (first_ray_point_x - vertex_x,
+                                  first_ray_point_y - vertex_y)
+            second_dx, second_dy = (second_ray_point_x - vertex_x,
+                                    second_ray_point_y - vertex_y)
+            if (not (first_dx and second_dy)
+                    and not (first_dy and second_dx)):
+                # differences of floats are zero only for equal floats,
+                # so both products are exactly zero
+                return Orientation.COLLINEAR
+            left_product = first_dx * second_dy
+            right_product = first_dy * second_dx
+            determinant = left_product - right_product
+            error_bound = (ORIENTATION_ERROR_BOUND_COEFFICIENT
+                           * (abs(left_product) + abs(right_product))
+                           + UNDERFLOW_ERROR_BOUND)
+            if determinant > error_bound:
+                return Orientation.COUNTERCLOCKWISE
+            elif -determinant > error_bound:
+                return Orientation.CLOCKWISE
+        elif (int is type(vertex_x) is type(vertex_y)
+              is type(first_ray_point_x) is type(first_ray_point_y)
+              is type(second_ray_point_x) is type(second_ray_point_y)):
+            determinant = ((first_ray_point_x - vertex_x)
+                           * (second_ray_point_y - vertex_y)
+                           - (first_ray_point_y - vertex_y)
+                           * (second_ray_point_x - vertex_x))
+            return (Orientation.COUNTERCLOCKWISE
+                    if determinant > 0
+                    else (Orientation.CLOCKWISE
+                          if determinant < 0
+                          else Orientation.COLLINEAR))
+        elif (type(vertex) is HomogeneousPoint
+              or type(first_ray_point) is HomogeneousPoint
+              or type(second_ray_point) is HomogeneousPoint):
+            return homogeneous_orientation(vertex, first_ray_point,
+                                           second_ray_point)
+        return exact_orienteer(vertex, first_ray_point, second_ray_point)
+
+    return orienteer
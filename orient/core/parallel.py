@@ -0,0 +1,190 @@
+from asyncio import (Semaphore,
+                     gather,
+                     get_running_loop)
+from concurrent.futures import (Executor,
+                                ProcessPoolExecutor,
+                                ThreadPoolExecutor)
+from contextvars import (ContextVar,
+                         copy_context)
+from functools import partial
+from itertools import chain
+from typing import (Any,
+                    Dict,
+                    Iterable,
+                    List,
+                    Optional,
+                    Sequence,
+                    Tuple)
+
+from ground.base import (Context,
+                         Relation)
+from reprit.base import generate_repr
+
+from .enums import GeometryKind
+from .join import (relate,
+                   to_kind,
+                   to_prepared,
+                   to_raw)
+from .monotone_chains import monotone_chains
+from .polygon import combined_sweep
+from .processing import gc_suspension
+from .sweep_line import sweep_line_kind
+
+# settings of sweeps which are propagated to workers
+SETTINGS: Tuple[ContextVar, ...] = (combined_sweep, gc_suspension,
+                                    monotone_chains, sweep_line_kind)
+
+KindedGeometry = Tuple[Any, GeometryKind]
+# test geometry with its kind & index of its goal
+Task = Tuple[Any, GeometryKind, int]
+
+
+class GoalsRelater:
+    """
+    Relates test geometries to goals
+    which are prepared once & referenced by indices.
+
+    Relating does not mutate shared state except for building
+    lazy indices of prepared goals, which are assigned only once built,
+    so relater can be used from concurrent threads.
+    """
+    __slots__ = 'context', 'goals', 'goals_kinds', 'raw_goals'
+
+    def __init__(self,
+                 raw_goals: Sequence[KindedGeometry],
+                 context: Context) -> None:
+        self.context = context
+        self.goals_kinds = [kind for _, kind in raw_goals]
+        self.raw_goals = [goal for goal, _ in raw_goals]
+        self.goals = [to_prepared(goal, kind, context)
+                      for goal, kind in raw_goals]
+
+    __repr__ = generate_repr(__init__)
+
+    def relate(self, task: Task) -> Relation:
+        test, test_kind, goal_index = task
+        return relate(self.goals[goal_index], self.raw_goals[goal_index],
+                      self.goals_kinds[goal_index], test, test_kind,
+                      self.context)
+
+    def relate_all(self, tasks: Iterable[Task]) -> List[Relation]:
+        return [self.relate(task) for task in tasks]
+
+
+# relater of the current worker process
+worker_relater: Optional[GoalsRelater] = None
+
+
+def initialize_worker(raw_goals: Sequence[KindedGeometry],
+                      settings_values: Sequence[Any],
+                      context: Context) -> None:
+    global worker_relater
+    for setting, value in zip(SETTINGS, settings_values):
+        setting.set(value)
+    worker_relater = GoalsRelater(raw_goals, context)
+
+
+def relate_chunk(tasks: Sequence[Task]) -> List[Relation]:
+    return worker_relater.relate_all(tasks)
+
+
+def relate_many(pairs: Iterable[Tuple[Any, Any]],
+                workers: int,
+                chunk_size: Optional[int],
+                context: Context) -> List[Relation]:
+    raw_goals, tasks = to_raw_goals_with_tasks(pairs)
+    if not tasks:
+        return []
+    elif workers == 1:
+        return GoalsRelater(raw_goals, context).relate_all(tasks)
+    chunks = to_chunks(tasks, workers, chunk_size)
+    with ProcessPoolExecutor(
+            min(workers, len(chunks)),
+            initializer=initialize_worker,
+            initargs=(raw_goals,
+                      [setting.get() for setting in SETTINGS],
+                      context)
+    ) as executor:
+        return list(chain.from_iterable(executor.map(relate_chunk, chunks)))
+
+
+def relate_many_in_threads(pairs: Iterable[Tuple[Any, Any]],
+                           workers: int,
+                           chunk_size: Optional[int],
+                           context: Context) -> List[Relation]:
+    raw_goals, tasks = to_raw_goals_with_tasks(pairs)
+    if not tasks:
+        return []
+    relater = GoalsRelater(raw_goals, context)
+    if workers == 1:
+        return relater.relate_all(tasks)
+    chunks = to_chunks(tasks, workers, chunk_size)
+    with ThreadPoolExecutor(min(workers, len(chunks))) as executor:
+        # each chunk runs in its own copy of the current context,
+        # so settings are propagated to threads of the pool
+        futures = [executor.submit(copy_context().run, relater.relate_all,
+                                   chunk)
+                   for chunk in chunks]
+        return list(chain.from_iterable(future.result()
+                                        for future in futures))
+
+
+async def relate_many_asynchronously(pairs: Iterable[Tuple[Any, Any]],
+                                     executor: Optional[Executor],
+                                     workers: int,
+                                     chunk_size: int,
+                                     context: Context) -> List[Relation]:
+    raw_goals, tasks = to_raw_goals_with_tasks(pairs)
+    if not tasks:
+        return []
+    relater = GoalsRelater(raw_goals, context)
+    loop = get_running_loop()
+    # at most ``workers`` chunks are submitted to the executor at once,
+    # so other jobs submitted meanwhile are queued
+    # behind the chunks in flight rather than behind the whole batch
+    window = Semaphore(workers)
+
+    async def relate_chunk_asynchronously(chunk: List[Task]
+                                          ) -> List[Relation]:
+        async with window:
+            # each chunk runs in its own copy of the current context,
+            # so settings are propagated to threads of the executor
+            return await loop.run_in_executor(
+                    executor, partial(copy_context().run, relater.relate_all,
+                                      chunk)
+            )
+
+    chunks_relations = await gather(*[
+        relate_chunk_asynchronously(chunk)
+        for chunk in to_chunks(tasks, 1, chunk_size)
+    ])
+    return list(chain.from_iterable(chunks_relations))
+
+
+def to_chunks(tasks: List[Task],
+              workers: int,
+              chunk_size: Optional[int]) -> List[List[Task]]:
+    if chunk_size is None:
+        # few chunks per worker balance the load
+        # without paying for dispatch of each task
+        chunk_size = -(-len(tasks) // (4 * workers))
+    return [tasks[offset:offset + chunk_size]
+            for offset in range(0, len(tasks), chunk_size)]
+
+
+def to_raw_goals_with_tasks(pairs: Iterable[Tuple[Any, Any]]
+                            ) -> Tuple[List[KindedGeometry], List[Task]]:
+    # goals are deduplicated by identity,
+    # so each one is shipped to workers & prepared only once,
+    # originals are kept alive to prevent reuse of their identifiers
+    goals: List[Any] = []
+    goals_indices: Dict[int, int] = {}
+    raw_goals, tasks = [], []
+    for test, goal in pairs:
+        goal_index = goals_indices.get(id(goal))
+        if goal_index is None:
+            goal_index = goals_indices[id(goal)] = len(goals)
+            goals.append(goal)
+            raw_goals.append((to_raw(goal), to_kind(goal)))
+        tasks.append((to_raw(test), to_kind(test), goal_index))
+    return raw_goals, tasks
@@ -1,14 +1,18 @@
-from typing import Iterable
+from contextvars import ContextVar
+from typing import (Iterable,
+                    Sequence)
 
 from ground.base import (Context,
                          Location, Relation)
-from ground.hints import (Contour,
+from ground.hints import (Box,
+                          Contour,
                           Multisegment,
                           Point,
                           Polygon,
                           Segment)
 
 from . import box
+from .contour import to_edges_endpoints as contour_to_edges_endpoints
 from .events_queue import CompoundEventsQueue
 from .hints import (Multiregion,
                     Region,
@@ -20,13 +24,21 @@ from .multiregion import (_relate_contour as relate_contour_to_multiregion,
                           to_oriented_edges_endpoints
                           as multiregion_to_oriented_segments)
 from .multisegment import to_segments_endpoints
-from .processing import process_linear_compound_queue
+from .prepared import (PreparedPolygon,
+                       to_polygon_box,
+                       to_region_box)
+from .processing import (process_compound_queue,
+                         process_linear_compound_queue)
 from .region import (_relate_contour as relate_contour_to_region,
                      _relate_region as relate_regions,
                      locate_point as locate_point_in_region,
                      relate_segment as relate_segment_to_region,
                      to_oriented_segments as region_to_oriented_segments)
 
+# whether polygons' borders and holes are related to other geometries
+# in a single sweep instead of separate passes over borders and holes
+combined_sweep = ContextVar('combined_sweep', default=False)
+
 
 def locate_point(polygon: Polygon,
                  point: Point,
@@ -34,7 +46,11 @@ def locate_point(polygon: Polygon,
     location_without_holes = locate_point_in_region(polygon.border, point,
                                                     context)
     if location_without_holes is Location.INTERIOR:
-        for hole in polygon.holes:
+        for hole in to_holes_not_disjoint_with(
+                polygon, context.box_cls(point.x, point.x, point.y, point.y)
+        ):
+            if not box.contains_point(to_region_box(hole, context), point):
+                continue
             location_in_hole = locate_point_in_region(hole, point, context)
             if location_in_hole is Location.INTERIOR:
                 return Location.EXTERIOR
@@ -50,8 +66,11 @@ def relate_segment(polygon: Polygon,
                                                       context)
     if (polygon.holes and (relation_without_holes is Relation.WITHIN
                            or relation_without_holes is Relation.ENCLOSED)):
-        relation_with_holes = relate_segment_to_multiregion(polygon.holes,
-                                                            segment, context)
+        relation_with_holes = relate_segment_to_multiregion(
+                to_holes_not_disjoint_with(polygon,
+                                           context.segment_box(segment)),
+                segment, context
+        )
         if relation_with_holes is Relation.DISJOINT:
             return relation_without_holes
         elif relation_with_holes is Relation.TOUCH:
@@ -69,24 +88,56 @@ def relate_segment(polygon: Polygon,
 def relate_multisegment(polygon: Polygon,
                         multisegment: Multisegment,
                         context: Context) -> Relation:
-    polygon_bounding_box = context.polygon_box(polygon)
-    multisegment_bounding_box = context.segments_box(multisegment.segments)
-    if box.disjoint_with(polygon_bounding_box, multisegment_bounding_box):
+    return _relate_linear(polygon, to_segments_endpoints(multisegment),
+                          context.segments_box(multisegment.segments),
+                          context)
+
+
+def _relate_linear(polygon: Polygon,
+                   segments_endpoints: Iterable[SegmentEndpoints],
+                   linear_bounding_box: Box,
+                   context: Context) -> Relation:
+    polygon_bounding_box = to_polygon_box(polygon, context)
+    if box.disjoint_with(polygon_bounding_box, linear_bounding_box):
         return Relation.DISJOINT
     events_queue = CompoundEventsQueue(context)
     events_queue.register(to_oriented_edges_endpoints(polygon, context),
-                          from_test=False)
-    events_queue.register(to_segments_endpoints(multisegment),
-                          from_test=True)
+                          from_test=False,
+                          window=linear_bounding_box)
+    events_queue.register(segments_endpoints,
+                          from_test=True,
+                          window=polygon_bounding_box)
     return process_linear_compound_queue(events_queue,
-                                         min(multisegment_bounding_box.max_x,
+                                         min(linear_bounding_box.max_x,
                                              polygon_bounding_box.max_x))
 
 
+def _relate_shaped(polygon: Polygon,
+                   oriented_segments_endpoints: Iterable[SegmentEndpoints],
+                   shaped_bounding_box: Box,
+                   context: Context) -> Relation:
+    polygon_bounding_box = to_polygon_box(polygon, context)
+    if box.disjoint_with(polygon_bounding_box, shaped_bounding_box):
+        return Relation.DISJOINT
+    events_queue = CompoundEventsQueue(context)
+    events_queue.register(to_oriented_edges_endpoints(polygon, context),
+                          from_test=False,
+                          window=shaped_bounding_box)
+    events_queue.register(oriented_segments_endpoints,
+                          from_test=True,
+                          window=polygon_bounding_box)
+    return process_compound_queue(events_queue,
+                                  min(shaped_bounding_box.max_x,
+                                      polygon_bounding_box.max_x))
+
+
 def relate_contour(polygon: Polygon,
                    contour: Contour,
                    context: Context) -> Relation:
     contour_bounding_box = context.contour_box(contour)
+    if combined_sweep.get():
+        return _relate_linear(polygon, contour_to_edges_endpoints(contour),
+                              contour_bounding_box, context)
     relation_without_holes = relate_contour_to_region(polygon.border, contour,
                                                       contour_bounding_box,
                                                       context)
@@ -94,7 +145,8 @@ def relate_contour(polygon: Polygon,
     if holes and (relation_without_holes is Relation.ENCLOSED
                   or relation_without_holes is Relation.WITHIN):
         relation_with_holes = relate_contour_to_multiregion(
-                holes, contour, contour_bounding_box, context
+                to_holes_not_disjoint_with(polygon, contour_bounding_box),
+                contour, contour_bounding_box, context
         )
         if relation_with_holes is Relation.DISJOINT:
             return relation_without_holes
@@ -116,9 +168,13 @@ def relate_region(polygon: Polygon,
                   region: Region,
                   context: Context) -> Relation:
     region_bounding_box = context.contour_box(region)
+    if combined_sweep.get():
+        return _relate_shaped(polygon,
+                              region_to_oriented_segments(region, context),
+                              region_bounding_box, context)
     border, holes = polygon.border, polygon.holes
     relation_with_border = relate_regions(border, region,
-                                          context.contour_box(border),
+                                          to_region_box(border, context),
                                           region_bounding_box, context)
     if relation_with_border in (Relation.DISJOINT,
                                 Relation.TOUCH,
@@ -132,9 +188,13 @@ def relate_region(polygon: Polygon,
                 if holes
                 else relation_with_border)
     else:
-        relation_with_holes = relate_region_to_regions(holes, region,
-                                                       region_bounding_box,
-                                                       context)
+        # skipping holes disjoint with the region can turn
+        # equal into component and cover/encloses/composite into overlap,
+        # which are classified the same below
+        relation_with_holes = relate_region_to_regions(
+                to_holes_not_disjoint_with(polygon, region_bounding_box),
+                region, region_bounding_box, context
+        )
         if relation_with_holes is Relation.DISJOINT:
             return relation_with_border
         elif relation_with_holes is Relation.TOUCH:
@@ -153,7 +213,7 @@ def relate_multiregion(polygon: Polygon,
                        multiregion: Multiregion,
                        context: Context) -> Relation:
     border, holes = polygon.border, polygon.holes
-    border_bounding_box = context.contour_box(border)
+    border_bounding_box = to_region_box(border, context)
     if not holes:
         return relate_region_to_regions(multiregion, border,
                                         border_bounding_box,
@@ -218,8 +278,11 @@ def relate_multiregion(polygon: Polygon,
 def relate_polygon(goal: Polygon,
                    test: Polygon,
                    context: Context) -> Relation:
-    goal_bounding_box, test_bounding_box = (context.polygon_box(goal),
-                                            context.polygon_box(test))
+    if combined_sweep.get():
+        return _relate_shaped(goal, to_oriented_edges_endpoints(test, context),
+                              to_polygon_box(test, context), context)
+    goal_bounding_box, test_bounding_box = (to_polygon_box(goal, context),
+                                            to_polygon_box(test, context))
     goal_border, goal_holes = goal.border, goal.holes
     test_border, test_holes = test.border, test.holes
     borders_relation = relate_regions(goal_border, test_border,
@@ -260,7 +323,7 @@ def relate_polygon(goal: Polygon,
             for hole_index, hole in enumerate(goal_holes):
                 hole_relation = relate_regions(test_border, hole,
                                                test_bounding_box,
-                                               context.contour_box(hole),
+                                               to_region_box(hole, context),
                                                context)
                 if hole_relation is Relation.TOUCH:
                     if none_touch:
@@ -313,7 +376,8 @@ def relate_polygon(goal: Polygon,
         for hole_index, hole in enumerate(test_holes):
             hole_relation = relate_regions(goal_border, hole,
                                            goal_bounding_box,
-                                           context.contour_box(hole), context)
+                                           to_region_box(hole, context),
+                                           context)
             if hole_relation is Relation.TOUCH:
                 if none_touch:
                     none_touch = False
@@ -368,3 +432,16 @@ def to_oriented_edges_endpoints(polygon: Polygon,
     yield from region_to_oriented_segments(polygon.border, context, clockwise)
     yield from multiregion_to_oriented_segments(polygon.holes, context,
                                                 not clockwise)
+
+
+def to_holes_not_disjoint_with(polygon: Polygon,
+                               bounding_box: Box) -> Sequence[Region]:
+    """
+    Returns holes of the polygon which may be not disjoint with the box,
+    prepared polygons are filtered with the index of holes boxes.
+    """
+    holes = polygon.holes
+    return ([holes[index]
+             for index in polygon.holes_tree.find_intersecting(bounding_box)]
+            if isinstance(polygon, PreparedPolygon)
+            else holes)
@@ -0,0 +1,142 @@
+from typing import (Any,
+                    FrozenSet,
+                    Iterable)
+
+from ground.base import (Context,
+                         Relation)
+
+from . import box
+from .contour import (equal as contours_equal,
+                      to_edges_endpoints as contour_to_edges_endpoints,
+                      to_oriented_edges_endpoints
+                      as contour_to_oriented_edges_endpoints)
+from .enums import GeometryKind
+from .events_queue import (CompoundEventsQueue,
+                           LinearEventsQueue)
+from .hints import SegmentEndpoints
+from .join import (to_box,
+                   to_kind)
+from .multipolygon import (to_oriented_segments
+                           as multipolygon_to_oriented_segments)
+from .multisegment import to_segments_endpoints
+from .polygon import (to_oriented_edges_endpoints
+                      as polygon_to_oriented_segments)
+from .prepared import to_region_oriented_edges_endpoints
+from .processing import (CLOSED_LINEAR_STATE,
+                         COMPOUND_STATE,
+                         LINEAR_COMPOUND_STATE,
+                         OPEN_LINEAR_STATE,
+                         sweep_closed_linear_queue,
+                         sweep_compound_queue,
+                         sweep_linear_compound_queue,
+                         sweep_open_linear_queue,
+                         to_closed_linear_relation,
+                         to_compound_relation,
+                         to_linear_compound_relation,
+                         to_open_linear_relation,
+                         to_stops)
+
+COVERING_RELATIONS = frozenset((Relation.EQUAL, Relation.COMPOSITE,
+                                Relation.ENCLOSES, Relation.COVER))
+DISJOINT_RELATIONS = frozenset((Relation.DISJOINT,))
+INTERSECTING_RELATIONS = frozenset(Relation) - DISJOINT_RELATIONS
+TOUCHING_RELATIONS = frozenset((Relation.TOUCH,))
+WITHIN_RELATIONS = frozenset((Relation.EQUAL, Relation.COMPONENT,
+                              Relation.ENCLOSED, Relation.WITHIN))
+
+
+def relation_in(goal: Any,
+                test: Any,
+                relations: FrozenSet[Relation],
+                context: Context) -> bool:
+    """
+    Checks if relation of test to goal is one of given relations
+    stopping the sweep as soon as the answer is decided.
+    """
+    goal_kind, test_kind = to_kind(goal), to_kind(test)
+    if is_linear(goal_kind) and not is_linear(test_kind):
+        goal, goal_kind, test, test_kind = test, test_kind, goal, goal_kind
+        relations = frozenset(relation.complement for relation in relations)
+    goal_box, test_box = (to_box(goal, goal_kind, context),
+                          to_box(test, test_kind, context))
+    if box.disjoint_with(goal_box, test_box):
+        return Relation.DISJOINT in relations
+    stop_x = min(goal_box.max_x, test_box.max_x)
+    if not is_linear(goal_kind):
+        events_queue = CompoundEventsQueue(context)
+        events_queue.register(to_oriented_segments(goal, goal_kind, context),
+                              from_test=False,
+                              window=test_box)
+        if is_linear(test_kind):
+            events_queue.register(to_segments(test, test_kind),
+                                  from_test=True,
+                                  window=goal_box)
+            classifier, initial_state, sweep = (
+                to_linear_compound_relation, LINEAR_COMPOUND_STATE,
+                sweep_linear_compound_queue
+            )
+        else:
+            events_queue.register(to_oriented_segments(test, test_kind,
+                                                       context),
+                                  from_test=True,
+                                  window=goal_box)
+            classifier, initial_state, sweep = (
+                to_compound_relation, COMPOUND_STATE, sweep_compound_queue
+            )
+    elif (goal_kind is GeometryKind.CONTOUR
+          and test_kind is GeometryKind.CONTOUR):
+        if contours_equal(goal, test, context):
+            return Relation.EQUAL in relations
+        events_queue = CompoundEventsQueue(context)
+        events_queue.register(contour_to_oriented_edges_endpoints(goal,
+                                                                  context),
+                              from_test=False,
+                              window=test_box)
+        events_queue.register(contour_to_oriented_edges_endpoints(test,
+                                                                  context),
+                              from_test=True,
+                              window=goal_box)
+        classifier, initial_state, sweep = (
+            to_closed_linear_relation, CLOSED_LINEAR_STATE,
+            sweep_closed_linear_queue
+        )
+    else:
+        events_queue = LinearEventsQueue(context)
+        events_queue.register(to_segments(goal, goal_kind),
+                              from_test=False,
+                              window=test_box)
+        events_queue.register(to_segments(test, test_kind),
+                              from_test=True,
+                              window=goal_box)
+        classifier, initial_state, sweep = (
+            to_open_linear_relation, OPEN_LINEAR_STATE,
+            sweep_open_linear_queue
+        )
+    state = sweep(events_queue, stop_x,
+                  to_stops(classifier, initial_state, relations))
+    return classifier(state) in relations
+
+
+def is_linear(kind: GeometryKind) -> bool:
+    return kind <= GeometryKind.CONTOUR
+
+
+def to_oriented_segments(geometry: Any,
+                         kind: GeometryKind,
+                         context: Context) -> Iterable[SegmentEndpoints]:
+    if kind is GeometryKind.MULTIPOLYGON:
+        return multipolygon_to_oriented_segments(geometry, context)
+    elif kind is GeometryKind.POLYGON:
+        return polygon_to_oriented_segments(geometry, context)
+    else:
+        return to_region_oriented_edges_endpoints(geometry, context)
+
+
+def to_segments(geometry: Any,
+                kind: GeometryKind) -> Iterable[SegmentEndpoints]:
+    if kind is GeometryKind.SEGMENT:
+        return [(geometry.start, geometry.end)]
+    elif kind is GeometryKind.MULTISEGMENT:
+        return to_segments_endpoints(geometry)
+    else:
+        return contour_to_edges_endpoints(geometry)
@@ -0,0 +1,163 @@
+from itertools import chain
+from typing import (Iterable,
+                    List,
+                    Sequence)
+
+from ground.base import (Context,
+                         Orientation)
+from ground.hints import (Box,
+                          Multipolygon,
+                          Point,
+                          Polygon,
+                          Segment)
+from reprit.base import generate_repr
+
+from .contour import (_to_oriented_edges_endpoints,
+                      orientation as contour_orientation)
+from .hints import (Region,
+                    SegmentEndpoints)
+from .interval_tree import IntervalTree
+from .r_tree import RTree
+from .trapezoidal_map import TrapezoidalMap
+from .utils import flatten
+
+
+class PreparedRegion:
+    __slots__ = ('box', 'context', 'edges', 'orientation', 'region',
+                 '_edges_index')
+
+    def __init__(self, region: Region, context: Context) -> None:
+        self.context, self.region = context, region
+        self.box = context.contour_box(region)
+        self.edges = context.contour_segments(region)
+        self.orientation = contour_orientation(region, context)
+        self._edges_index = None
+
+    __repr__ = generate_repr(__init__)
+
+    @property
+    def edges_index(self) -> IntervalTree:
+        """
+        Returns index of edges by their ``y``-coordinates ranges,
+        builds it on first access.
+        """
+        if self._edges_index is None:
+            self._edges_index = IntervalTree(
+                    [(edge.start.y, edge.end.y)
+                     if edge.start.y < edge.end.y
+                     else (edge.end.y, edge.start.y)
+                     for edge in self.edges]
+            )
+        return self._edges_index
+
+    @property
+    def vertices(self) -> Sequence[Point]:
+        return self.region.vertices
+
+
+class PreparedPolygon:
+    __slots__ = 'border', 'box', 'context', 'holes', 'polygon', '_holes_tree'
+
+    def __init__(self, polygon: Polygon, context: Context) -> None:
+        self.context, self.polygon = context, polygon
+        self.border = PreparedRegion(polygon.border, context)
+        self.holes = [PreparedRegion(hole, context) for hole in polygon.holes]
+        self.box = self.border.box
+        self._holes_tree = None
+
+    __repr__ = generate_repr(__init__)
+
+    @property
+    def holes_tree(self) -> RTree:
+        """
+        Returns R-tree of holes bounding boxes,
+        builds it on first access.
+        """
+        if self._holes_tree is None:
+            self._holes_tree = RTree([hole.box for hole in self.holes],
+                                     self.context)
+        return self._holes_tree
+
+
+class PreparedMultipolygon:
+    __slots__ = ('box', 'context', 'multipolygon', 'polygons',
+                 '_polygons_tree', '_trapezoidal_map')
+
+    def __init__(self, multipolygon: Multipolygon, context: Context) -> None:
+        self.context, self.multipolygon = context, multipolygon
+        self.polygons = [PreparedPolygon(polygon, context)
+                         for polygon in multipolygon.polygons]
+        self.box = context.polygons_box(multipolygon.polygons)
+        self._polygons_tree = self._trapezoidal_map = None
+
+    __repr__ = generate_repr(__init__)
+
+    @property
+    def polygons_tree(self) -> RTree:
+        """
+        Returns R-tree of polygons bounding boxes,
+        builds it on first access.
+        """
+        if self._polygons_tree is None:
+            self._polygons_tree = RTree([polygon.box
+                                         for polygon in self.polygons],
+                                        self.context)
+        return self._polygons_tree
+
+    @property
+    def trapezoidal_map(self) -> TrapezoidalMap:
+        """
+        Returns trapezoidal map of polygons edges,
+        builds it on first access.
+        """
+        if self._trapezoidal_map is None:
+            context = self.context
+            self._trapezoidal_map = TrapezoidalMap.from_polygons_edges(
+                    [chain(to_region_oriented_edges_endpoints(polygon.border,
+                                                              context),
+                           flatten(to_region_oriented_edges_endpoints(
+                                           hole, context, True
+                                   ) for hole in polygon.holes))
+                     for polygon in self.polygons],
+                    self.box, context
+            )
+        return self._trapezoidal_map
+
+
+def to_multipolygon_box(multipolygon: Multipolygon, context: Context) -> Box:
+    return (multipolygon.box
+            if isinstance(multipolygon, PreparedMultipolygon)
+            else context.polygons_box(multipolygon.polygons))
+
+
+def to_polygon_box(polygon: Polygon, context: Context) -> Box:
+    return (polygon.box
+            if isinstance(polygon, PreparedPolygon)
+            else context.polygon_box(polygon))
+
+
+def to_region_box(region: Region, context: Context) -> Box:
+    return (region.box
+            if isinstance(region, PreparedRegion)
+            else context.contour_box(region))
+
+
+def to_region_edges(region: Region, context: Context) -> List[Segment]:
+    return (region.edges
+            if isinstance(region, PreparedRegion)
+            else context.contour_segments(region))
+
+
+def to_region_orientation(region: Region, context: Context) -> Orientation:
+    return (region.orientation
+            if isinstance(region, PreparedRegion)
+            else contour_orientation(region, context))
+
+
+def to_region_oriented_edges_endpoints(region: Region,
+                                       context: Context,
+                                       clockwise: bool = False
+                                       ) -> Iterable[SegmentEndpoints]:
+    return _to_oriented_edges_endpoints(
+            region, to_region_orientation(region, context), clockwise
+    )
@@ -1,218 +1,400 @@
+import gc
+from contextvars import ContextVar
+from functools import (lru_cache,
+                       wraps)
+from threading import Lock
+from typing import (Any,
+                    Callable,
+                    FrozenSet,
+                    Sequence,
+                    TypeVar)
+
 from ground.base import Relation
 from ground.hints import Scalar
+from reprit.base import generate_repr
 
 from .enums import SegmentsRelation
 from .events_queue import (CompoundEventsQueue,
+                           EventsQueue,
                            LinearEventsQueue)
 
+# flags of sweep states, which once cleared never get set back,
+# so final relation is determined by the state after the sweep
+TEST_IS_SUBSET_OF_GOAL = 1 << 0
+GOAL_IS_SUBSET_OF_TEST = 1 << 1
+HAS_NO_CROSS = 1 << 2
+HAS_NO_TOUCH = 1 << 3
+HAS_NO_OVERLAP = 1 << 4
+TEST_BOUNDARY_NOT_IN_GOAL_INTERIOR = 1 << 5
+GOAL_BOUNDARY_NOT_IN_TEST_INTERIOR = 1 << 6
+TEST_NOT_IN_GOAL_INTERIOR = 1 << 7
+GOAL_BORDER_SUBSET_OF_TEST = 1 << 8
+BOUNDARIES_DO_NOT_INTERSECT = 1 << 9
+NONE_OVERLAPPING_COMPONENTS = 1 << 10
+STATES_COUNT = 1 << 11
+OPEN_LINEAR_STATE = (TEST_IS_SUBSET_OF_GOAL | GOAL_IS_SUBSET_OF_TEST
+                     | HAS_NO_CROSS | HAS_NO_TOUCH | HAS_NO_OVERLAP)
+CLOSED_LINEAR_STATE = (OPEN_LINEAR_STATE
+                       | TEST_BOUNDARY_NOT_IN_GOAL_INTERIOR
+                       | GOAL_BOUNDARY_NOT_IN_TEST_INTERIOR)
+LINEAR_COMPOUND_STATE = (TEST_NOT_IN_GOAL_INTERIOR | HAS_NO_TOUCH
+                         | TEST_IS_SUBSET_OF_GOAL
+                         | GOAL_BORDER_SUBSET_OF_TEST)
+COMPOUND_STATE = (TEST_BOUNDARY_NOT_IN_GOAL_INTERIOR
+                  | GOAL_BOUNDARY_NOT_IN_TEST_INTERIOR
+                  | BOUNDARIES_DO_NOT_INTERSECT
+                  | NONE_OVERLAPPING_COMPONENTS
+                  | TEST_IS_SUBSET_OF_GOAL | GOAL_IS_SUBSET_OF_TEST)
+# table of states at which sweep is never stopped
+NEVER_STOPS = (False,) * STATES_COUNT
+
+Classifier = Callable[[int], Relation]
+# whether garbage collection is suspended while sweeping
+gc_suspension = ContextVar('gc_suspension', default=False)
+
+
+class GCSuspender:
+    """
+    Disables garbage collection while any of guarded sweeps is running
+    and restores its previous state after the last one finishes.
+    """
+    __slots__ = '_lock', '_sweeps_count', '_was_enabled'
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._sweeps_count = 0
+        self._was_enabled = False
+
+    __repr__ = generate_repr(__init__)
+
+    def __enter__(self) -> None:
+        with self._lock:
+            if not self._sweeps_count:
+                self._was_enabled = gc.isenabled()
+                gc.disable()
+            self._sweeps_count += 1
+
+    def __exit__(self, *_: Any) -> None:
+        with self._lock:
+            self._sweeps_count -= 1
+            if not self._sweeps_count and self._was_enabled:
+                gc.enable()
+
+
+gc_suspender = GCSuspender()
+Sweep = TypeVar('Sweep',
+                bound=Callable[[EventsQueue, Scalar, Sequence[bool]], int])
+
+
+def suspending_gc(sweep: Sweep) -> Sweep:
+    """
+    Makes sweep run with suspended garbage collection
+    if suspension is enabled in the current context.
+    """
+
+    @wraps(sweep)
+    def wrapped(events_queue: EventsQueue,
+                stop_x: Scalar,
+                stops: Sequence[bool]) -> int:
+        if not gc_suspension.get():
+            return sweep(events_queue, stop_x, stops)
+        with gc_suspender:
+            return sweep(events_queue, stop_x, stops)
+
+    return wrapped
+
+
+def to_initial_state(events_queue: EventsQueue,
+                     state: int,
+                     goal_subset_flag: int) -> int:
+    """
+    Clears subset flags of geometries with segments
+    which were not registered since they lie outside of the window.
+    """
+    if events_queue.test_clipped:
+        state &= ~TEST_IS_SUBSET_OF_GOAL
+    if events_queue.goal_clipped:
+        state &= ~goal_subset_flag
+    return state
+
 
 def process_open_linear_queue(events_queue: LinearEventsQueue,
                               stop_x: Scalar) -> Relation:
-    test_is_subset = goal_is_subset = True
-    has_no_cross = has_no_touch = has_no_overlap = True
+    return to_open_linear_relation(
+            sweep_open_linear_queue(events_queue, stop_x, NEVER_STOPS)
+    )
+
+
+def process_closed_linear_queue(events_queue: CompoundEventsQueue,
+                                stop_x: Scalar) -> Relation:
+    return to_closed_linear_relation(
+            sweep_closed_linear_queue(events_queue, stop_x, NEVER_STOPS)
+    )
+
+
+def process_linear_compound_queue(events_queue: CompoundEventsQueue,
+                                  stop_x: Scalar) -> Relation:
+    return to_linear_compound_relation(
+            sweep_linear_compound_queue(events_queue, stop_x, NEVER_STOPS)
+    )
+
+
+def process_compound_queue(events_queue: CompoundEventsQueue,
+                           stop_x: Scalar) -> Relation:
+    return to_compound_relation(
+            sweep_compound_queue(events_queue, stop_x, NEVER_STOPS)
+    )
+
+
+@suspending_gc
+def sweep_open_linear_queue(events_queue: LinearEventsQueue,
+                            stop_x: Scalar,
+                            stops: Sequence[bool]) -> int:
+    state = to_initial_state(events_queue, OPEN_LINEAR_STATE,
+                             GOAL_IS_SUBSET_OF_TEST)
+    if stops[state]:
+        return state
+    events = events_queue.events
     for event in events_queue.sweep(stop_x):
-        if event.relation is SegmentsRelation.OVERLAP:
-            if has_no_overlap:
-                has_no_overlap = False
+        relation = events.relations[event]
+        if relation == SegmentsRelation.OVERLAP:
+            state &= ~HAS_NO_OVERLAP
         else:
-            if event.from_test:
-                if test_is_subset:
-                    test_is_subset = False
-            elif goal_is_subset:
-                goal_is_subset = False
-            if has_no_overlap:
-                if event.relation is SegmentsRelation.CROSS:
-                    if has_no_cross:
-                        has_no_cross = False
-                elif event.relation is SegmentsRelation.TOUCH:
-                    if has_no_touch:
-                        has_no_touch = False
+            state &= ~(TEST_IS_SUBSET_OF_GOAL
+                       if events.from_test(event)
+                       else GOAL_IS_SUBSET_OF_TEST)
+            if relation == SegmentsRelation.CROSS:
+                state &= ~HAS_NO_CROSS
+            elif relation == SegmentsRelation.TOUCH:
+                state &= ~HAS_NO_TOUCH
+        if stops[state]:
+            return state
     if events_queue:
-        if events_queue.peek().from_test:
-            test_is_subset = False
-        else:
-            goal_is_subset = False
-    if goal_is_subset:
+        state &= ~(TEST_IS_SUBSET_OF_GOAL
+                   if events.from_test(events_queue.peek())
+                   else GOAL_IS_SUBSET_OF_TEST)
+    return state
+
+
+def to_open_linear_relation(state: int) -> Relation:
+    if state & GOAL_IS_SUBSET_OF_TEST:
         return (Relation.EQUAL
-                if test_is_subset
+                if state & TEST_IS_SUBSET_OF_GOAL
                 else Relation.COMPOSITE)
-    elif test_is_subset:
+    elif state & TEST_IS_SUBSET_OF_GOAL:
         return Relation.COMPONENT
     else:
         return (((Relation.DISJOINT
-                  if has_no_touch
+                  if state & HAS_NO_TOUCH
                   else Relation.TOUCH)
-                 if has_no_cross
+                 if state & HAS_NO_CROSS
                  else Relation.CROSS)
-                if has_no_overlap
+                if state & HAS_NO_OVERLAP
                 else Relation.OVERLAP)
 
 
-def process_closed_linear_queue(events_queue: CompoundEventsQueue,
-                                stop_x: Scalar) -> Relation:
-    test_is_subset_of_goal = goal_is_subset_of_test = True
-    test_boundary_not_in_goal_interior = True
-    goal_boundary_not_in_test_interior = True
-    has_no_cross = has_no_touch = has_no_overlap = True
+@suspending_gc
+def sweep_closed_linear_queue(events_queue: CompoundEventsQueue,
+                              stop_x: Scalar,
+                              stops: Sequence[bool]) -> int:
+    state = to_initial_state(events_queue, CLOSED_LINEAR_STATE,
+                             GOAL_IS_SUBSET_OF_TEST)
+    if stops[state]:
+        return state
+    events = events_queue.events
     for event in events_queue.sweep(stop_x):
-        if (test_is_subset_of_goal
-                and event.from_test and event.outside):
-            test_is_subset_of_goal = False
-        if (goal_is_subset_of_test
-                and event.from_goal and event.outside):
-            goal_is_subset_of_test = False
-        if (test_boundary_not_in_goal_interior
-                and event.from_test and event.inside):
-            test_boundary_not_in_goal_interior = False
-        if (goal_boundary_not_in_test_interior
-                and event.from_goal and event.inside):
-            goal_boundary_not_in_test_interior = False
-        if has_no_cross and event.relation is SegmentsRelation.CROSS:
-            has_no_cross = False
-        if (has_no_overlap
-                and event.relation is SegmentsRelation.OVERLAP):
-            has_no_overlap = False
-        if has_no_touch and event.relation is SegmentsRelation.TOUCH:
-            has_no_touch = False
-    if events_queue:
-        if events_queue.peek().from_test:
-            test_is_subset_of_goal = False
+        if events.from_test(event):
+            if events.outside(event):
+                state &= ~TEST_IS_SUBSET_OF_GOAL
+            if events.inside(event):
+                state &= ~TEST_BOUNDARY_NOT_IN_GOAL_INTERIOR
         else:
-            goal_is_subset_of_test = False
-    if goal_is_subset_of_test:
+            if events.outside(event):
+                state &= ~GOAL_IS_SUBSET_OF_TEST
+            if events.inside(event):
+                state &= ~GOAL_BOUNDARY_NOT_IN_TEST_INTERIOR
+        relation = events.relations[event]
+        if relation == SegmentsRelation.CROSS:
+            state &= ~HAS_NO_CROSS
+        elif relation == SegmentsRelation.OVERLAP:
+            state &= ~HAS_NO_OVERLAP
+        elif relation == SegmentsRelation.TOUCH:
+            state &= ~HAS_NO_TOUCH
+        if stops[state]:
+            return state
+    if events_queue:
+        state &= ~(TEST_IS_SUBSET_OF_GOAL
+                   if events.from_test(events_queue.peek())
+                   else GOAL_IS_SUBSET_OF_TEST)
+    return state
+
+
+def to_closed_linear_relation(state: int) -> Relation:
+    disjoint_or_touch_or_overlap = ((Relation.DISJOINT
+                                     if state & HAS_NO_TOUCH
+                                     else Relation.TOUCH)
+                                    if state & HAS_NO_OVERLAP
+                                    else Relation.OVERLAP)
+    if state & GOAL_IS_SUBSET_OF_TEST:
         return (Relation.EQUAL
-                if test_is_subset_of_goal
+                if state & TEST_IS_SUBSET_OF_GOAL
                 else (Relation.COMPOSITE
-                      if goal_boundary_not_in_test_interior
-                      else ((Relation.DISJOINT
-                             if has_no_touch
-                             else Relation.TOUCH)
-                            if has_no_overlap
-                            else Relation.OVERLAP)))
-    elif test_is_subset_of_goal:
+                      if state & GOAL_BOUNDARY_NOT_IN_TEST_INTERIOR
+                      else disjoint_or_touch_or_overlap))
+    elif state & TEST_IS_SUBSET_OF_GOAL:
         return (Relation.COMPONENT
-                if test_boundary_not_in_goal_interior
-                else ((Relation.DISJOINT
-                       if has_no_touch
-                       else Relation.TOUCH)
-                      if has_no_overlap
-                      else Relation.OVERLAP))
+                if state & TEST_BOUNDARY_NOT_IN_GOAL_INTERIOR
+                else disjoint_or_touch_or_overlap)
     else:
         return (((Relation.DISJOINT
-                  if has_no_touch
+                  if state & HAS_NO_TOUCH
                   else Relation.TOUCH)
-                 if (has_no_cross
-                     and (test_boundary_not_in_goal_interior
-                          is goal_boundary_not_in_test_interior))
+                 if (state & HAS_NO_CROSS
+                     and (bool(state & TEST_BOUNDARY_NOT_IN_GOAL_INTERIOR)
+                          is bool(state
+                                  & GOAL_BOUNDARY_NOT_IN_TEST_INTERIOR)))
                  else Relation.CROSS)
-                if has_no_overlap
+                if state & HAS_NO_OVERLAP
                 else Relation.OVERLAP)
 
 
-def process_linear_compound_queue(events_queue: CompoundEventsQueue,
-                                  stop_x: Scalar) -> Relation:
+@suspending_gc
+def sweep_linear_compound_queue(events_queue: CompoundEventsQueue,
+                                stop_x: Scalar,
+                                stops: Sequence[bool]) -> int:
     # ``goal`` is a compound object
     # ``test`` is a linear object
-    test_not_in_goal_interior = has_no_touch = True
-    test_is_subset_of_goal = goal_border_subset_of_test = True
+    state = to_initial_state(events_queue, LINEAR_COMPOUND_STATE,
+                             GOAL_BORDER_SUBSET_OF_TEST)
+    if stops[state]:
+        return state
+    events = events_queue.events
     for event in events_queue.sweep(stop_x):
-        if event.relation is SegmentsRelation.CROSS:
-            return Relation.CROSS
-        elif has_no_touch and event.relation is not SegmentsRelation.DISJOINT:
-            has_no_touch = False
-        if event.from_test:
-            if test_is_subset_of_goal and event.outside:
-                test_is_subset_of_goal = False
-            if test_not_in_goal_interior and event.inside:
-                test_not_in_goal_interior = False
-        elif (goal_border_subset_of_test
-              and event.relation is not SegmentsRelation.OVERLAP):
-            goal_border_subset_of_test = False
+        relation = events.relations[event]
+        if relation == SegmentsRelation.CROSS:
+            return 0
+        elif relation != SegmentsRelation.DISJOINT:
+            state &= ~HAS_NO_TOUCH
+        if events.from_test(event):
+            if events.outside(event):
+                state &= ~TEST_IS_SUBSET_OF_GOAL
+            if events.inside(event):
+                state &= ~TEST_NOT_IN_GOAL_INTERIOR
+        elif relation != SegmentsRelation.OVERLAP:
+            state &= ~GOAL_BORDER_SUBSET_OF_TEST
+        if stops[state]:
+            return state
     if events_queue:
-        if events_queue.peek().from_test:
-            if test_is_subset_of_goal:
-                test_is_subset_of_goal = False
-        elif goal_border_subset_of_test:
-            goal_border_subset_of_test = False
-    if goal_border_subset_of_test:
+        state &= ~(TEST_IS_SUBSET_OF_GOAL
+                   if events.from_test(events_queue.peek())
+                   else GOAL_BORDER_SUBSET_OF_TEST)
+    return state
+
+
+def to_linear_compound_relation(state: int) -> Relation:
+    if state & GOAL_BORDER_SUBSET_OF_TEST:
         return ((Relation.COMPONENT
-                 if test_not_in_goal_interior
+                 if state & TEST_NOT_IN_GOAL_INTERIOR
                  else Relation.ENCLOSED)
-                if test_is_subset_of_goal
+                if state & TEST_IS_SUBSET_OF_GOAL
                 else Relation.TOUCH)
-    elif test_is_subset_of_goal:
+    elif state & TEST_IS_SUBSET_OF_GOAL:
         return (Relation.COMPONENT
-                if test_not_in_goal_interior
+                if state & TEST_NOT_IN_GOAL_INTERIOR
                 else (Relation.WITHIN
-                      if has_no_touch
+                      if state & HAS_NO_TOUCH
                       else Relation.ENCLOSED))
     else:
         return ((Relation.DISJOINT
-                 if has_no_touch
+                 if state & HAS_NO_TOUCH
                  else Relation.TOUCH)
-                if test_not_in_goal_interior
+                if state & TEST_NOT_IN_GOAL_INTERIOR
                 else Relation.CROSS)
 
 
-def process_compound_queue(events_queue: CompoundEventsQueue,
-                           stop_x: Scalar) -> Relation:
-    test_boundary_not_in_goal_interior = True
-    goal_boundary_not_in_test_interior = True
-    boundaries_do_not_intersect = True
-    none_overlapping_components = True
-    test_is_subset_of_goal = goal_is_subset_of_test = True
+@suspending_gc
+def sweep_compound_queue(events_queue: CompoundEventsQueue,
+                         stop_x: Scalar,
+                         stops: Sequence[bool]) -> int:
+    state = to_initial_state(events_queue, COMPOUND_STATE,
+                             GOAL_IS_SUBSET_OF_TEST)
+    if stops[state]:
+        return state
+    events = events_queue.events
     for event in events_queue.sweep(stop_x):
-        if event.relation is SegmentsRelation.CROSS:
-            return Relation.OVERLAP
-        elif (boundaries_do_not_intersect
-              and event.relation is not SegmentsRelation.DISJOINT):
-            boundaries_do_not_intersect = False
-        if event.is_common_region_boundary:
-            if none_overlapping_components:
-                none_overlapping_components = False
-        elif event.inside:
-            if none_overlapping_components:
-                none_overlapping_components = False
-            if event.from_test:
-                if test_boundary_not_in_goal_interior:
-                    test_boundary_not_in_goal_interior = False
-                if goal_is_subset_of_test:
-                    goal_is_subset_of_test = False
-            else:
-                if goal_boundary_not_in_test_interior:
-                    goal_boundary_not_in_test_interior = False
-                if test_is_subset_of_goal:
-                    test_is_subset_of_goal = False
-        elif event.outside or event.is_common_polyline_component:
-            if test_is_subset_of_goal and event.from_test:
-                test_is_subset_of_goal = False
-            if goal_is_subset_of_test and event.from_goal:
-                goal_is_subset_of_test = False
+        relation = events.relations[event]
+        if relation == SegmentsRelation.CROSS:
+            return 0
+        elif relation != SegmentsRelation.DISJOINT:
+            state &= ~BOUNDARIES_DO_NOT_INTERSECT
+        if events.is_common_region_boundary(event):
+            state &= ~NONE_OVERLAPPING_COMPONENTS
+        elif events.inside(event):
+            state &= ~(NONE_OVERLAPPING_COMPONENTS
+                       | (TEST_BOUNDARY_NOT_IN_GOAL_INTERIOR
+                          | GOAL_IS_SUBSET_OF_TEST
+                          if events.from_test(event)
+                          else GOAL_BOUNDARY_NOT_IN_TEST_INTERIOR
+                          | TEST_IS_SUBSET_OF_GOAL))
+        elif (events.outside(event)
+              or events.is_common_polyline_component(event)):
+            state &= ~(TEST_IS_SUBSET_OF_GOAL
+                       if events.from_test(event)
+                       else GOAL_IS_SUBSET_OF_TEST)
+        if stops[state]:
+            return state
     if events_queue:
-        if events_queue.peek().from_test:
-            if test_is_subset_of_goal:
-                test_is_subset_of_goal = False
-        elif goal_is_subset_of_test:
-            goal_is_subset_of_test = False
-    if boundaries_do_not_intersect:
+        state &= ~(TEST_IS_SUBSET_OF_GOAL
+                   if events.from_test(events_queue.peek())
+                   else GOAL_IS_SUBSET_OF_TEST)
+    return state
+
+
+def to_compound_relation(state: int) -> Relation:
+    if state & BOUNDARIES_DO_NOT_INTERSECT:
         return (Relation.WITHIN
-                if test_is_subset_of_goal
+                if state & TEST_IS_SUBSET_OF_GOAL
                 else (Relation.COVER
-                      if goal_is_subset_of_test
+                      if state & GOAL_IS_SUBSET_OF_TEST
                       else (Relation.DISJOINT
-                            if none_overlapping_components
+                            if state & NONE_OVERLAPPING_COMPONENTS
                             else Relation.OVERLAP)))
-    elif test_is_subset_of_goal:
+    elif state & TEST_IS_SUBSET_OF_GOAL:
         return (Relation.EQUAL
-                if goal_is_subset_of_test
+                if state & GOAL_IS_SUBSET_OF_TEST
                 else (Relation.COMPONENT
-                      if test_boundary_not_in_goal_interior
+                      if state & TEST_BOUNDARY_NOT_IN_GOAL_INTERIOR
                       else Relation.ENCLOSED))
-    elif goal_is_subset_of_test:
+    elif state & GOAL_IS_SUBSET_OF_TEST:
         return (Relation.COMPOSITE
-                if goal_boundary_not_in_test_interior
+                if state & GOAL_BOUNDARY_NOT_IN_TEST_INTERIOR
                 else Relation.ENCLOSES)
     else:
         return (Relation.TOUCH
-                if none_overlapping_components
+                if state & NONE_OVERLAPPING_COMPONENTS
                 else Relation.OVERLAP)
+
+
+@lru_cache(maxsize=None)
+def to_stops(classifier: Classifier,
+             initial_state: int,
+             relations: FrozenSet[Relation]) -> Sequence[bool]:
+    """
+    Returns table of states at which sweep can be stopped
+    since membership of the final relation in given ones is decided,
+    i.e. is the same for all states reachable by clearing more flags.
+    """
+    result = [False] * STATES_COUNT
+    state = initial_state
+    while True:
+        is_member = classifier(state) in relations
+        sub_state = state
+        while (sub_state
+               and (classifier((sub_state - 1) & state) in relations)
+               is is_member):
+            sub_state = (sub_state - 1) & state
+        result[state] = not sub_state
+        if not state:
+            break
+        state = (state - 1) & initial_state
+    return tuple(result)
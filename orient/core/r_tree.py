@@ -0,0 +1,102 @@
+from math import ceil
+from typing import (List,
+                    Optional,
+                    Sequence)
+
+from ground.base import Context
+from ground.hints import (Box,
+                          Scalar)
+from reprit.base import generate_repr
+
+from . import box
+
+NODE_CAPACITY = 16
+
+
+class Node:
+    __slots__ = 'bounding_box', 'index', 'children'
+
+    def __init__(self,
+                 bounding_box: Box,
+                 index: Optional[int],
+                 children: Sequence['Node']) -> None:
+        self.bounding_box, self.index, self.children = (bounding_box, index,
+                                                        children)
+
+    __repr__ = generate_repr(__init__)
+
+    @property
+    def is_leaf(self) -> bool:
+        return self.index is not None
+
+
+class RTree:
+    """
+    Static R-tree of boxes bulk-loaded with Sort-Tile-Recursive algorithm,
+    reports indices of boxes which are not disjoint with given one
+    in ``O(log boxes_count + reported_count)`` time on average.
+    """
+
+    __slots__ = 'boxes', 'context', 'root'
+
+    def __init__(self, boxes: Sequence[Box], context: Context) -> None:
+        self.boxes, self.context = boxes, context
+        nodes = [Node(bounding_box, index, ())
+                 for index, bounding_box in enumerate(boxes)]
+        while len(nodes) > 1:
+            nodes = _pack(nodes, context)
+        self.root = nodes[0] if nodes else None
+
+    __repr__ = generate_repr(__init__)
+
+    def find_intersecting(self, target: Box) -> List[int]:
+        """
+        Returns sorted indices of boxes which are not disjoint with target.
+        """
+        if self.root is None:
+            return []
+        result = []
+        queue = [self.root]
+        while queue:
+            node = queue.pop()
+            if box.disjoint_with(node.bounding_box, target):
+                continue
+            elif node.is_leaf:
+                result.append(node.index)
+            else:
+                queue.extend(node.children)
+        result.sort()
+        return result
+
+
+def _pack(nodes: List[Node], context: Context) -> List[Node]:
+    leaves_count = ceil(len(nodes) / NODE_CAPACITY)
+    slice_size = ceil(leaves_count ** 0.5) * NODE_CAPACITY
+    nodes = sorted(nodes,
+                   key=_to_node_box_double_center_x)
+    result = []
+    for slice_start in range(0, len(nodes), slice_size):
+        slice_nodes = sorted(nodes[slice_start:slice_start + slice_size],
+                             key=_to_node_box_double_center_y)
+        for start in range(0, len(slice_nodes), NODE_CAPACITY):
+            children = slice_nodes[start:start + NODE_CAPACITY]
+            result.append(Node(_merge_boxes([child.bounding_box
+                                             for child in children],
+                                            context),
+                               None, children))
+    return result
+
+
+def _merge_boxes(boxes: Sequence[Box], context: Context) -> Box:
+    return context.box_cls(min(element.min_x for element in boxes),
+                           max(element.max_x for element in boxes),
+                           min(element.min_y for element in boxes),
+                           max(element.max_y for element in boxes))
+
+
+def _to_node_box_double_center_x(node: Node) -> Scalar:
+    return node.bounding_box.min_x + node.bounding_box.max_x
+
+
+def _to_node_box_double_center_y(node: Node) -> Scalar:
+    return node.bounding_box.min_y + node.bounding_box.max_y
@@ -12,20 +12,25 @@ from ground.hints import (Box,
                           Segment)
 
 from . import box
-from .contour import (
-    equal as contours_equal,
-    orientation as contour_orientation,
-    point_vertex_line_divides_angle,
-    to_edges_endpoints as contour_to_edges_endpoints,
-    to_oriented_edges_endpoints as contour_to_oriented_segments
-)
+from .contour import (equal as contours_equal,
+                      point_vertex_line_divides_angle,
+                      to_edges_endpoints as contour_to_edges_endpoints)
 from .events_queue import CompoundEventsQueue
 from .hints import Region
 from .multisegment import to_segments_endpoints
+from .orienteer import to_orienteer
+from .prepared import (PreparedRegion,
+                       to_region_box,
+                       to_region_orientation,
+                       to_region_oriented_edges_endpoints)
 from .processing import (process_compound_queue,
                          process_linear_compound_queue)
-from .segment import (locate_point as locate_point_in_segment,
-                      relate_segment as relate_segments)
+from .segment import relate_segment as relate_segments
+from .utils import to_sorted_pair
+
+# index of the edge containing the point (if any) with the point's location
+LocatedPoint = Tuple[Optional[int], Location]
+UNLOCATED_POINT: LocatedPoint = (None, Location.EXTERIOR)
 
 
 def locate_point(region: Region,
@@ -37,24 +42,47 @@ def locate_point(region: Region,
 
 def _locate_point(region: Region,
                   point: Point,
-                  context: Context) -> Tuple[Optional[int], Location]:
-    result = False
+                  context: Context) -> LocatedPoint:
     point_y = point.y
-    for index, edge in enumerate(context.contour_segments(region)):
-        if locate_point_in_segment(edge, point, context) is Location.BOUNDARY:
-            return index, Location.BOUNDARY
+    if isinstance(region, PreparedRegion):
+        if not box.contains_point(region.box, point):
+            return None, Location.EXTERIOR
+        edges = region.edges
+        indexed_edges = [
+            (index, edges[index])
+            for index in sorted(region.edges_index.find_containing(point_y))
+        ]
+    else:
+        indexed_edges = enumerate(context.contour_segments(region))
+    orienteer = to_orienteer(context)
+    point_x = point.x
+    result = False
+    for index, edge in indexed_edges:
         start, end = edge.start, edge.end
-        if ((start.y > point_y) is not (end.y > point_y)
-                and ((end.y > start.y)
-                     is (context.angle_orientation(start, end, point)
-                         is Orientation.COUNTERCLOCKWISE))):
+        orientation = orienteer(start, end, point)
+        if orientation is Orientation.COLLINEAR:
+            if ((start.x <= point_x <= end.x or end.x <= point_x <= start.x)
+                    and (start.y <= point_y <= end.y
+                         or end.y <= point_y <= start.y)):
+                return index, Location.BOUNDARY
+        elif ((start.y > point_y) is not (end.y > point_y)
+              and ((end.y > start.y)
+                   is (orientation is Orientation.COUNTERCLOCKWISE))):
             result = not result
     return None, (Location.INTERIOR if result else Location.EXTERIOR)
 
 
-def _relate_segment_to_contour(contour: Contour,
-                               segment: Segment,
-                               context: Context) -> Relation:
+def _relate_segment_to_contour(
+        contour: Contour,
+        segment: Segment,
+        context: Context
+) -> Tuple[Relation, LocatedPoint, LocatedPoint]:
+    """
+    Returns relation of the segment with the contour
+    along with locations of the segment's endpoints in its region
+    (which are valid only if relation is neither cross nor component)
+    computed in a single pass over the contour's edges.
+    """
     # similar to segment-in-contour check
     # but cross has higher priority over overlap
     # because cross with contour will be considered as cross with region
@@ -63,12 +91,57 @@ def _relate_segment_to_contour(contour: Contour,
     has_no_touch = has_no_overlap = True
     last_touched_edge_index = last_touched_edge_start = None
     start, end = segment.start, segment.end
-    for index, edge in enumerate(context.contour_segments(contour)):
+    start_x, start_y, end_x, end_y = start.x, start.y, end.x, end.y
+    start_index = end_index = None
+    start_is_inside = end_is_inside = False
+    if isinstance(contour, PreparedRegion):
+        # edges which do not intersect with the segment's ``y``-range
+        # neither relate to the segment nor affect crossing parities
+        edges = contour.edges
+        min_y, max_y = to_sorted_pair((start_y, end_y))
+        indexed_edges = [
+            (index, edges[index])
+            for index in sorted(contour.edges_index.find_intersecting(min_y,
+                                                                      max_y))
+        ]
+    else:
+        indexed_edges = enumerate(context.contour_segments(contour))
+    orienteer = to_orienteer(context)
+    for index, edge in indexed_edges:
         edge_start, edge_end = edge_endpoints = edge.start, edge.end
+        start_orientation = orienteer(edge_start, edge_end, start)
+        end_orientation = orienteer(edge_start, edge_end, end)
+        # crossing parities as in ``_locate_point``
+        if start_orientation is Orientation.COLLINEAR:
+            if (start_index is None
+                    and (edge_start.x <= start_x <= edge_end.x
+                         or edge_end.x <= start_x <= edge_start.x)
+                    and (edge_start.y <= start_y <= edge_end.y
+                         or edge_end.y <= start_y <= edge_start.y)):
+                start_index = index
+        elif ((edge_start.y > start_y) is not (edge_end.y > start_y)
+              and ((edge_end.y > edge_start.y)
+                   is (start_orientation is Orientation.COUNTERCLOCKWISE))):
+            start_is_inside = not start_is_inside
+        if end_orientation is Orientation.COLLINEAR:
+            if (end_index is None
+                    and (edge_start.x <= end_x <= edge_end.x
+                         or edge_end.x <= end_x <= edge_start.x)
+                    and (edge_start.y <= end_y <= edge_end.y
+                         or edge_end.y <= end_y <= edge_start.y)):
+                end_index = index
+        elif ((edge_start.y > end_y) is not (edge_end.y > end_y)
+              and ((edge_end.y > edge_start.y)
+                   is (end_orientation is Orientation.COUNTERCLOCKWISE))):
+            end_is_inside = not end_is_inside
+        if (start_orientation is end_orientation
+                and start_orientation is not Orientation.COLLINEAR):
+            # the segment lies strictly on one side of the edge's line
+            continue
         relation_with_edge = relate_segments(edge, segment, context)
         if (relation_with_edge is Relation.COMPONENT
                 or relation_with_edge is Relation.EQUAL):
-            return Relation.COMPONENT
+            return Relation.COMPONENT, UNLOCATED_POINT, UNLOCATED_POINT
         elif (relation_with_edge is Relation.OVERLAP
               or relation_with_edge is Relation.COMPOSITE):
             if has_no_overlap:
@@ -84,11 +157,11 @@ def _relate_segment_to_contour(contour: Contour,
                                                       last_touched_edge_start,
                                                       edge_start, edge_end,
                                                       context)):
-                return Relation.CROSS
+                return Relation.CROSS, UNLOCATED_POINT, UNLOCATED_POINT
             last_touched_edge_index = index
             last_touched_edge_start = edge_start
         elif relation_with_edge is Relation.CROSS:
-            return Relation.CROSS
+            return Relation.CROSS, UNLOCATED_POINT, UNLOCATED_POINT
     vertices = contour.vertices
     if not has_no_touch and last_touched_edge_index == len(vertices) - 1:
         first_edge_endpoints = first_edge_start, first_edge_end = (
@@ -104,22 +177,33 @@ def _relate_segment_to_contour(contour: Contour,
                 and point_vertex_line_divides_angle(start, vertices[-2],
                                                     first_edge_start,
                                                     first_edge_end, context)):
-            return Relation.CROSS
-    return ((Relation.DISJOINT if has_no_touch else Relation.TOUCH)
-            if has_no_overlap
-            else Relation.OVERLAP)
+            return Relation.CROSS, UNLOCATED_POINT, UNLOCATED_POINT
+    return (((Relation.DISJOINT if has_no_touch else Relation.TOUCH)
+             if has_no_overlap
+             else Relation.OVERLAP),
+            to_located_point(start_index, start_is_inside),
+            to_located_point(end_index, end_is_inside))
+
+
+def to_located_point(boundary_edge_index: Optional[int],
+                     is_inside: bool) -> LocatedPoint:
+    return (boundary_edge_index,
+            ((Location.INTERIOR if is_inside else Location.EXTERIOR)
+             if boundary_edge_index is None
+             else Location.BOUNDARY))
 
 
 def relate_segment(region: Region,
                    segment: Segment,
                    context: Context) -> Relation:
-    relation_with_contour = _relate_segment_to_contour(region, segment,
-                                                       context)
+    relation_with_contour, start_located, end_located = (
+        _relate_segment_to_contour(region, segment, context)
+    )
     if (relation_with_contour is Relation.CROSS
             or relation_with_contour is Relation.COMPONENT):
         return relation_with_contour
     start, end = segment.start, segment.end
-    start_index, start_location = _locate_point(region, start, context)
+    start_index, start_location = start_located
     if relation_with_contour is Relation.DISJOINT:
         return (Relation.DISJOINT
                 if start_location is Location.EXTERIOR
@@ -129,14 +213,14 @@ def relate_segment(region: Region,
     elif start_location is Location.INTERIOR:
         return Relation.ENCLOSED
     else:
-        end_index, end_location = _locate_point(region, end, context)
+        end_index, end_location = end_located
         if end_location is Location.EXTERIOR:
             return Relation.TOUCH
         elif end_location is Location.INTERIOR:
             return Relation.ENCLOSED
         else:
-            angle_orientation = context.angle_orientation
-            border_orientation = contour_orientation(region, context)
+            angle_orientation = to_orienteer(context)
+            border_orientation = to_region_orientation(region, context)
             positively_oriented = (border_orientation
                                    is Orientation.COUNTERCLOCKWISE)
             vertices = region.vertices
@@ -216,14 +300,16 @@ def relate_multisegment(region: Region,
                         multisegment: Multisegment,
                         context: Context) -> Relation:
     multisegment_bounding_box = context.segments_box(multisegment.segments)
-    region_bounding_box = context.contour_box(region)
+    region_bounding_box = to_region_box(region, context)
     if box.disjoint_with(multisegment_bounding_box, region_bounding_box):
         return Relation.DISJOINT
     events_queue = CompoundEventsQueue(context)
     events_queue.register(to_oriented_segments(region, context),
-                          from_test=False)
+                          from_test=False,
+                          window=multisegment_bounding_box)
     events_queue.register(to_segments_endpoints(multisegment),
-                          from_test=True)
+                          from_test=True,
+                          window=region_bounding_box)
     return process_linear_compound_queue(events_queue,
                                          min(multisegment_bounding_box.max_x,
                                              region_bounding_box.max_x))
@@ -240,16 +326,18 @@ def _relate_contour(region: Region,
                     contour: Contour,
                     contour_bounding_box: Box,
                     context: Context) -> Relation:
-    region_bounding_box = context.contour_box(region)
+    region_bounding_box = to_region_box(region, context)
     if box.disjoint_with(contour_bounding_box, region_bounding_box):
         return Relation.DISJOINT
     if equal(region, contour, context):
         return Relation.COMPONENT
     events_queue = CompoundEventsQueue(context)
     events_queue.register(to_oriented_segments(region, context),
-                          from_test=False)
+                          from_test=False,
+                          window=contour_bounding_box)
     events_queue.register(contour_to_edges_endpoints(contour),
-                          from_test=True)
+                          from_test=True,
+                          window=region_bounding_box)
     return process_linear_compound_queue(events_queue,
                                          min(contour_bounding_box.max_x,
                                              region_bounding_box.max_x))
@@ -258,8 +346,8 @@ def _relate_contour(region: Region,
 def relate_region(goal: Region,
                   test: Region,
                   context: Context) -> Relation:
-    return _relate_region(goal, test, context.contour_box(goal),
-                          context.contour_box(test), context)
+    return _relate_region(goal, test, to_region_box(goal, context),
+                          to_region_box(test, context), context)
 
 
 def _relate_region(goal: Region,
@@ -273,12 +361,14 @@ def _relate_region(goal: Region,
         return Relation.EQUAL
     events_queue = CompoundEventsQueue(context)
     events_queue.register(to_oriented_segments(goal, context),
-                          from_test=False)
+                          from_test=False,
+                          window=test_bounding_box)
     events_queue.register(to_oriented_segments(test, context),
-                          from_test=True)
+                          from_test=True,
+                          window=goal_bounding_box)
     return process_compound_queue(events_queue, min(goal_bounding_box.max_x,
                                                     test_bounding_box.max_x))
 
 
 equal = contours_equal
-to_oriented_segments = contour_to_oriented_segments
+to_oriented_segments = to_region_oriented_edges_endpoints
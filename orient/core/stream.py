@@ -0,0 +1,41 @@
+from itertools import islice
+from typing import (Any,
+                    Iterable,
+                    Iterator)
+
+from ground.base import (Context,
+                         Relation)
+
+from . import box
+from .join import (relate,
+                   to_box,
+                   to_kind,
+                   to_prepared,
+                   to_raw)
+
+
+def relate_stream(goal: Any,
+                  tests: Iterable[Any],
+                  chunk_size: int,
+                  context: Context) -> Iterator[Relation]:
+    goal_kind = to_kind(goal)
+    raw_goal = to_raw(goal)
+    # goal is related to every test, so its derived structures are cached
+    goal = to_prepared(goal, goal_kind, context)
+    goal_box = to_box(goal, goal_kind, context)
+    tests = iter(tests)
+    while True:
+        chunk = [(to_raw(test), to_kind(test))
+                 for test in islice(tests, chunk_size)]
+        if not chunk:
+            return
+        # boxes of the chunk are checked before relating its tests,
+        # so disjoint ones are skipped without dispatching relations
+        are_disjoint = [box.disjoint_with(goal_box,
+                                          to_box(test, test_kind, context))
+                        for test, test_kind in chunk]
+        for (test, test_kind), is_disjoint in zip(chunk, are_disjoint):
+            yield (Relation.DISJOINT
+                   if is_disjoint
+                   else relate(goal, raw_goal, goal_kind, test, test_kind,
+                               context))
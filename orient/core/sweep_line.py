@@ -1,27 +1,63 @@
+from abc import (ABC,
+                 abstractmethod)
+from bisect import (bisect_left,
+                    insort)
+from contextvars import ContextVar
 from functools import partial
-from typing import (Generic,
+from typing import (Dict,
+                    List,
                     Optional,
-                    TypeVar)
+                    Tuple)
 
 from dendroid import red_black
 from ground.base import (Context,
                          Orientation)
 from reprit.base import generate_repr
 
-from .event import LeftEvent
+from .enums import SweepLineKind
+from .event import (Event,
+                    EventsArena)
 from .hints import Orienteer
+from .orienteer import to_orienteer
 
-Event = TypeVar('Event',
-                bound=LeftEvent)
+# maximum number of keys in a block of sorted blocks sweep line,
+# exceeding blocks are split in halves
+MAX_BLOCK_SIZE = 128
+sweep_line_kind = ContextVar('sweep_line_kind',
+                             default=SweepLineKind.RED_BLACK_TREE)
 
 
-class SweepLine(Generic[Event]):
-    __slots__ = 'context', '_set'
+class SweepLine(ABC):
+    __slots__ = ()
 
-    def __init__(self, context: Context) -> None:
-        self.context = context
-        self._set = red_black.set_(key=partial(SweepLineKey,
-                                               context.angle_orientation))
+    @abstractmethod
+    def __contains__(self, event: Event) -> bool:
+        """Checks if the event is in the sweep line."""
+
+    @abstractmethod
+    def add(self, event: Event) -> None:
+        """Adds the event to the sweep line."""
+
+    @abstractmethod
+    def remove(self, event: Event) -> None:
+        """Removes the event from the sweep line."""
+
+    @abstractmethod
+    def above(self, event: Event) -> Optional[Event]:
+        """Returns the event right above given one if any."""
+
+    @abstractmethod
+    def below(self, event: Event) -> Optional[Event]:
+        """Returns the event right below given one if any."""
+
+
+class RedBlackTreeSweepLine(SweepLine):
+    __slots__ = 'context', 'events', '_set'
+
+    def __init__(self, events: EventsArena, context: Context) -> None:
+        self.context, self.events = context, events
+        self._set = red_black.set_(key=partial(SweepLineKey, events,
+                                               to_orienteer(context)))
 
     __repr__ = generate_repr(__init__)
 
@@ -47,11 +83,99 @@ class SweepLine(Generic[Event]):
             return None
 
 
+class SortedBlocksSweepLine(SweepLine):
+    """
+    Sweep line which keeps events' keys in a list of sorted blocks,
+    so ordered operations take logarithmic number of comparisons
+    and only key of added event is allocated.
+    """
+    __slots__ = 'context', 'events', 'orienteer', '_blocks', '_keys', '_maxes'
+
+    def __init__(self, events: EventsArena, context: Context) -> None:
+        self.context, self.events = context, events
+        self.orienteer = to_orienteer(context)
+        self._blocks: List[List[SweepLineKey]] = []
+        self._keys: Dict[Event, SweepLineKey] = {}
+        # last keys of blocks
+        self._maxes: List[SweepLineKey] = []
+
+    __repr__ = generate_repr(__init__)
+
+    def __contains__(self, event: Event) -> bool:
+        return event in self._keys
+
+    def add(self, event: Event) -> None:
+        key = self._keys[event] = SweepLineKey(self.events, self.orienteer,
+                                               event)
+        blocks, maxes = self._blocks, self._maxes
+        if not blocks:
+            blocks.append([key])
+            maxes.append(key)
+            return
+        block_index = bisect_left(maxes, key)
+        if block_index == len(blocks):
+            block_index -= 1
+            block = blocks[block_index]
+            block.append(key)
+            maxes[block_index] = key
+        else:
+            block = blocks[block_index]
+            insort(block, key)
+        if len(block) > MAX_BLOCK_SIZE:
+            middle = len(block) // 2
+            blocks.insert(block_index + 1, block[middle:])
+            del block[middle:]
+            maxes.insert(block_index, block[-1])
+
+    def remove(self, event: Event) -> None:
+        block_index, index = self._locate(self._keys.pop(event))
+        block = self._blocks[block_index]
+        del block[index]
+        if not block:
+            del self._blocks[block_index], self._maxes[block_index]
+        elif index == len(block):
+            self._maxes[block_index] = block[-1]
+
+    def above(self, event: Event) -> Optional[Event]:
+        block_index, index = self._locate(self._keys[event])
+        block = self._blocks[block_index]
+        return (block[index + 1].event
+                if index + 1 < len(block)
+                else (self._blocks[block_index + 1][0].event
+                      if block_index + 1 < len(self._blocks)
+                      else None))
+
+    def below(self, event: Event) -> Optional[Event]:
+        block_index, index = self._locate(self._keys[event])
+        return (self._blocks[block_index][index - 1].event
+                if index
+                else (self._blocks[block_index - 1][-1].event
+                      if block_index
+                      else None))
+
+    def _locate(self, key: 'SweepLineKey') -> Tuple[int, int]:
+        block_index = bisect_left(self._maxes, key)
+        return block_index, bisect_left(self._blocks[block_index], key)
+
+
+def to_sweep_line(events: EventsArena, context: Context) -> SweepLine:
+    """
+    Returns empty sweep line of the kind
+    selected for the current execution context.
+    """
+    return (SortedBlocksSweepLine(events, context)
+            if sweep_line_kind.get() is SweepLineKind.SORTED_BLOCKS
+            else RedBlackTreeSweepLine(events, context))
+
+
 class SweepLineKey:
-    __slots__ = 'event', 'orienteer'
+    __slots__ = 'event', 'events', 'orienteer'
 
-    def __init__(self, orienteer: Orienteer, event: Event) -> None:
-        self.orienteer, self.event = orienteer, event
+    def __init__(self,
+                 events: EventsArena,
+                 orienteer: Orienteer,
+                 event: Event) -> None:
+        self.event, self.events, self.orienteer = event, events, orienteer
 
     __repr__ = generate_repr(__init__)
 
@@ -60,15 +184,16 @@ class SweepLineKey:
         Checks if the segment (or at least the point) associated with event
         is lower than other's.
         """
-        event, other_event = self.event, other.event
-        if event is other_event:
+        event, other_event, events = self.event, other.event, self.events
+        if event == other_event:
             return False
-        start, end = event.start, event.end
-        other_start, other_end = other_event.start, other_event.end
+        start, end = events.starts[event], events.end(event)
+        other_start, other_end = (events.starts[other_event],
+                                  events.end(other_event))
         other_start_orientation = self.orienteer(start, end, other_start)
         other_end_orientation = self.orienteer(start, end, other_end)
         if other_start_orientation is other_end_orientation:
-            return (event.from_test
+            return (events.from_test(event)
                     if other_start_orientation is Orientation.COLLINEAR
                     else (other_start_orientation
                           is Orientation.COUNTERCLOCKWISE))
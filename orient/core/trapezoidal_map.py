@@ -0,0 +1,336 @@
+from random import Random
+from typing import (Dict,
+                    Iterable,
+                    List,
+                    Optional,
+                    Sequence,
+                    Tuple,
+                    Union)
+
+from ground.base import (Context,
+                         Location,
+                         Orientation)
+from ground.hints import (Box,
+                          Point)
+from reprit.base import generate_repr
+
+from . import box
+from .enums import NodeKind
+from .hints import SegmentEndpoints
+from .orienteer import to_orienteer
+
+# own generator of randomized incremental construction,
+# so building maps does not advance the global ``random`` state
+randomizer = Random()
+
+
+class Edge:
+    __slots__ = 'left', 'right', 'interior_above', 'polygon_index'
+
+    def __init__(self,
+                 left: Point,
+                 right: Point,
+                 interior_above: bool,
+                 polygon_index: int) -> None:
+        self.left, self.right, self.interior_above, self.polygon_index = (
+            left, right, interior_above, polygon_index
+        )
+
+    __repr__ = generate_repr(__init__)
+
+
+class Trapezoid:
+    __slots__ = ('left', 'right', 'below', 'above', 'lower_left',
+                 'lower_right', 'upper_left', 'upper_right', 'node')
+
+    def __init__(self,
+                 left: Point,
+                 right: Point,
+                 below: Optional[Edge],
+                 above: Optional[Edge]) -> None:
+        self.left, self.right, self.below, self.above = (
+            left, right, below, above
+        )
+        self.lower_left = self.lower_right = None
+        self.upper_left = self.upper_right = None
+        self.node = Node(NodeKind.LEAF, self, None, None)
+
+    __repr__ = generate_repr(__init__)
+
+    @property
+    def location(self) -> Tuple[Optional[int], Location]:
+        """
+        Returns index of the polygon containing the trapezoid (if any)
+        along with location of the trapezoid's interior.
+        """
+        below = self.below
+        return ((below.polygon_index, Location.INTERIOR)
+                if below is not None and below.interior_above
+                else (None, Location.EXTERIOR))
+
+    def set_lower_left(self, trapezoid: Optional['Trapezoid']) -> None:
+        self.lower_left = trapezoid
+        if trapezoid is not None:
+            trapezoid.lower_right = self
+
+    def set_lower_right(self, trapezoid: Optional['Trapezoid']) -> None:
+        self.lower_right = trapezoid
+        if trapezoid is not None:
+            trapezoid.lower_left = self
+
+    def set_upper_left(self, trapezoid: Optional['Trapezoid']) -> None:
+        self.upper_left = trapezoid
+        if trapezoid is not None:
+            trapezoid.upper_right = self
+
+    def set_upper_right(self, trapezoid: Optional['Trapezoid']) -> None:
+        self.upper_right = trapezoid
+        if trapezoid is not None:
+            trapezoid.upper_left = self
+
+
+class Node:
+    """
+    Node of the search structure, depending on kind holds
+
+    - trapezoid for leaves,
+    - point with nodes to the left & to the right of it for x-nodes,
+    - edge with nodes below & above it for y-nodes.
+    """
+    __slots__ = 'kind', 'value', 'first', 'second'
+
+    def __init__(self,
+                 kind: NodeKind,
+                 value: Union[Edge, Point, Trapezoid],
+                 first: Optional['Node'],
+                 second: Optional['Node']) -> None:
+        self.kind, self.value, self.first, self.second = (
+            kind, value, first, second
+        )
+
+    __repr__ = generate_repr(__init__)
+
+    def replace_with(self, other: 'Node') -> None:
+        self.kind, self.value, self.first, self.second = (
+            other.kind, other.value, other.first, other.second
+        )
+
+
+class TrapezoidalMap:
+    """
+    Randomized incremental trapezoidal map of polygons edges
+    for point location in ``O(log edges_count)`` expected time.
+    """
+
+    @classmethod
+    def from_polygons_edges(
+            cls,
+            polygons_edges_endpoints: Sequence[Iterable[SegmentEndpoints]],
+            bounding_box: Box,
+            context: Context
+    ) -> 'TrapezoidalMap':
+        """
+        Constructs map from polygons' edges oriented
+        with polygons' interiors on the left.
+        """
+        return cls([Edge(start, end, True, polygon_index)
+                    if start < end
+                    else Edge(end, start, False, polygon_index)
+                    for polygon_index, edges_endpoints
+                    in enumerate(polygons_edges_endpoints)
+                    for start, end in edges_endpoints],
+                   bounding_box, context)
+
+    __slots__ = ('box', 'context', 'orienteer', 'root',
+                 '_vertices_polygons_indices')
+
+    def __init__(self,
+                 edges: List[Edge],
+                 bounding_box: Box,
+                 context: Context) -> None:
+        """
+        Initializes map from edges which do not cross each other.
+        """
+        self.box, self.context = bounding_box, context
+        self.orienteer = to_orienteer(context)
+        point_cls = context.point_cls
+        self.root = Trapezoid(point_cls(bounding_box.min_x - 1,
+                                        bounding_box.min_y),
+                              point_cls(bounding_box.max_x + 1,
+                                        bounding_box.max_y),
+                              None, None).node
+        self._vertices_polygons_indices: Dict[Point, int] = {}
+        for edge in edges:
+            self._register_vertex(edge.left, edge.polygon_index)
+            self._register_vertex(edge.right, edge.polygon_index)
+        edges = list(edges)
+        randomizer.shuffle(edges)
+        for edge in edges:
+            self._add(edge)
+
+    def locate(self, point: Point) -> Tuple[Optional[int], Location]:
+        """
+        Returns index of the first polygon containing the point (if any)
+        along with location of the point in polygons.
+        """
+        if not box.contains_point(self.box, point):
+            return None, Location.EXTERIOR
+        orienteer = self.orienteer
+        node = self.root
+        while node.kind is not NodeKind.LEAF:
+            if node.kind is NodeKind.X:
+                if point == node.value:
+                    return (self._vertices_polygons_indices[point],
+                            Location.BOUNDARY)
+                node = node.first if point < node.value else node.second
+            else:
+                edge = node.value
+                orientation = orienteer(edge.left, edge.right, point)
+                if orientation is Orientation.COLLINEAR:
+                    return (self._vertices_polygons_indices.get(
+                                    point, edge.polygon_index
+                            ),
+                            Location.BOUNDARY)
+                node = (node.second
+                        if orientation is Orientation.COUNTERCLOCKWISE
+                        else node.first)
+        return node.value.location
+
+    def _add(self, edge: Edge) -> None:
+        trapezoids = self._find_intersecting_trapezoids(edge)
+        while trapezoids[-1].right < edge.right:
+            # edge passes through the vertex,
+            # so it gets divided there
+            vertex = trapezoids[-1].right
+            self._register_vertex(vertex, edge.polygon_index)
+            self._split(Edge(edge.left, vertex, edge.interior_above,
+                             edge.polygon_index),
+                        trapezoids)
+            edge = Edge(vertex, edge.right, edge.interior_above,
+                        edge.polygon_index)
+            trapezoids = self._find_intersecting_trapezoids(edge)
+        self._split(edge, trapezoids)
+
+    def _split(self, edge: Edge, trapezoids: List[Trapezoid]) -> None:
+        start, end = edge.left, edge.right
+        self._register_touch(start, trapezoids[0])
+        self._register_touch(end, trapezoids[-1])
+        last_index = len(trapezoids) - 1
+        previous = previous_below = previous_above = None
+        for index, trapezoid in enumerate(trapezoids):
+            is_first, is_last = index == 0, index == last_index
+            has_left = is_first and trapezoid.left != start
+            has_right = is_last and trapezoid.right != end
+            right_point = end if is_last else trapezoid.right
+            if is_first:
+                below = Trapezoid(start, right_point, trapezoid.below, edge)
+                above = Trapezoid(start, right_point, edge, trapezoid.above)
+                if has_left:
+                    left = Trapezoid(trapezoid.left, start, trapezoid.below,
+                                     trapezoid.above)
+                    left.set_lower_left(trapezoid.lower_left)
+                    left.set_upper_left(trapezoid.upper_left)
+                    left.set_lower_right(below)
+                    left.set_upper_right(above)
+                else:
+                    below.set_lower_left(trapezoid.lower_left)
+                    above.set_upper_left(trapezoid.upper_left)
+            else:
+                if previous_below.below is trapezoid.below:
+                    below = previous_below
+                    below.right = right_point
+                else:
+                    below = Trapezoid(trapezoid.left, right_point,
+                                      trapezoid.below, edge)
+                    below.set_upper_left(previous_below)
+                    below.set_lower_left(
+                            previous_below
+                            if trapezoid.lower_left is previous
+                            else trapezoid.lower_left
+                    )
+                if previous_above.above is trapezoid.above:
+                    above = previous_above
+                    above.right = right_point
+                else:
+                    above = Trapezoid(trapezoid.left, right_point, edge,
+                                      trapezoid.above)
+                    above.set_lower_left(previous_above)
+                    above.set_upper_left(
+                            previous_above
+                            if trapezoid.upper_left is previous
+                            else trapezoid.upper_left
+                    )
+            if has_right:
+                right = Trapezoid(end, trapezoid.right, trapezoid.below,
+                                  trapezoid.above)
+                right.set_lower_right(trapezoid.lower_right)
+                right.set_upper_right(trapezoid.upper_right)
+                below.set_lower_right(right)
+                above.set_upper_right(right)
+            else:
+                below.set_lower_right(trapezoid.lower_right)
+                above.set_upper_right(trapezoid.upper_right)
+            node = Node(NodeKind.Y, edge, below.node, above.node)
+            if has_right:
+                node = Node(NodeKind.X, end, node, right.node)
+            if has_left:
+                node = Node(NodeKind.X, start, left.node, node)
+            trapezoid.node.replace_with(node)
+            previous, previous_below, previous_above = trapezoid, below, above
+
+    def _find_intersecting_trapezoids(self, edge: Edge) -> List[Trapezoid]:
+        """
+        Returns trapezoids intersected by the edge from left to right
+        until the edge's end or a vertex lying on the edge.
+        """
+        orienteer = self.orienteer
+        start, end = edge.left, edge.right
+        node = self.root
+        while node.kind is not NodeKind.LEAF:
+            if node.kind is NodeKind.X:
+                node = node.first if start < node.value else node.second
+            else:
+                node_edge = node.value
+                orientation = orienteer(node_edge.left, node_edge.right,
+                                        start)
+                if orientation is Orientation.COLLINEAR:
+                    # the start lies on the node's edge,
+                    # so relative position is defined by the end
+                    orientation = orienteer(node_edge.left, node_edge.right,
+                                            end)
+                    if orientation is Orientation.COLLINEAR:
+                        # edges overlap, the one with interior above
+                        # bounds faces from below
+                        orientation = (Orientation.COUNTERCLOCKWISE
+                                       if edge.interior_above
+                                       else Orientation.CLOCKWISE)
+                node = (node.second
+                        if orientation is Orientation.COUNTERCLOCKWISE
+                        else node.first)
+        trapezoid = node.value
+        result = [trapezoid]
+        while trapezoid.right < end:
+            orientation = orienteer(start, end, trapezoid.right)
+            if orientation is Orientation.COLLINEAR:
+                break
+            trapezoid = (trapezoid.lower_right
+                         if orientation is Orientation.COUNTERCLOCKWISE
+                         else trapezoid.upper_right)
+            result.append(trapezoid)
+        return result
+
+    def _register_touch(self, vertex: Point, trapezoid: Trapezoid) -> None:
+        """
+        Registers vertex lying on the trapezoid's bounding edge (if any).
+        """
+        orienteer = self.orienteer
+        for edge in (trapezoid.below, trapezoid.above):
+            if (edge is not None
+                    and orienteer(edge.left, edge.right, vertex)
+                    is Orientation.COLLINEAR):
+                self._register_vertex(vertex, edge.polygon_index)
+
+    def _register_vertex(self, vertex: Point, polygon_index: int) -> None:
+        indices = self._vertices_polygons_indices
+        indices[vertex] = min(indices.get(vertex, polygon_index),
+                              polygon_index)
@@ -0,0 +1,173 @@
+from numbers import Rational
+from typing import (Sequence,
+                    Tuple)
+
+import numpy as np
+from ground.base import (Context,
+                         Location,
+                         Mode)
+from ground.hints import (Point,
+                          Polygon,
+                          Scalar)
+
+from .enums import Arithmetic
+from .hints import Region
+from .orienteer import (ORIENTATION_ERROR_BOUND_COEFFICIENT,
+                        UNDERFLOW_ERROR_BOUND)
+from .region import locate_point as locate_point_in_region
+
+# maximum number of point-edge pairs processed at once
+BLOCK_SIZE = 1 << 20
+# coordinates with lesser magnitudes have exact ``int64`` orientation
+MAX_EXACT_INTEGER = 1 << 30
+# integers with lesser magnitudes are exactly representable as ``float64``
+MAX_EXACT_FLOAT_INTEGER = 1 << 53
+
+
+def locate_points_in_polygon(polygon: Polygon,
+                             points: np.ndarray,
+                             context: Context) -> np.ndarray:
+    result = locate_points_in_region(polygon.border, points, context)
+    for hole in polygon.holes:
+        candidates_indices = np.flatnonzero(result == Location.INTERIOR)
+        if not candidates_indices.size:
+            break
+        locations_in_hole = locate_points_in_region(
+                hole, points[candidates_indices], context
+        )
+        result[candidates_indices[locations_in_hole
+                                  == Location.INTERIOR]] = Location.EXTERIOR
+        result[candidates_indices[locations_in_hole
+                                  == Location.BOUNDARY]] = Location.BOUNDARY
+    return result
+
+
+def locate_points_in_region(region: Region,
+                            points: np.ndarray,
+                            context: Context) -> np.ndarray:
+    result = np.full(len(points), Location.EXTERIOR,
+                     dtype=np.uint8)
+    vertices = region.vertices
+    arithmetic = to_arithmetic(vertices, points, context)
+    if arithmetic is Arithmetic.SCALAR:
+        for index in range(len(points)):
+            result[index] = locate_point_in_region(
+                    region, to_point(points, index, context), context
+            )
+        return result
+    dtype = np.int64 if arithmetic is Arithmetic.INTEGER else np.float64
+    vertices_xs = np.array([vertex.x for vertex in vertices], dtype=dtype)
+    vertices_ys = np.array([vertex.y for vertex in vertices], dtype=dtype)
+    points_xs, points_ys = (points[:, 0].astype(dtype),
+                            points[:, 1].astype(dtype))
+    candidates_indices = np.flatnonzero(
+            (points_xs >= vertices_xs.min()) & (points_xs <= vertices_xs.max())
+            & (points_ys >= vertices_ys.min())
+            & (points_ys <= vertices_ys.max())
+    )
+    if not candidates_indices.size:
+        return result
+    starts_xs, starts_ys = np.roll(vertices_xs, 1), np.roll(vertices_ys, 1)
+    locations, undecided = locate_points_in_edges(
+            starts_xs, starts_ys, vertices_xs, vertices_ys,
+            points_xs[candidates_indices], points_ys[candidates_indices],
+            arithmetic is Arithmetic.INTEGER
+    )
+    result[candidates_indices] = locations
+    for index in candidates_indices[undecided]:
+        result[index] = locate_point_in_region(
+                region, to_point(points, index, context), context
+        )
+    return result
+
+
+def locate_points_in_edges(starts_xs: np.ndarray,
+                           starts_ys: np.ndarray,
+                           ends_xs: np.ndarray,
+                           ends_ys: np.ndarray,
+                           points_xs: np.ndarray,
+                           points_ys: np.ndarray,
+                           exact: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Locates points in region given by its edges
+    with crossing number test.
+
+    Returns locations codes along with mask of points
+    for which location can not be decided with floating point arithmetic.
+    """
+    points_count = len(points_xs)
+    locations = np.empty(points_count,
+                         dtype=np.uint8)
+    undecided = np.zeros(points_count,
+                         dtype=bool)
+    edges_min_xs, edges_max_xs = (np.minimum(starts_xs, ends_xs),
+                                  np.maximum(starts_xs, ends_xs))
+    edges_min_ys, edges_max_ys = (np.minimum(starts_ys, ends_ys),
+                                  np.maximum(starts_ys, ends_ys))
+    edges_dxs, edges_dys = ends_xs - starts_xs, ends_ys - starts_ys
+    edges_go_up = ends_ys > starts_ys
+    step = max(BLOCK_SIZE // len(starts_xs), 1)
+    for offset in range(0, points_count, step):
+        block = slice(offset, offset + step)
+        xs, ys = points_xs[block, None], points_ys[block, None]
+        crossing = (starts_ys > ys) != (ends_ys > ys)
+        in_edge_box = ((edges_min_xs <= xs) & (xs <= edges_max_xs)
+                       & (edges_min_ys <= ys) & (ys <= edges_max_ys))
+        left_products = edges_dxs * (ys - starts_ys)
+        right_products = edges_dys * (xs - starts_xs)
+        determinants = left_products - right_products
+        if exact:
+            on_boundary = (in_edge_box & (determinants == 0)).any(axis=1)
+        else:
+            error_bounds = (ORIENTATION_ERROR_BOUND_COEFFICIENT
+                            * (np.abs(left_products)
+                               + np.abs(right_products))
+                            + UNDERFLOW_ERROR_BOUND)
+            undecided[block] = (~(np.abs(determinants) > error_bounds)
+                                & (crossing | in_edge_box)).any(axis=1)
+            on_boundary = False
+        interior = (np.count_nonzero(crossing
+                                     & (edges_go_up == (determinants > 0)),
+                                     axis=1) % 2).astype(bool)
+        locations[block] = np.where(on_boundary, Location.BOUNDARY,
+                                    np.where(interior, Location.INTERIOR,
+                                             Location.EXTERIOR))
+    return locations, undecided
+
+
+def to_arithmetic(vertices: Sequence[Point],
+                  points: np.ndarray,
+                  context: Context) -> Arithmetic:
+    if context.mode is Mode.PLAIN or points.dtype.kind not in 'fiu':
+        return Arithmetic.SCALAR
+    coordinates = [coordinate
+                   for vertex in vertices
+                   for coordinate in (vertex.x, vertex.y)]
+    if points.dtype.kind in 'iu':
+        points_max_magnitude = (max(-int(points.min()), int(points.max()))
+                                if points.size
+                                else 0)
+        if (points_max_magnitude < MAX_EXACT_INTEGER
+                and all(isinstance(coordinate, int)
+                        and abs(coordinate) < MAX_EXACT_INTEGER
+                        for coordinate in coordinates)):
+            return Arithmetic.INTEGER
+        elif points_max_magnitude >= MAX_EXACT_FLOAT_INTEGER:
+            return Arithmetic.SCALAR
+    return (Arithmetic.FLOAT
+            if all(is_exact_float(coordinate) for coordinate in coordinates)
+            else Arithmetic.SCALAR)
+
+
+def is_exact_float(value: Scalar) -> bool:
+    if not isinstance(value, (float, Rational)):
+        return False
+    try:
+        return float(value) == value
+    except OverflowError:
+        return False
+
+
+def to_point(points: np.ndarray, index: int, context: Context) -> Point:
+    x, y = points[index].tolist()
+    return context.point_cls(x, y)
@@ -0,0 +1,94 @@
+"""
+Spatial join of geometries collections.
+
+Contours are treated as linear geometries,
+to relate them as regions pass ones prepared with ``orient.prepared.prepare``.
+"""
+from typing import (Iterable as _Iterable,
+                    Iterator as _Iterator,
+                    Optional as _Optional,
+                    Sequence as _Sequence,
+                    Tuple as _Tuple,
+                    Union as _Union)
+
+from ground.base import (Context as _Context,
+                         Relation as _Relation,
+                         get_context as _get_context)
+from ground.hints import (Contour as _Contour,
+                          Multipolygon as _Multipolygon,
+                          Multisegment as _Multisegment,
+                          Polygon as _Polygon,
+                          Segment as _Segment)
+
+from .core import join as _join
+from .prepared import Prepared as _Prepared
+
+Geometry = _Union[_Contour, _Multipolygon, _Multisegment, _Polygon,
+                  _Prepared, _Segment]
+
+
+def relate_pairs(tests: _Iterable[Geometry],
+                 goals: _Sequence[Geometry],
+                 *,
+                 skip_disjoint: bool = True,
+                 context: _Optional[_Context] = None
+                 ) -> _Iterator[_Tuple[int, int, _Relation]]:
+    """
+    Finds relations between each test geometry and each goal geometry.
+
+    Goals are prepared & indexed by their bounding boxes once,
+    so only pairs with intersecting boxes get related,
+    tests are consumed lazily one by one.
+    Relation of a pair is the same as the one given
+    by corresponding function from ``orient.planar``
+    with the test as the first argument & the goal as the second one
+    (or complement of the relation of goal in test
+    if there is no such function).
+
+    Time complexity:
+        ``O(goals_size * log goals_size
+        + sum(log goals_count + candidates_count * relation_cost))``
+        where summation is over tests,
+        ``candidates_count`` is a number of goals
+        with bounding boxes intersecting test's one
+    Memory complexity:
+        ``O(goals_size)``
+
+    where ``goals_size`` is a total number of goals vertices/segments,
+    ``goals_count = len(goals)``.
+
+    :param tests: geometries to check for.
+    :param goals: geometries to check in.
+    :param skip_disjoint:
+        flag which determines whether to omit disjoint pairs.
+    :param context: geometric context.
+    :returns:
+        iterator over triplets of test index, goal index & their relation
+        ordered by test index, then by goal index.
+
+    >>> from ground.base import Relation, get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> Segment = context.segment_cls
+    >>> left_square = Polygon(Contour([Point(0, 0), Point(2, 0), Point(2, 2),
+    ...                                Point(0, 2)]), [])
+    >>> right_square = Polygon(Contour([Point(2, 0), Point(4, 0),
+    ...                                 Point(4, 2), Point(2, 2)]), [])
+    >>> tests = [Segment(Point(1, 1), Point(3, 1)),
+    ...          Segment(Point(5, 5), Point(6, 6)),
+    ...          Segment(Point(0, 0), Point(4, 0))]
+    >>> list(relate_pairs(tests, [left_square, right_square])) == [
+    ...     (0, 0, Relation.CROSS), (0, 1, Relation.CROSS),
+    ...     (2, 0, Relation.TOUCH), (2, 1, Relation.TOUCH)
+    ... ]
+    True
+    >>> list(relate_pairs(tests[1:2], [left_square, right_square],
+    ...                   skip_disjoint=False)) == [
+    ...     (0, 0, Relation.DISJOINT), (0, 1, Relation.DISJOINT)
+    ... ]
+    True
+    """
+    return _join.relate_pairs(tests, goals, skip_disjoint,
+                              _get_context() if context is None else context)
@@ -0,0 +1,152 @@
+"""
+Relation of batches of geometries pairs in parallel.
+
+Pure ``Python`` relations are bound by the global interpreter lock,
+so batches are split into chunks which are related in worker processes,
+or in worker threads on free-threaded builds of ``CPython``
+where it avoids pickling of geometries.
+Settings from ``orient.sweep_line`` of the current context
+are propagated to workers.
+
+Relations do not mutate geometries
+and lazy indices of prepared geometries are assigned only once built,
+so concurrent calls with the same (prepared) goal geometry are safe.
+"""
+from os import cpu_count as _cpu_count
+from typing import (Iterable as _Iterable,
+                    List as _List,
+                    Optional as _Optional,
+                    Tuple as _Tuple)
+
+from ground.base import (Context as _Context,
+                         Relation as _Relation,
+                         get_context as _get_context)
+
+from .core import parallel as _parallel
+from .join import Geometry
+
+
+def relate_many(pairs: _Iterable[_Tuple[Geometry, Geometry]],
+                *,
+                workers: _Optional[int] = None,
+                chunk_size: _Optional[int] = None,
+                context: _Optional[_Context] = None) -> _List[_Relation]:
+    """
+    Finds relations of test geometries with goal geometries
+    in pairs of ``(test, goal)`` using pool of worker processes.
+
+    Each distinct (by identity) goal is shipped to workers
+    & prepared there once at their start,
+    while tests are dispatched in chunks along with indices of their goals,
+    so batches relating many tests to few goals
+    (e.g. polygons to multipolygon) transfer goals only once per worker.
+    Relation of a pair is the same as the one given
+    by ``orient.join.relate_pairs`` for it.
+
+    Time complexity:
+        ``O(sum(relation_cost) / workers + goals_size * workers)``
+    Memory complexity:
+        ``O(pairs_size + goals_size * workers)``
+
+    where ``pairs_size`` is a total number of tests vertices/segments,
+    ``goals_size`` is a total number of distinct goals vertices/segments.
+
+    :param pairs: pairs of geometries to check for and to check in.
+    :param workers:
+        number of worker processes, defaults to the number of processors,
+        with single worker pairs are related in the current process.
+    :param chunk_size:
+        number of pairs sent to a worker at once,
+        defaults to the value which gives four chunks per worker.
+    :param context: geometric context.
+    :returns: relations of pairs in the same order.
+
+    >>> from ground.base import Relation, get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> Segment = context.segment_cls
+    >>> square = Polygon(Contour([Point(0, 0), Point(2, 0), Point(2, 2),
+    ...                           Point(0, 2)]), [])
+    >>> segments = [Segment(Point(1, 1), Point(3, 1)),
+    ...             Segment(Point(5, 5), Point(6, 6)),
+    ...             Segment(Point(0, 0), Point(2, 0))]
+    >>> relate_many([(segment, square) for segment in segments],
+    ...             workers=2) == [Relation.CROSS, Relation.DISJOINT,
+    ...                            Relation.COMPONENT]
+    True
+    """
+    workers, chunk_size = _to_workers_settings(workers, chunk_size)
+    return _parallel.relate_many(pairs, workers, chunk_size,
+                                 _get_context() if context is None
+                                 else context)
+
+
+def relate_many_in_threads(pairs: _Iterable[_Tuple[Geometry, Geometry]],
+                           *,
+                           workers: _Optional[int] = None,
+                           chunk_size: _Optional[int] = None,
+                           context: _Optional[_Context] = None
+                           ) -> _List[_Relation]:
+    """
+    Finds relations of test geometries with goal geometries
+    in pairs of ``(test, goal)`` using pool of worker threads.
+
+    Works as ``orient.parallel.relate_many``,
+    but goals are prepared once in the current process
+    & shared by threads without copying,
+    so it scales with workers only on free-threaded builds of ``CPython``.
+
+    Time complexity:
+        ``O(sum(relation_cost) / workers + goals_size)``
+    Memory complexity:
+        ``O(goals_size + len(pairs))``
+
+    where ``goals_size`` is a total number of distinct goals vertices/segments.
+
+    :param pairs: pairs of geometries to check for and to check in.
+    :param workers:
+        number of worker threads, defaults to the number of processors,
+        with single worker pairs are related in the current thread.
+    :param chunk_size:
+        number of pairs sent to a worker at once,
+        defaults to the value which gives four chunks per worker.
+    :param context: geometric context.
+    :returns: relations of pairs in the same order.
+
+    >>> from ground.base import Relation, get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> Segment = context.segment_cls
+    >>> square = Polygon(Contour([Point(0, 0), Point(2, 0), Point(2, 2),
+    ...                           Point(0, 2)]), [])
+    >>> segments = [Segment(Point(1, 1), Point(3, 1)),
+    ...             Segment(Point(5, 5), Point(6, 6)),
+    ...             Segment(Point(0, 0), Point(2, 0))]
+    >>> relate_many_in_threads([(segment, square) for segment in segments],
+    ...                        workers=2) == [Relation.CROSS,
+    ...                                       Relation.DISJOINT,
+    ...                                       Relation.COMPONENT]
+    True
+    """
+    workers, chunk_size = _to_workers_settings(workers, chunk_size)
+    return _parallel.relate_many_in_threads(pairs, workers, chunk_size,
+                                            _get_context() if context is None
+                                            else context)
+
+
+def _to_workers_settings(workers: _Optional[int],
+                         chunk_size: _Optional[int]
+                         ) -> _Tuple[int, _Optional[int]]:
+    if workers is None:
+        workers = _cpu_count() or 1
+    if workers < 1:
+        raise ValueError('Number of workers should be positive, '
+                         'but got {!r}.'.format(workers))
+    if chunk_size is not None and chunk_size < 1:
+        raise ValueError('Chunk size should be positive, '
+                         'but got {!r}.'.format(chunk_size))
+    return workers, chunk_size
@@ -0,0 +1,216 @@
+"""
+Boolean predicates which stop sweeping
+as soon as the answer is decided.
+
+Contours are treated as linear geometries,
+to check them as regions pass ones prepared with ``orient.prepared.prepare``.
+"""
+from typing import Optional as _Optional
+
+from ground.base import (Context as _Context,
+                         get_context as _get_context)
+
+from .core import predicates as _predicates
+from .join import Geometry as _Geometry
+
+
+def intersects(test: _Geometry, goal: _Geometry,
+               *,
+               context: _Optional[_Context] = None) -> bool:
+    """
+    Checks if test geometry has common points with goal geometry.
+
+    Time complexity:
+        ``O(elements_count * log elements_count)`` in the worst case,
+        where ``elements_count`` is a total number of geometries
+        vertices/segments
+    Memory complexity:
+        ``O(elements_count)``
+
+    :param test: geometry to check for.
+    :param goal: geometry to check in.
+    :param context: geometric context.
+    :returns: true if geometries intersect, false otherwise.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> Segment = context.segment_cls
+    >>> square = Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                           Point(0, 4)]), [])
+    >>> intersects(Segment(Point(1, 1), Point(5, 5)), square)
+    True
+    >>> intersects(Segment(Point(4, 4), Point(5, 5)), square)
+    True
+    >>> intersects(Segment(Point(5, 5), Point(6, 6)), square)
+    False
+    """
+    return _predicates.relation_in(
+            goal, test, _predicates.INTERSECTING_RELATIONS,
+            _get_context() if context is None else context
+    )
+
+
+def disjoint(test: _Geometry, goal: _Geometry,
+             *,
+             context: _Optional[_Context] = None) -> bool:
+    """
+    Checks if test geometry has no common points with goal geometry.
+
+    Time complexity:
+        ``O(elements_count * log elements_count)`` in the worst case,
+        where ``elements_count`` is a total number of geometries
+        vertices/segments
+    Memory complexity:
+        ``O(elements_count)``
+
+    :param test: geometry to check for.
+    :param goal: geometry to check in.
+    :param context: geometric context.
+    :returns: true if geometries are disjoint, false otherwise.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> Segment = context.segment_cls
+    >>> square = Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                           Point(0, 4)]), [])
+    >>> disjoint(Segment(Point(1, 1), Point(5, 5)), square)
+    False
+    >>> disjoint(Segment(Point(4, 4), Point(5, 5)), square)
+    False
+    >>> disjoint(Segment(Point(5, 5), Point(6, 6)), square)
+    True
+    """
+    return _predicates.relation_in(
+            goal, test, _predicates.DISJOINT_RELATIONS,
+            _get_context() if context is None else context
+    )
+
+
+def touches(test: _Geometry, goal: _Geometry,
+            *,
+            context: _Optional[_Context] = None) -> bool:
+    """
+    Checks if test geometry touches goal geometry,
+    i.e. their relation is ``ground.base.Relation.TOUCH``.
+
+    Time complexity:
+        ``O(elements_count * log elements_count)`` in the worst case,
+        where ``elements_count`` is a total number of geometries
+        vertices/segments
+    Memory complexity:
+        ``O(elements_count)``
+
+    :param test: geometry to check for.
+    :param goal: geometry to check in.
+    :param context: geometric context.
+    :returns: true if test geometry touches goal one, false otherwise.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> Segment = context.segment_cls
+    >>> square = Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                           Point(0, 4)]), [])
+    >>> touches(Segment(Point(1, 1), Point(5, 5)), square)
+    False
+    >>> touches(Segment(Point(4, 4), Point(5, 5)), square)
+    True
+    >>> touches(Segment(Point(5, 5), Point(6, 6)), square)
+    False
+    """
+    return _predicates.relation_in(
+            goal, test, _predicates.TOUCHING_RELATIONS,
+            _get_context() if context is None else context
+    )
+
+
+def within(test: _Geometry, goal: _Geometry,
+           *,
+           context: _Optional[_Context] = None) -> bool:
+    """
+    Checks if test geometry is a subset of goal geometry,
+    i.e. their relation is one of ``ground.base.Relation.EQUAL``,
+    ``ground.base.Relation.COMPONENT``, ``ground.base.Relation.ENCLOSED``
+    or ``ground.base.Relation.WITHIN``.
+
+    Time complexity:
+        ``O(elements_count * log elements_count)`` in the worst case,
+        where ``elements_count`` is a total number of geometries
+        vertices/segments
+    Memory complexity:
+        ``O(elements_count)``
+
+    :param test: geometry to check for.
+    :param goal: geometry to check in.
+    :param context: geometric context.
+    :returns: true if test geometry lies within goal one, false otherwise.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> Segment = context.segment_cls
+    >>> square = Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                           Point(0, 4)]), [])
+    >>> within(Segment(Point(0, 0), Point(4, 0)), square)
+    True
+    >>> within(Segment(Point(1, 1), Point(3, 3)), square)
+    True
+    >>> within(Segment(Point(1, 1), Point(5, 5)), square)
+    False
+    """
+    return _predicates.relation_in(
+            goal, test, _predicates.WITHIN_RELATIONS,
+            _get_context() if context is None else context
+    )
+
+
+def covers(test: _Geometry, goal: _Geometry,
+           *,
+           context: _Optional[_Context] = None) -> bool:
+    """
+    Checks if goal geometry is a subset of test geometry,
+    i.e. their relation is one of ``ground.base.Relation.EQUAL``,
+    ``ground.base.Relation.COMPOSITE``, ``ground.base.Relation.ENCLOSES``
+    or ``ground.base.Relation.COVER``.
+
+    Time complexity:
+        ``O(elements_count * log elements_count)`` in the worst case,
+        where ``elements_count`` is a total number of geometries
+        vertices/segments
+    Memory complexity:
+        ``O(elements_count)``
+
+    :param test: geometry to check for.
+    :param goal: geometry to check in.
+    :param context: geometric context.
+    :returns: true if test geometry covers goal one, false otherwise.
+
+    >>> from ground.base import get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> Segment = context.segment_cls
+    >>> square = Polygon(Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                           Point(0, 4)]), [])
+    >>> covers(square, Segment(Point(0, 0), Point(4, 0)))
+    True
+    >>> covers(square, Segment(Point(1, 1), Point(3, 3)))
+    True
+    >>> covers(square, Segment(Point(1, 1), Point(5, 5)))
+    False
+    """
+    return _predicates.relation_in(
+            goal, test, _predicates.COVERING_RELATIONS,
+            _get_context() if context is None else context
+    )
@@ -0,0 +1,142 @@
+from typing import (Optional as _Optional,
+                    Tuple as _Tuple,
+                    Union as _Union)
+
+from ground.base import (Context as _Context,
+                         Location as _Location,
+                         get_context as _get_context)
+from ground.hints import (Multipolygon as _Multipolygon,
+                          Point as _Point,
+                          Polygon as _Polygon)
+
+from .core import multipolygon as _multipolygon
+from .core.prepared import (PreparedMultipolygon,
+                            PreparedPolygon,
+                            PreparedRegion)
+from .hints import Region as _Region
+
+Prepared = _Union[PreparedMultipolygon, PreparedPolygon, PreparedRegion]
+
+
+def prepare(geometry: _Union[_Multipolygon, _Polygon, _Region],
+            *,
+            context: _Optional[_Context] = None) -> Prepared:
+    """
+    Prepares region, polygon or multipolygon for repeated queries.
+
+    Prepared geometry caches its derived structures
+    (bounding boxes, orientations & edges),
+    builds on demand index of regions edges by their ``y``-coordinates
+    (so point location takes ``O(log vertices_count + crossed_edges_count)``)
+    & trapezoidal map of multipolygons edges
+    (so point location takes ``O(log vertices_count)`` expected time)
+    and can be passed instead of original geometry
+    to any function from ``orient.planar`` as a goal
+    (the second argument).
+    The same context should be used for preparation and queries.
+
+    Time complexity:
+        ``O(vertices_count)``
+    Memory complexity:
+        ``O(vertices_count)``
+
+    where ``vertices_count`` is a total number of geometry vertices.
+
+    :param geometry: region, polygon or multipolygon to prepare.
+    :param context: geometric context.
+    :returns: prepared geometry.
+
+    >>> from ground.base import Location, get_context
+    >>> from orient.planar import point_in_polygon
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> outer_square = Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                         Point(0, 4)])
+    >>> inner_square = Contour([Point(1, 1), Point(3, 1), Point(3, 3),
+    ...                         Point(1, 3)])
+    >>> polygon = prepare(Polygon(outer_square, [inner_square]))
+    >>> isinstance(polygon, PreparedPolygon)
+    True
+    >>> point_in_polygon(Point(0, 0), polygon) is Location.BOUNDARY
+    True
+    >>> point_in_polygon(Point(1, 2), polygon) is Location.BOUNDARY
+    True
+    >>> point_in_polygon(Point(2, 2), polygon) is Location.EXTERIOR
+    True
+    >>> point_in_polygon(Point(2, 4), polygon) is Location.BOUNDARY
+    True
+    >>> point_in_polygon(Point(5, 5), polygon) is Location.EXTERIOR
+    True
+    """
+    if isinstance(geometry, (PreparedMultipolygon, PreparedPolygon,
+                             PreparedRegion)):
+        return geometry
+    context = _get_context() if context is None else context
+    if hasattr(geometry, 'polygons'):
+        return PreparedMultipolygon(geometry, context)
+    elif hasattr(geometry, 'border'):
+        return PreparedPolygon(geometry, context)
+    elif hasattr(geometry, 'vertices'):
+        return PreparedRegion(geometry, context)
+    raise TypeError('Expected region, polygon or multipolygon, '
+                    'but got {!r}.'.format(geometry))
+
+
+def locate_point_in_multipolygon(point: _Point,
+                                 multipolygon: _Multipolygon,
+                                 *,
+                                 context: _Optional[_Context] = None
+                                 ) -> _Tuple[_Optional[int], _Location]:
+    """
+    Finds index of the first polygon of multipolygon
+    which contains point (if any) along with location of point.
+
+    Time complexity:
+        ``O(log vertices_count)`` expected for prepared multipolygon,
+        ``O(vertices_count)`` otherwise
+    Memory complexity:
+        ``O(1)``
+
+    where ``vertices_count = sum(len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)\
+ for polygon in multipolygon.polygons)``.
+
+    :param point: point to check for.
+    :param multipolygon: multipolygon to check in.
+    :param context: geometric context.
+    :returns: index of the polygon (or ``None``) & location of point.
+
+    >>> from ground.base import Location, get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Multipolygon = context.multipolygon_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> left_square = Contour([Point(0, 0), Point(1, 0), Point(1, 1),
+    ...                        Point(0, 1)])
+    >>> right_square = Contour([Point(1, 1), Point(2, 1), Point(2, 2),
+    ...                         Point(1, 2)])
+    >>> multipolygon = prepare(Multipolygon([Polygon(left_square, []),
+    ...                                      Polygon(right_square, [])]))
+    >>> (locate_point_in_multipolygon(Point(0, 0), multipolygon)
+    ...  == (0, Location.BOUNDARY))
+    True
+    >>> (locate_point_in_multipolygon(Point(1, 1), multipolygon)
+    ...  == (0, Location.BOUNDARY))
+    True
+    >>> (locate_point_in_multipolygon(Point(2, 2), multipolygon)
+    ...  == (1, Location.BOUNDARY))
+    True
+    >>> (locate_point_in_multipolygon(Point(1.5, 1.5), multipolygon)
+    ...  == (1, Location.INTERIOR))
+    True
+    >>> (locate_point_in_multipolygon(Point(0, 2), multipolygon)
+    ...  == (None, Location.EXTERIOR))
+    True
+    """
+    return _multipolygon._locate_point(
+            multipolygon, point,
+            _get_context() if context is None else context
+    )
@@ -0,0 +1,75 @@
+"""
+Relation of streams of geometries with a fixed goal geometry.
+
+Streams are consumed lazily in chunks,
+so unbounded streams are related with memory bounded by the chunk size.
+"""
+from typing import (Iterable as _Iterable,
+                    Iterator as _Iterator,
+                    Optional as _Optional)
+
+from ground.base import (Context as _Context,
+                         Relation as _Relation,
+                         get_context as _get_context)
+
+from .core import stream as _stream
+from .join import Geometry
+
+
+def relate_stream(goal: Geometry,
+                  tests: _Iterable[Geometry],
+                  *,
+                  chunk_size: int = 1,
+                  context: _Optional[_Context] = None
+                  ) -> _Iterator[_Relation]:
+    """
+    Finds relations of test geometries from the stream with goal geometry.
+
+    Goal is prepared once,
+    tests are consumed lazily by chunks
+    whose bounding boxes are checked against goal's one at once,
+    so tests with disjoint boxes are skipped without relating.
+    Relation of a test is the same as the one given
+    by ``orient.join.relate_pairs`` for it.
+
+    Time complexity:
+        ``O(goal_size + sum(relation_cost))``
+    Memory complexity:
+        ``O(goal_size + chunk_size * test_size)``
+
+    where ``goal_size`` is a number of goal vertices/segments,
+    ``test_size`` is the largest number of test vertices/segments,
+    summation is over tests.
+
+    :param goal: geometry to check in.
+    :param tests: geometries to check for.
+    :param chunk_size:
+        number of tests read ahead from the stream,
+        with default value each test is read only when its relation
+        is requested.
+    :param context: geometric context.
+    :returns: iterator over relations of tests in the same order.
+
+    >>> from ground.base import Relation, get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> Segment = context.segment_cls
+    >>> square = Polygon(Contour([Point(0, 0), Point(2, 0), Point(2, 2),
+    ...                           Point(0, 2)]), [])
+    >>> segments = (Segment(Point(index, 1), Point(index + 1, 1))
+    ...             for index in range(-1, 3))
+    >>> list(relate_stream(square, segments,
+    ...                    chunk_size=2)) == [Relation.TOUCH,
+    ...                                       Relation.ENCLOSED,
+    ...                                       Relation.ENCLOSED,
+    ...                                       Relation.TOUCH]
+    True
+    """
+    if chunk_size < 1:
+        raise ValueError('Chunk size should be positive, '
+                         'but got {!r}.'.format(chunk_size))
+    return _stream.relate_stream(goal, tests, chunk_size,
+                                 _get_context() if context is None
+                                 else context)
@@ -0,0 +1,253 @@
+"""
+Settings of sweeps used by sweep-based relations:
+selection of the sweep line status structure,
+registration of segments in monotone chains,
+relation of polygons in a single combined sweep
+and suspension of garbage collection while sweeping.
+
+With monotone chains consecutive segments of contours
+with the left endpoint of each segment being the right endpoint
+of the previous one are registered lazily:
+the next segment of the chain is added to the events queue
+only when the sweep reaches its left endpoint,
+so the queue holds a single segment per chain
+and segments beyond the point where the sweep stops are never added.
+
+With combined sweep polygons' borders and holes are registered
+as a single oriented compound geometry
+and the relation is decided in one sweep,
+instead of relating borders first
+and sweeping holes only if borders do not decide the relation.
+
+Events of a sweep are stored in arrays without reference cycles,
+so suspending the cyclic garbage collector while sweeping
+only saves time spent on its traversals of live objects.
+
+Settings are stored in context variables,
+so they are local to the current thread and asynchronous task.
+"""
+from contextlib import contextmanager as _contextmanager
+from typing import Iterator as _Iterator
+
+from .core.enums import SweepLineKind
+from .core.monotone_chains import monotone_chains as _monotone_chains
+from .core.polygon import combined_sweep as _combined_sweep
+from .core.processing import gc_suspension as _gc_suspension
+from .core.sweep_line import sweep_line_kind as _sweep_line_kind
+
+
+def get_combined_sweep() -> bool:
+    """
+    Checks if polygons are related in a single combined sweep
+    in the current context.
+
+    >>> get_combined_sweep()
+    False
+    """
+    return _combined_sweep.get()
+
+
+def get_gc_suspension() -> bool:
+    """
+    Checks if garbage collection is suspended
+    while sweeping in the current context.
+
+    >>> get_gc_suspension()
+    False
+    """
+    return _gc_suspension.get()
+
+
+def get_monotone_chains() -> bool:
+    """
+    Checks if segments are registered in monotone chains
+    in the current context.
+
+    >>> get_monotone_chains()
+    False
+    """
+    return _monotone_chains.get()
+
+
+def get_sweep_line_kind() -> SweepLineKind:
+    """
+    Returns kind of sweep line used in the current context.
+
+    >>> get_sweep_line_kind() is SweepLineKind.RED_BLACK_TREE
+    True
+    """
+    return _sweep_line_kind.get()
+
+
+def set_combined_sweep(enabled: bool) -> None:
+    """
+    Sets whether polygons are related in a single combined sweep
+    in the current context.
+
+    :param enabled: flag of combined sweep.
+
+    >>> set_combined_sweep(True)
+    >>> get_combined_sweep()
+    True
+    >>> set_combined_sweep(False)
+    """
+    _combined_sweep.set(bool(enabled))
+
+
+def set_gc_suspension(enabled: bool) -> None:
+    """
+    Sets whether garbage collection is suspended
+    while sweeping in the current context.
+
+    :param enabled: flag of suspension.
+
+    >>> set_gc_suspension(True)
+    >>> get_gc_suspension()
+    True
+    >>> set_gc_suspension(False)
+    """
+    _gc_suspension.set(bool(enabled))
+
+
+def set_monotone_chains(enabled: bool) -> None:
+    """
+    Sets whether segments are registered in monotone chains
+    in the current context.
+
+    :param enabled: flag of registration in monotone chains.
+
+    >>> set_monotone_chains(True)
+    >>> get_monotone_chains()
+    True
+    >>> set_monotone_chains(False)
+    """
+    _monotone_chains.set(bool(enabled))
+
+
+def set_sweep_line_kind(kind: SweepLineKind) -> None:
+    """
+    Sets kind of sweep line used in the current context.
+
+    :param kind: kind of sweep line to use.
+
+    >>> set_sweep_line_kind(SweepLineKind.SORTED_BLOCKS)
+    >>> get_sweep_line_kind() is SweepLineKind.SORTED_BLOCKS
+    True
+    >>> set_sweep_line_kind(SweepLineKind.RED_BLACK_TREE)
+    """
+    _sweep_line_kind.set(SweepLineKind(kind))
+
+
+@_contextmanager
+def combined_sweep(enabled: bool = True) -> _Iterator[None]:
+    """
+    Sets whether polygons are related in a single combined sweep
+    for calls inside the ``with`` block.
+
+    :param enabled: flag of combined sweep.
+
+    >>> from ground.base import Relation, get_context
+    >>> from orient.planar import polygon_in_polygon
+    >>> context = get_context()
+    >>> Contour, Point, Polygon = (context.contour_cls, context.point_cls,
+    ...                            context.polygon_cls)
+    >>> outer_square = Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                         Point(0, 4)])
+    >>> inner_square = Contour([Point(1, 1), Point(3, 1), Point(3, 3),
+    ...                         Point(1, 3)])
+    >>> with combined_sweep():
+    ...     (polygon_in_polygon(Polygon(inner_square, []),
+    ...                         Polygon(outer_square, [inner_square]))
+    ...      is Relation.TOUCH)
+    True
+    >>> get_combined_sweep()
+    False
+    """
+    token = _combined_sweep.set(bool(enabled))
+    try:
+        yield
+    finally:
+        _combined_sweep.reset(token)
+
+
+@_contextmanager
+def gc_suspension(enabled: bool = True) -> _Iterator[None]:
+    """
+    Sets whether garbage collection is suspended
+    while sweeping for calls inside the ``with`` block.
+
+    :param enabled: flag of suspension.
+
+    >>> from ground.base import Relation, get_context
+    >>> from orient.planar import contour_in_contour
+    >>> context = get_context()
+    >>> Contour, Point = context.contour_cls, context.point_cls
+    >>> square = Contour([Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 2)])
+    >>> shifted_square = Contour([Point(1, 1), Point(3, 1), Point(3, 3),
+    ...                           Point(1, 3)])
+    >>> with gc_suspension():
+    ...     contour_in_contour(shifted_square, square) is Relation.CROSS
+    True
+    >>> get_gc_suspension()
+    False
+    """
+    token = _gc_suspension.set(bool(enabled))
+    try:
+        yield
+    finally:
+        _gc_suspension.reset(token)
+
+
+@_contextmanager
+def monotone_chains(enabled: bool = True) -> _Iterator[None]:
+    """
+    Sets whether segments are registered in monotone chains
+    for calls inside the ``with`` block.
+
+    :param enabled: flag of registration in monotone chains.
+
+    >>> from ground.base import Relation, get_context
+    >>> from orient.planar import contour_in_contour
+    >>> context = get_context()
+    >>> Contour, Point = context.contour_cls, context.point_cls
+    >>> square = Contour([Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 2)])
+    >>> shifted_square = Contour([Point(1, 1), Point(3, 1), Point(3, 3),
+    ...                           Point(1, 3)])
+    >>> with monotone_chains():
+    ...     contour_in_contour(shifted_square, square) is Relation.CROSS
+    True
+    >>> get_monotone_chains()
+    False
+    """
+    token = _monotone_chains.set(bool(enabled))
+    try:
+        yield
+    finally:
+        _monotone_chains.reset(token)
+
+
+@_contextmanager
+def sweep_line_kind(kind: SweepLineKind) -> _Iterator[None]:
+    """
+    Uses given kind of sweep line for calls inside the ``with`` block.
+
+    :param kind: kind of sweep line to use.
+
+    >>> from ground.base import Relation, get_context
+    >>> from orient.planar import contour_in_contour
+    >>> context = get_context()
+    >>> Contour, Point = context.contour_cls, context.point_cls
+    >>> square = Contour([Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 2)])
+    >>> shifted_square = Contour([Point(1, 1), Point(3, 1), Point(3, 3),
+    ...                           Point(1, 3)])
+    >>> with sweep_line_kind(SweepLineKind.SORTED_BLOCKS):
+    ...     contour_in_contour(shifted_square, square) is Relation.CROSS
+    True
+    >>> get_sweep_line_kind() is SweepLineKind.RED_BLACK_TREE
+    True
+    """
+    token = _sweep_line_kind.set(SweepLineKind(kind))
+    try:
+        yield
+    finally:
+        _sweep_line_kind.reset(token)
@@ -0,0 +1,117 @@
+"""
+Batch versions of point location queries over ``numpy`` arrays.
+
+Requires ``numpy`` to be installed (e.g. with ``orient[vectorized]`` extra).
+Locations are encoded with values of ``ground.base.Location`` members.
+"""
+from typing import Optional as _Optional
+
+import numpy as _np
+from ground.base import (Context as _Context,
+                         get_context as _get_context)
+from ground.hints import Polygon as _Polygon
+
+from .core import vectorized as _vectorized
+from .hints import Region as _Region
+
+
+def points_in_region(points: _np.ndarray, region: _Region,
+                     *,
+                     context: _Optional[_Context] = None) -> _np.ndarray:
+    """
+    Finds locations of points in region.
+
+    Gives the same results as ``orient.planar.point_in_region``
+    applied to each point.
+
+    Time complexity:
+        ``O(points_count * vertices_count)``
+    Memory complexity:
+        ``O(points_count)``
+
+    where ``points_count = len(points)``,
+    ``vertices_count = len(region.vertices)``.
+
+    :param points: array of points coordinates with shape
+        ``(points_count, 2)``.
+    :param region: region to check in.
+    :param context: geometric context.
+    :returns: ``numpy.uint8`` array of locations codes of points in region.
+
+    >>> import numpy as np
+    >>> from ground.base import Location, get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> square = Contour([Point(0, 0), Point(2, 0), Point(2, 2), Point(0, 2)])
+    >>> locations = points_in_region(np.array([[0, 0], [1, 1], [3, 3]]),
+    ...                              square)
+    >>> [Location(code) for code in locations] == [Location.BOUNDARY,
+    ...                                            Location.INTERIOR,
+    ...                                            Location.EXTERIOR]
+    True
+    """
+    return _vectorized.locate_points_in_region(
+            region, _to_points_array(points),
+            _get_context() if context is None else context
+    )
+
+
+def points_in_polygon(points: _np.ndarray, polygon: _Polygon,
+                      *,
+                      context: _Optional[_Context] = None) -> _np.ndarray:
+    """
+    Finds locations of points in polygon.
+
+    Gives the same results as ``orient.planar.point_in_polygon``
+    applied to each point.
+
+    Time complexity:
+        ``O(points_count * vertices_count)``
+    Memory complexity:
+        ``O(points_count)``
+
+    where ``points_count = len(points)``,
+    ``vertices_count = len(polygon.border.vertices)\
+ + sum(len(hole.vertices) for hole in polygon.holes)``.
+
+    :param points: array of points coordinates with shape
+        ``(points_count, 2)``.
+    :param polygon: polygon to check in.
+    :param context: geometric context.
+    :returns: ``numpy.uint8`` array of locations codes of points in polygon.
+
+    >>> import numpy as np
+    >>> from ground.base import Location, get_context
+    >>> context = get_context()
+    >>> Contour = context.contour_cls
+    >>> Point = context.point_cls
+    >>> Polygon = context.polygon_cls
+    >>> outer_square = Contour([Point(0, 0), Point(4, 0), Point(4, 4),
+    ...                         Point(0, 4)])
+    >>> inner_square = Contour([Point(1, 1), Point(3, 1), Point(3, 3),
+    ...                         Point(1, 3)])
+    >>> locations = points_in_polygon(
+    ...     np.array([[0., 0.], [.5, .5], [1., 2.], [2., 2.], [5., 5.]]),
+    ...     Polygon(outer_square, [inner_square])
+    ... )
+    >>> [Location(code) for code in locations] == [
+    ...     Location.BOUNDARY, Location.INTERIOR, Location.BOUNDARY,
+    ...     Location.EXTERIOR, Location.EXTERIOR
+    ... ]
+    True
+    """
+    return _vectorized.locate_points_in_polygon(
+            polygon, _to_points_array(points),
+            _get_context() if context is None else context
+    )
+
+
+def _to_points_array(points: _np.ndarray) -> _np.ndarray:
+    result = _np.asarray(points)
+    if result.ndim != 2 or result.shape[1] != 2:
+        if result.size == 0:
+            return result.reshape(0, 2)
+        raise ValueError('Expected array of shape (points_count, 2), '
+                         'but got {}.'.format(result.shape))
+    return result
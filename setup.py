@@ -4,6 +4,7 @@ from setuptools import (find_packages,
 project_base_url = 'https://github.com/lycantropos/orient/'
 
 
-setup(packages=find_packages(exclude=('tests', 'tests.*')),
+setup(packages=find_packages(exclude=('benchmarks', 'benchmarks.*',
+                                     'tests', 'tests.*')),
       url=project_base_url,
       download_url=project_base_url + 'archive/master.zip')
@@ -0,0 +1,6 @@
+from hypothesis import strategies
+
+from tests.parallel_tests.strategies import pairs
+
+pairs = pairs
+chunks_sizes = strategies.integers(1, 5)
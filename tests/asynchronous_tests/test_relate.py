@@ -0,0 +1,21 @@
+import asyncio
+from typing import (List,
+                    Tuple)
+
+from ground.base import Relation
+from hypothesis import given
+
+from orient.asynchronous import relate
+from orient.join import Geometry
+from orient.parallel import relate_many
+from . import strategies
+
+
+@given(strategies.pairs)
+def test_connection_with_parallel(pairs: List[Tuple[Geometry, Geometry]]
+                                  ) -> None:
+    async def relate_all() -> List[Relation]:
+        return [await relate(test, goal) for test, goal in pairs]
+
+    assert asyncio.run(relate_all()) == relate_many(pairs,
+                                                    workers=1)
@@ -0,0 +1,60 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import (List,
+                    Tuple)
+
+from ground.base import get_context
+from hypothesis import given
+
+from orient.asynchronous import relate_many
+from orient.join import Geometry
+from orient.parallel import relate_many as relate_many_in_processes
+from . import strategies
+
+
+@given(strategies.pairs, strategies.chunks_sizes)
+def test_connection_with_parallel(pairs: List[Tuple[Geometry, Geometry]],
+                                  chunk_size: int) -> None:
+    result = asyncio.run(relate_many(iter(pairs),
+                                     chunk_size=chunk_size))
+
+    assert result == relate_many_in_processes(pairs,
+                                              workers=1)
+
+
+def test_interleaving() -> None:
+    context = get_context()
+    Contour, Multipolygon, Point, Polygon = (context.contour_cls,
+                                             context.multipolygon_cls,
+                                             context.point_cls,
+                                             context.polygon_cls)
+
+    def to_square(x: int, y: int, size: int) -> Polygon:
+        return Polygon(Contour([Point(x, y), Point(x + size, y),
+                                Point(x + size, y + size),
+                                Point(x, y + size)]), [])
+
+    goal = Multipolygon([to_square(4 * x, 4 * y, 3)
+                         for x in range(10)
+                         for y in range(10)])
+    pairs = [(to_square(index % 40, index // 40, 2), goal)
+             for index in range(1000)]
+
+    async def run() -> Tuple[bool, bool]:
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(1) as executor:
+            batch = asyncio.ensure_future(relate_many(pairs,
+                                                      executor=executor,
+                                                      chunk_size=1))
+            await asyncio.sleep(0.01)
+            job = loop.run_in_executor(executor, lambda: None)
+            await asyncio.wait([batch, job],
+                               return_when=asyncio.FIRST_COMPLETED)
+            job_done, batch_done = job.done(), batch.done()
+            await batch
+            return job_done, batch_done
+
+    job_done, batch_done = asyncio.run(run())
+
+    assert job_done
+    assert not batch_done
@@ -0,0 +1,58 @@
+from typing import (Any,
+                    Dict)
+
+from benchmarks.comparison import (compare,
+                                   to_regressions)
+
+
+def to_report(*results: Any) -> Dict[str, Any]:
+    return {'results': [{'function': function_name,
+                         'shape': shape,
+                         'size': size,
+                         'seconds': seconds}
+                        for function_name, shape, size, seconds in results]}
+
+
+def test_compare() -> None:
+    baseline = to_report(('point_in_region', 'convex', 10, 2.),
+                         ('point_in_region', 'convex', 1000, 4.),
+                         ('region_in_region', 'star', 10, 1.))
+    current = to_report(('point_in_region', 'convex', 10, 3.),
+                        ('point_in_region', 'convex', 1000, 2.),
+                        ('region_in_region', 'star', 10, 1.))
+
+    result = compare(baseline, current)
+
+    assert result == [(('point_in_region', 'convex', 10), 1.5),
+                      (('region_in_region', 'star', 10), 1.),
+                      (('point_in_region', 'convex', 1000), .5)]
+
+
+def test_compare_unmatched_cases() -> None:
+    baseline = to_report(('point_in_region', 'convex', 10, 1.),
+                         ('point_in_region', 'star', 10, 1.))
+    current = to_report(('point_in_region', 'convex', 10, 2.),
+                        ('point_in_region', 'comb', 10, 1.))
+
+    result = compare(baseline, current)
+
+    assert result == [(('point_in_region', 'convex', 10), 2.)]
+
+
+def test_compare_zero_baseline() -> None:
+    baseline = to_report(('point_in_region', 'convex', 10, 0.))
+    current = to_report(('point_in_region', 'convex', 10, 1.))
+
+    assert compare(baseline, current) == []
+
+
+def test_to_regressions() -> None:
+    changes = [(('point_in_region', 'convex', 10), 1.5),
+               (('point_in_region', 'convex', 1000), 1.2),
+               (('region_in_region', 'star', 10), .5)]
+
+    result = to_regressions(changes, .2)
+
+    assert result == [(('point_in_region', 'convex', 10), 1.5)]
+    assert to_regressions(changes, 0.) == changes[:2]
+    assert to_regressions(changes, 1.) == []
@@ -0,0 +1,49 @@
+from ground.base import get_context
+
+from benchmarks.fixtures import (MULTIPARTS_COUNT,
+                                 SHAPES,
+                                 to_anchor,
+                                 to_box,
+                                 to_operands)
+from orient import planar
+from orient.core import box
+
+SIZES = (10, 1000)
+GOALS_KINDS = ('segment', 'multisegment', 'contour', 'region', 'multiregion',
+               'polygon', 'multipolygon')
+
+
+def test_points_not_decided_by_boxes() -> None:
+    context = get_context()
+    for goal_kind in GOALS_KINDS:
+        for shape in SHAPES[goal_kind]:
+            for size in SIZES:
+                point, goal = to_operands('point', goal_kind, shape, size,
+                                          context)
+
+                assert box.contains_point(to_box(to_anchor(goal), context),
+                                          point), (goal_kind, shape, size)
+
+
+def test_points_in_parts() -> None:
+    context = get_context()
+    for goal_kind, part_kind in [('multiregion', 'region'),
+                                 ('multipolygon', 'polygon')]:
+        for shape in SHAPES[goal_kind]:
+            for size in SIZES:
+                point, goal = to_operands('point', goal_kind, shape, size,
+                                          context)
+                part_point, part = to_operands(
+                        'point', part_kind, shape,
+                        max(size // MULTIPARTS_COUNT, 3), context
+                )
+
+                result = getattr(planar, 'point_in_' + goal_kind)(
+                        point, goal,
+                        context=context
+                )
+
+                assert result is getattr(planar, 'point_in_' + part_kind)(
+                        part_point, part,
+                        context=context
+                ), (goal_kind, shape, size)
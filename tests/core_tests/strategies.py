@@ -0,0 +1,91 @@
+from typing import Tuple
+
+from ground.hints import (Contour,
+                          Multisegment,
+                          Point,
+                          Polygon,
+                          Scalar)
+from hypothesis import strategies
+from hypothesis_geometry import planar
+
+from orient.core.homogeneous import HomogeneousPoint
+from tests.strategies import coordinates_strategies
+from tests.utils import (Point as PointCls,
+                         Strategy)
+
+# keeps products of coordinates' differences finite
+MAX_FLOAT_MAGNITUDE = 1e100
+
+
+def to_points_triplets(coordinates: Strategy[Scalar]
+                       ) -> Strategy[Tuple[Point, Point, Point]]:
+    points = planar.points(coordinates)
+    return strategies.tuples(points, points, points)
+
+
+def to_nearly_collinear_points_triplets(
+        coordinates: Strategy[Scalar]
+) -> Strategy[Tuple[Point, Point, Point]]:
+    return (strategies.tuples(planar.points(coordinates),
+                              planar.points(coordinates),
+                              strategies.floats(0, 1))
+            .map(lambda triplet: (triplet[0], triplet[1],
+                                  to_interpolated_point(*triplet))))
+
+
+def to_interpolated_point(start: Point, end: Point, step: float) -> Point:
+    return PointCls(float(start.x + (end.x - start.x) * step),
+                    float(start.y + (end.y - start.y) * step))
+
+
+floats = strategies.floats(-MAX_FLOAT_MAGNITUDE, MAX_FLOAT_MAGNITUDE)
+points_triplets = (coordinates_strategies.flatmap(to_points_triplets)
+                   | to_points_triplets(floats)
+                   | to_nearly_collinear_points_triplets(floats))
+small_integers = strategies.integers(-10, 10)
+integral_points = planar.points(small_integers)
+homogeneous_points = strategies.builds(HomogeneousPoint, small_integers,
+                                       small_integers,
+                                       strategies.integers(1, 5))
+mixed_points = integral_points | homogeneous_points
+mixed_points_triplets = strategies.tuples(mixed_points, mixed_points,
+                                          mixed_points)
+mixed_segments_endpoints = (strategies.tuples(mixed_points, mixed_points)
+                            .filter(lambda pair: pair[0] != pair[1]))
+mixed_segments_endpoints_pairs = strategies.tuples(mixed_segments_endpoints,
+                                                   mixed_segments_endpoints)
+
+
+def to_multisegments_pairs(coordinates: Strategy[Scalar]
+                           ) -> Strategy[Tuple[Multisegment, Multisegment]]:
+    multisegments = planar.multisegments(coordinates)
+    return strategies.tuples(multisegments, multisegments)
+
+
+def to_polygons_pairs(coordinates: Strategy[Scalar]
+                      ) -> Strategy[Tuple[Polygon, Polygon]]:
+    polygons = planar.polygons(coordinates)
+    return strategies.tuples(polygons, polygons)
+
+
+def to_polygons_with_contours(coordinates: Strategy[Scalar]
+                              ) -> Strategy[Tuple[Polygon, Contour]]:
+    return strategies.tuples(planar.polygons(coordinates),
+                             planar.contours(coordinates))
+
+
+multisegments_pairs = coordinates_strategies.flatmap(to_multisegments_pairs)
+polygons_pairs = coordinates_strategies.flatmap(to_polygons_pairs)
+polygons_with_contours = coordinates_strategies.flatmap(
+        to_polygons_with_contours
+)
+segments_endpoints_with_from_test = strategies.tuples(
+        coordinates_strategies.flatmap(planar.segments)
+        .map(lambda segment: (segment.start, segment.end)),
+        strategies.booleans()
+)
+contours_edges_endpoints = (coordinates_strategies.flatmap(planar.contours)
+                            .map(lambda contour: list(zip(
+                                    contour.vertices,
+                                    [*contour.vertices[1:],
+                                     contour.vertices[0]]))))
@@ -0,0 +1,44 @@
+from typing import Tuple
+
+from ground.hints import (Contour,
+                          Polygon)
+from hypothesis import given
+
+from orient.planar import (contour_in_polygon,
+                           polygon_in_polygon,
+                           region_in_polygon)
+from orient.sweep_line import combined_sweep
+from . import strategies
+
+
+@given(strategies.polygons_with_contours)
+def test_linear_equivalence(polygon_with_contour: Tuple[Polygon, Contour]
+                            ) -> None:
+    polygon, contour = polygon_with_contour
+
+    with combined_sweep():
+        result = contour_in_polygon(contour, polygon)
+
+    assert result is contour_in_polygon(contour, polygon)
+
+
+@given(strategies.polygons_with_contours)
+def test_region_equivalence(polygon_with_contour: Tuple[Polygon, Contour]
+                            ) -> None:
+    polygon, region = polygon_with_contour
+
+    with combined_sweep():
+        result = region_in_polygon(region, polygon)
+
+    assert result is region_in_polygon(region, polygon)
+
+
+@given(strategies.polygons_pairs)
+def test_shaped_equivalence(polygons_pair: Tuple[Polygon, Polygon]
+                            ) -> None:
+    test, goal = polygons_pair
+
+    with combined_sweep():
+        result = polygon_in_polygon(test, goal)
+
+    assert result is polygon_in_polygon(test, goal)
@@ -0,0 +1,49 @@
+from typing import Tuple
+
+from hypothesis import given
+
+from orient.core.event import EventsArena
+from orient.core.hints import SegmentEndpoints
+from tests.utils import Point
+from . import strategies
+
+
+@given(strategies.segments_endpoints_with_from_test)
+def test_add(segment_endpoints_with_from_test: Tuple[SegmentEndpoints, bool]
+             ) -> None:
+    segment_endpoints, from_test = segment_endpoints_with_from_test
+    events = EventsArena()
+
+    result = events.add(segment_endpoints, from_test)
+
+    right = events.right(result)
+    assert events.is_left(result)
+    assert not events.is_left(right)
+    assert events.left(right) == result
+    assert (sorted((events.starts[result], events.end(result)))
+            == sorted(segment_endpoints))
+    assert events.starts[result] < events.end(result)
+    assert events.from_test(result) is events.from_test(right) is from_test
+    assert events.interior_to_left(result) is (segment_endpoints[0]
+                                               < segment_endpoints[1])
+
+
+@given(strategies.segments_endpoints_with_from_test)
+def test_divide(segment_endpoints_with_from_test
+                : Tuple[SegmentEndpoints, bool]) -> None:
+    segment_endpoints, from_test = segment_endpoints_with_from_test
+    events = EventsArena()
+    event = events.add(segment_endpoints, from_test)
+    start, end = events.starts[event], events.end(event)
+    break_point = Point((start.x + end.x) / 2, (start.y + end.y) / 2)
+
+    result = events.divide(event, break_point)
+
+    assert events.is_left(result)
+    assert events.end(event) == events.starts[result] == break_point
+    assert events.starts[event] == start
+    assert events.end(result) == end
+    assert events.original_starts[result] == start
+    assert events.original_end(event) == end
+    assert events.left(events.right(result)) == result
+    assert events.from_test(result) is from_test
@@ -0,0 +1,44 @@
+from typing import Tuple
+
+from ground.base import get_context
+from ground.hints import Point
+from hypothesis import given
+
+from orient.core.hints import SegmentEndpoints
+from orient.core.homogeneous import (orientation,
+                                     relate_segments)
+from orient.core.orienteer import to_orienteer
+from tests.utils import (Point as PointCls,
+                         Segment)
+from . import strategies
+
+
+@given(strategies.mixed_points_triplets)
+def test_orientation(points_triplet: Tuple[Point, Point, Point]) -> None:
+    vertex, first_ray_point, second_ray_point = points_triplet
+    context = get_context()
+
+    result = orientation(vertex, first_ray_point, second_ray_point)
+
+    assert result is context.angle_orientation(
+            *map(to_cartesian_point, points_triplet)
+    )
+
+
+@given(strategies.mixed_segments_endpoints_pairs)
+def test_relate_segments(segments_endpoints_pair
+                         : Tuple[SegmentEndpoints, SegmentEndpoints]) -> None:
+    test_endpoints, goal_endpoints = segments_endpoints_pair
+    context = get_context()
+
+    result = relate_segments(*test_endpoints, *goal_endpoints,
+                             to_orienteer(context))
+
+    assert result is context.segments_relation(
+            Segment(*map(to_cartesian_point, test_endpoints)),
+            Segment(*map(to_cartesian_point, goal_endpoints))
+    )
+
+
+def to_cartesian_point(point: Point) -> Point:
+    return PointCls(point.x, point.y)
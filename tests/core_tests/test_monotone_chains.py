@@ -0,0 +1,49 @@
+from typing import (List,
+                    Tuple)
+
+from ground.hints import (Multisegment,
+                          Polygon)
+from hypothesis import given
+
+from orient.core.hints import SegmentEndpoints
+from orient.core.monotone_chains import to_monotone_chains
+from orient.planar import (multisegment_in_multisegment,
+                           polygon_in_polygon)
+from orient.sweep_line import monotone_chains
+from . import strategies
+
+
+@given(strategies.contours_edges_endpoints)
+def test_to_monotone_chains(edges_endpoints: List[SegmentEndpoints]
+                            ) -> None:
+    result = to_monotone_chains(edges_endpoints)
+
+    assert sorted(edge_endpoints
+                  for chain in result
+                  for edge_endpoints in chain) == sorted(edges_endpoints)
+    assert all(max(previous) == min(next_)
+               for chain in result
+               for previous, next_ in zip(chain, chain[1:]))
+
+
+@given(strategies.multisegments_pairs)
+def test_linear_equivalence(
+        multisegments_pair: Tuple[Multisegment, Multisegment]
+) -> None:
+    test, goal = multisegments_pair
+
+    with monotone_chains():
+        result = multisegment_in_multisegment(test, goal)
+
+    assert result is multisegment_in_multisegment(test, goal)
+
+
+@given(strategies.polygons_pairs)
+def test_shaped_equivalence(polygons_pair: Tuple[Polygon, Polygon]
+                            ) -> None:
+    test, goal = polygons_pair
+
+    with monotone_chains():
+        result = polygon_in_polygon(test, goal)
+
+    assert result is polygon_in_polygon(test, goal)
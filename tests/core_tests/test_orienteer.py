@@ -0,0 +1,22 @@
+from typing import Tuple
+
+from ground.base import (Mode,
+                         get_context)
+from ground.hints import Point
+from hypothesis import given
+
+from orient.core.orienteer import to_orienteer
+from . import strategies
+
+
+@given(strategies.points_triplets)
+def test_connection_with_context(points_triplet: Tuple[Point, Point, Point]
+                                 ) -> None:
+    vertex, first_ray_point, second_ray_point = points_triplet
+    context = get_context()
+
+    result = to_orienteer(context)(vertex, first_ray_point, second_ray_point)
+
+    assert context.mode is Mode.EXACT
+    assert result is context.angle_orientation(vertex, first_ray_point,
+                                               second_ray_point)
@@ -0,0 +1,32 @@
+import gc
+from typing import Tuple
+
+from ground.hints import Polygon
+from hypothesis import given
+
+from orient.core.processing import gc_suspender
+from orient.planar import polygon_in_polygon
+from orient.sweep_line import gc_suspension
+from . import strategies
+
+
+@given(strategies.polygons_pairs)
+def test_gc_suspension(polygons_pair: Tuple[Polygon, Polygon]) -> None:
+    test, goal = polygons_pair
+    gc.collect()
+
+    with gc_suspension():
+        result = polygon_in_polygon(test, goal)
+
+    assert gc.isenabled()
+    assert not gc.collect()
+    assert result is polygon_in_polygon(test, goal)
+
+
+def test_gc_suspender_nesting() -> None:
+    with gc_suspender:
+        with gc_suspender:
+            assert not gc.isenabled()
+        assert not gc.isenabled()
+
+    assert gc.isenabled()
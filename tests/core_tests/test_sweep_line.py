@@ -0,0 +1,36 @@
+from typing import Tuple
+
+from ground.hints import (Multisegment,
+                          Polygon)
+from hypothesis import given
+
+from orient.planar import (multisegment_in_multisegment,
+                           polygon_in_polygon)
+from orient.sweep_line import (SweepLineKind,
+                               sweep_line_kind)
+from . import strategies
+
+
+@given(strategies.multisegments_pairs)
+def test_linear_kinds_equivalence(
+        multisegments_pair: Tuple[Multisegment, Multisegment]
+) -> None:
+    test, goal = multisegments_pair
+
+    with sweep_line_kind(SweepLineKind.SORTED_BLOCKS):
+        result = multisegment_in_multisegment(test, goal)
+
+    with sweep_line_kind(SweepLineKind.RED_BLACK_TREE):
+        assert result is multisegment_in_multisegment(test, goal)
+
+
+@given(strategies.polygons_pairs)
+def test_shaped_kinds_equivalence(polygons_pair: Tuple[Polygon, Polygon]
+                                  ) -> None:
+    test, goal = polygons_pair
+
+    with sweep_line_kind(SweepLineKind.SORTED_BLOCKS):
+        result = polygon_in_polygon(test, goal)
+
+    with sweep_line_kind(SweepLineKind.RED_BLACK_TREE):
+        assert result is polygon_in_polygon(test, goal)
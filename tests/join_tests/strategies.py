@@ -0,0 +1,25 @@
+from typing import (List,
+                    Tuple)
+
+from ground.hints import Scalar
+from hypothesis import strategies
+from hypothesis_geometry import planar
+
+from orient.join import Geometry
+from tests.strategies import coordinates_strategies
+from tests.utils import Strategy
+
+
+def to_tests_with_goals(coordinates: Strategy[Scalar]
+                        ) -> Strategy[Tuple[List[Geometry], List[Geometry]]]:
+    return strategies.tuples(
+            strategies.lists(planar.segments(coordinates)
+                             | planar.polygons(coordinates),
+                             max_size=5),
+            strategies.lists(planar.segments(coordinates)
+                             | planar.polygons(coordinates)
+                             | planar.multipolygons(coordinates),
+                             max_size=5))
+
+
+tests_with_goals = coordinates_strategies.flatmap(to_tests_with_goals)
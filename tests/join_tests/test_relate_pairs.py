@@ -0,0 +1,73 @@
+from typing import (List,
+                    Tuple)
+
+from ground.base import Relation
+from hypothesis import given
+
+from orient.join import (Geometry,
+                         relate_pairs)
+from orient.planar import (polygon_in_multipolygon,
+                           polygon_in_polygon,
+                           segment_in_multipolygon,
+                           segment_in_polygon,
+                           segment_in_segment)
+from . import strategies
+
+
+@given(strategies.tests_with_goals)
+def test_basic(tests_with_goals: Tuple[List[Geometry], List[Geometry]]
+               ) -> None:
+    tests, goals = tests_with_goals
+
+    result = list(relate_pairs(tests, goals,
+                               skip_disjoint=False))
+
+    assert [(test_index, goal_index)
+            for test_index, goal_index, _ in result] == [
+        (test_index, goal_index)
+        for test_index in range(len(tests))
+        for goal_index in range(len(goals))
+    ]
+    assert all(isinstance(relation, Relation) for _, _, relation in result)
+
+
+@given(strategies.tests_with_goals)
+def test_skip_disjoint(tests_with_goals: Tuple[List[Geometry], List[Geometry]]
+                       ) -> None:
+    tests, goals = tests_with_goals
+
+    result = list(relate_pairs(iter(tests), goals))
+
+    assert result == [triplet
+                      for triplet in relate_pairs(tests, goals,
+                                                  skip_disjoint=False)
+                      if triplet[2] is not Relation.DISJOINT]
+
+
+@given(strategies.tests_with_goals)
+def test_connection_with_planar(
+        tests_with_goals: Tuple[List[Geometry], List[Geometry]]
+) -> None:
+    tests, goals = tests_with_goals
+
+    result = relate_pairs(tests, goals,
+                          skip_disjoint=False)
+
+    assert all(relation is to_planar_relation(tests[test_index],
+                                              goals[goal_index])
+               for test_index, goal_index, relation in result)
+
+
+def to_planar_relation(test: Geometry, goal: Geometry) -> Relation:
+    if hasattr(goal, 'start'):
+        return (segment_in_polygon(goal, test).complement
+                if hasattr(test, 'border')
+                else segment_in_segment(test, goal))
+    elif hasattr(test, 'border'):
+        return (polygon_in_multipolygon(test, goal)
+                if hasattr(goal, 'polygons')
+                else polygon_in_polygon(test, goal))
+    else:
+        return (segment_in_multipolygon(test, goal)
+                if hasattr(goal, 'polygons')
+                else segment_in_polygon(test, goal))
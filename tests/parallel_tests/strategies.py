@@ -0,0 +1,33 @@
+from typing import (List,
+                    Tuple)
+
+from ground.hints import Scalar
+from hypothesis import strategies
+from hypothesis_geometry import planar
+
+from orient.join import Geometry
+from tests.strategies import coordinates_strategies
+from tests.utils import Strategy
+
+
+def to_pairs(coordinates: Strategy[Scalar]
+             ) -> Strategy[List[Tuple[Geometry, Geometry]]]:
+    goals = strategies.lists(planar.segments(coordinates)
+                             | planar.polygons(coordinates)
+                             | planar.multipolygons(coordinates),
+                             min_size=1,
+                             max_size=3)
+    tests = strategies.lists(planar.segments(coordinates)
+                             | planar.polygons(coordinates),
+                             min_size=1,
+                             max_size=5)
+    return strategies.tuples(tests, goals).flatmap(
+            lambda tests_with_goals: strategies.lists(strategies.tuples(
+                    strategies.sampled_from(tests_with_goals[0]),
+                    strategies.sampled_from(tests_with_goals[1])
+            ))
+    )
+
+
+pairs = coordinates_strategies.flatmap(to_pairs)
+workers_counts = strategies.integers(1, 3)
@@ -0,0 +1,29 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from orient.join import (Geometry,
+                         relate_pairs)
+from orient.parallel import relate_many
+from . import strategies
+
+
+@given(strategies.pairs, strategies.workers_counts)
+def test_basic(pairs: List[Tuple[Geometry, Geometry]],
+               workers_count: int) -> None:
+    result = relate_many(pairs,
+                         workers=workers_count)
+
+    assert len(result) == len(pairs)
+
+
+@given(strategies.pairs, strategies.workers_counts)
+def test_connection_with_join(pairs: List[Tuple[Geometry, Geometry]],
+                              workers_count: int) -> None:
+    result = relate_many(iter(pairs),
+                         workers=workers_count)
+
+    assert result == [next(relate_pairs([test], [goal],
+                                        skip_disjoint=False))[2]
+                      for test, goal in pairs]
@@ -0,0 +1,42 @@
+from typing import (List,
+                    Tuple)
+
+from hypothesis import given
+
+from orient.join import Geometry
+from orient.parallel import (relate_many,
+                             relate_many_in_threads)
+from orient.sweep_line import (SweepLineKind,
+                               sweep_line_kind)
+from . import strategies
+
+
+@given(strategies.pairs, strategies.workers_counts)
+def test_basic(pairs: List[Tuple[Geometry, Geometry]],
+               workers_count: int) -> None:
+    result = relate_many_in_threads(pairs,
+                                    workers=workers_count)
+
+    assert len(result) == len(pairs)
+
+
+@given(strategies.pairs, strategies.workers_counts)
+def test_connection_with_relate_many(pairs: List[Tuple[Geometry, Geometry]],
+                                     workers_count: int) -> None:
+    result = relate_many_in_threads(iter(pairs),
+                                    workers=workers_count,
+                                    chunk_size=1)
+
+    assert result == relate_many(pairs,
+                                 workers=1)
+
+
+@given(strategies.pairs, strategies.workers_counts)
+def test_sweep_line_kind(pairs: List[Tuple[Geometry, Geometry]],
+                         workers_count: int) -> None:
+    with sweep_line_kind(SweepLineKind.SORTED_BLOCKS):
+        result = relate_many_in_threads(pairs,
+                                        workers=workers_count)
+
+    assert result == relate_many(pairs,
+                                 workers=1)
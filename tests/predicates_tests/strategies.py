@@ -0,0 +1,28 @@
+from typing import Tuple
+
+from ground.hints import Scalar
+from hypothesis import strategies
+from hypothesis_geometry import planar
+
+from orient.join import Geometry
+from orient.prepared import prepare
+from tests.strategies import coordinates_strategies
+from tests.utils import Strategy
+
+
+def to_geometries(coordinates: Strategy[Scalar]) -> Strategy[Geometry]:
+    return (planar.segments(coordinates)
+            | planar.multisegments(coordinates)
+            | planar.contours(coordinates)
+            | planar.contours(coordinates).map(prepare)
+            | planar.polygons(coordinates)
+            | planar.multipolygons(coordinates))
+
+
+def to_geometries_pairs(coordinates: Strategy[Scalar]
+                        ) -> Strategy[Tuple[Geometry, Geometry]]:
+    geometries = to_geometries(coordinates)
+    return strategies.tuples(geometries, geometries)
+
+
+geometries_pairs = coordinates_strategies.flatmap(to_geometries_pairs)
@@ -0,0 +1,28 @@
+from typing import Tuple
+
+from ground.base import Relation
+from hypothesis import given
+
+from orient.join import Geometry
+from orient.predicates import intersects
+from . import strategies
+from .utils import relate
+
+
+@given(strategies.geometries_pairs)
+def test_basic(geometries_pair: Tuple[Geometry, Geometry]) -> None:
+    test, goal = geometries_pair
+
+    result = intersects(test, goal)
+
+    assert isinstance(result, bool)
+
+
+@given(strategies.geometries_pairs)
+def test_connection_with_relate(geometries_pair: Tuple[Geometry, Geometry]
+                                ) -> None:
+    test, goal = geometries_pair
+
+    result = intersects(test, goal)
+
+    assert result is (relate(test, goal) is not Relation.DISJOINT)
@@ -0,0 +1,10 @@
+from ground.base import Relation
+
+from orient.join import (Geometry,
+                         relate_pairs)
+
+
+def relate(test: Geometry, goal: Geometry) -> Relation:
+    (_, _, result), = relate_pairs([test], [goal],
+                                   skip_disjoint=False)
+    return result
@@ -0,0 +1,28 @@
+from tests.planar_tests.strategies import (contours,
+                                           contours_pairs,
+                                           contours_with_multisegments,
+                                           contours_with_points,
+                                           contours_with_segments,
+                                           multipolygons,
+                                           multipolygons_pairs,
+                                           multipolygons_with_contours,
+                                           multipolygons_with_multiregions,
+                                           multipolygons_with_multisegments,
+                                           multipolygons_with_points,
+                                           multipolygons_with_polygons,
+                                           multipolygons_with_segments,
+                                           polygons,
+                                           polygons_pairs,
+                                           polygons_with_contours,
+                                           polygons_with_multiregions,
+                                           polygons_with_multisegments,
+                                           polygons_with_points,
+                                           polygons_with_segments,
+                                           segments)
+
+regions = contours
+regions_pairs = contours_pairs
+regions_with_contours = contours_pairs
+regions_with_multisegments = contours_with_multisegments
+regions_with_points = contours_with_points
+regions_with_segments = contours_with_segments
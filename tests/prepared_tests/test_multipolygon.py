@@ -0,0 +1,142 @@
+import random
+from typing import Tuple
+
+from ground.hints import (Contour,
+                          Multipolygon,
+                          Multisegment,
+                          Point,
+                          Polygon,
+                          Segment)
+from hypothesis import given
+
+from orient.core import box
+from orient.hints import (Multiregion,
+                          Region)
+from orient.planar import (contour_in_multipolygon,
+                           multipolygon_in_multipolygon,
+                           multiregion_in_multipolygon,
+                           multisegment_in_multipolygon,
+                           point_in_multipolygon,
+                           polygon_in_multipolygon,
+                           region_in_multipolygon,
+                           segment_in_multipolygon)
+from orient.prepared import (locate_point_in_multipolygon,
+                             prepare)
+from . import strategies
+
+
+@given(strategies.multipolygons_with_points)
+def test_point(multipolygon_with_point: Tuple[Multipolygon, Point]) -> None:
+    multipolygon, point = multipolygon_with_point
+
+    result = point_in_multipolygon(point, prepare(multipolygon))
+
+    assert result is point_in_multipolygon(point, multipolygon)
+
+
+@given(strategies.multipolygons_with_points)
+def test_locate_point(multipolygon_with_point: Tuple[Multipolygon, Point]
+                      ) -> None:
+    multipolygon, point = multipolygon_with_point
+
+    result = locate_point_in_multipolygon(point, prepare(multipolygon))
+
+    assert result == locate_point_in_multipolygon(point, multipolygon)
+
+
+@given(strategies.multipolygons_with_segments)
+def test_segment(multipolygon_with_segment: Tuple[Multipolygon, Segment]
+                 ) -> None:
+    multipolygon, segment = multipolygon_with_segment
+
+    result = segment_in_multipolygon(segment, prepare(multipolygon))
+
+    assert result is segment_in_multipolygon(segment, multipolygon)
+
+
+@given(strategies.multipolygons_with_multisegments)
+def test_multisegment(
+        multipolygon_with_multisegment: Tuple[Multipolygon, Multisegment]
+) -> None:
+    multipolygon, multisegment = multipolygon_with_multisegment
+
+    result = multisegment_in_multipolygon(multisegment, prepare(multipolygon))
+
+    assert result is multisegment_in_multipolygon(multisegment, multipolygon)
+
+
+@given(strategies.multipolygons_with_contours)
+def test_contour(multipolygon_with_contour: Tuple[Multipolygon, Contour]
+                 ) -> None:
+    multipolygon, contour = multipolygon_with_contour
+
+    result = contour_in_multipolygon(contour, prepare(multipolygon))
+
+    assert result is contour_in_multipolygon(contour, multipolygon)
+
+
+@given(strategies.multipolygons_with_contours)
+def test_region(multipolygon_with_region: Tuple[Multipolygon, Region]) -> None:
+    multipolygon, region = multipolygon_with_region
+
+    result = region_in_multipolygon(region, prepare(multipolygon))
+
+    assert result is region_in_multipolygon(region, multipolygon)
+
+
+@given(strategies.multipolygons_with_multiregions)
+def test_multiregion(
+        multipolygon_with_multiregion: Tuple[Multipolygon, Multiregion]
+) -> None:
+    multipolygon, multiregion = multipolygon_with_multiregion
+
+    result = multiregion_in_multipolygon(multiregion, prepare(multipolygon))
+
+    assert result is multiregion_in_multipolygon(multiregion, multipolygon)
+
+
+@given(strategies.multipolygons_with_polygons)
+def test_polygon(multipolygon_with_polygon: Tuple[Multipolygon, Polygon]
+                 ) -> None:
+    multipolygon, polygon = multipolygon_with_polygon
+
+    result = polygon_in_multipolygon(polygon, prepare(multipolygon))
+
+    assert result is polygon_in_multipolygon(polygon, multipolygon)
+
+
+@given(strategies.multipolygons_pairs)
+def test_multipolygon(
+        multipolygons_pair: Tuple[Multipolygon, Multipolygon]
+) -> None:
+    goal, test = multipolygons_pair
+
+    result = multipolygon_in_multipolygon(test, prepare(goal))
+
+    assert result is multipolygon_in_multipolygon(test, goal)
+
+
+@given(strategies.multipolygons_with_polygons)
+def test_polygons_tree(multipolygon_with_polygon: Tuple[Multipolygon, Polygon]
+                       ) -> None:
+    multipolygon, polygon = multipolygon_with_polygon
+    prepared = prepare(multipolygon)
+    polygon_box = prepare(polygon).box
+
+    result = prepared.polygons_tree.find_intersecting(polygon_box)
+
+    assert result == [index
+                      for index, sub_polygon in enumerate(prepared.polygons)
+                      if not box.disjoint_with(sub_polygon.box, polygon_box)]
+
+
+@given(strategies.multipolygons_with_points)
+def test_trapezoidal_map_randomness(
+        multipolygon_with_point: Tuple[Multipolygon, Point]
+) -> None:
+    multipolygon, _ = multipolygon_with_point
+    random_state = random.getstate()
+
+    prepare(multipolygon).trapezoidal_map
+
+    assert random.getstate() == random_state
@@ -0,0 +1,99 @@
+from typing import Tuple
+
+from ground.hints import (Contour,
+                          Multisegment,
+                          Point,
+                          Polygon,
+                          Segment)
+from hypothesis import given
+
+from orient.core import box
+from orient.hints import (Multiregion,
+                          Region)
+from orient.planar import (contour_in_polygon,
+                           multiregion_in_polygon,
+                           multisegment_in_polygon,
+                           point_in_polygon,
+                           polygon_in_polygon,
+                           region_in_polygon,
+                           segment_in_polygon)
+from orient.prepared import prepare
+from . import strategies
+
+
+@given(strategies.polygons_with_contours)
+def test_holes_tree(polygon_with_contour: Tuple[Polygon, Contour]) -> None:
+    polygon, contour = polygon_with_contour
+    prepared = prepare(polygon)
+    contour_box = prepare(contour).box
+
+    result = prepared.holes_tree.find_intersecting(contour_box)
+
+    assert result == [index
+                      for index, hole in enumerate(prepared.holes)
+                      if not box.disjoint_with(hole.box, contour_box)]
+
+
+@given(strategies.polygons_with_points)
+def test_point(polygon_with_point: Tuple[Polygon, Point]) -> None:
+    polygon, point = polygon_with_point
+
+    result = point_in_polygon(point, prepare(polygon))
+
+    assert result is point_in_polygon(point, polygon)
+
+
+@given(strategies.polygons_with_segments)
+def test_segment(polygon_with_segment: Tuple[Polygon, Segment]) -> None:
+    polygon, segment = polygon_with_segment
+
+    result = segment_in_polygon(segment, prepare(polygon))
+
+    assert result is segment_in_polygon(segment, polygon)
+
+
+@given(strategies.polygons_with_multisegments)
+def test_multisegment(polygon_with_multisegment: Tuple[Polygon, Multisegment]
+                      ) -> None:
+    polygon, multisegment = polygon_with_multisegment
+
+    result = multisegment_in_polygon(multisegment, prepare(polygon))
+
+    assert result is multisegment_in_polygon(multisegment, polygon)
+
+
+@given(strategies.polygons_with_contours)
+def test_contour(polygon_with_contour: Tuple[Polygon, Contour]) -> None:
+    polygon, contour = polygon_with_contour
+
+    result = contour_in_polygon(contour, prepare(polygon))
+
+    assert result is contour_in_polygon(contour, polygon)
+
+
+@given(strategies.polygons_with_contours)
+def test_region(polygon_with_region: Tuple[Polygon, Region]) -> None:
+    polygon, region = polygon_with_region
+
+    result = region_in_polygon(region, prepare(polygon))
+
+    assert result is region_in_polygon(region, polygon)
+
+
+@given(strategies.polygons_with_multiregions)
+def test_multiregion(polygon_with_multiregion: Tuple[Polygon, Multiregion]
+                     ) -> None:
+    polygon, multiregion = polygon_with_multiregion
+
+    result = multiregion_in_polygon(multiregion, prepare(polygon))
+
+    assert result is multiregion_in_polygon(multiregion, polygon)
+
+
+@given(strategies.polygons_pairs)
+def test_polygon(polygons_pair: Tuple[Polygon, Polygon]) -> None:
+    goal, test = polygons_pair
+
+    result = polygon_in_polygon(test, prepare(goal))
+
+    assert result is polygon_in_polygon(test, goal)
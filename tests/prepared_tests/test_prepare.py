@@ -0,0 +1,54 @@
+import pytest
+from ground.hints import (Multipolygon,
+                          Polygon,
+                          Segment)
+from hypothesis import given
+
+from orient.hints import Region
+from orient.prepared import (PreparedMultipolygon,
+                             PreparedPolygon,
+                             PreparedRegion,
+                             prepare)
+from . import strategies
+
+
+@given(strategies.regions)
+def test_region(region: Region) -> None:
+    result = prepare(region)
+
+    assert isinstance(result, PreparedRegion)
+    assert result.vertices == region.vertices
+
+
+@given(strategies.polygons)
+def test_polygon(polygon: Polygon) -> None:
+    result = prepare(polygon)
+
+    assert isinstance(result, PreparedPolygon)
+    assert result.border.vertices == polygon.border.vertices
+    assert ([hole.vertices for hole in result.holes]
+            == [hole.vertices for hole in polygon.holes])
+
+
+@given(strategies.multipolygons)
+def test_multipolygon(multipolygon: Multipolygon) -> None:
+    result = prepare(multipolygon)
+
+    assert isinstance(result, PreparedMultipolygon)
+    assert len(result.polygons) == len(multipolygon.polygons)
+    assert all(prepared_polygon.polygon is polygon
+               for prepared_polygon, polygon in zip(result.polygons,
+                                                    multipolygon.polygons))
+
+
+@given(strategies.polygons)
+def test_idempotence(polygon: Polygon) -> None:
+    result = prepare(polygon)
+
+    assert prepare(result) is result
+
+
+@given(strategies.segments)
+def test_unsupported(segment: Segment) -> None:
+    with pytest.raises(TypeError):
+        prepare(segment)
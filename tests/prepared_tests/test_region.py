@@ -0,0 +1,94 @@
+from typing import Tuple
+
+from ground.hints import (Contour,
+                          Multisegment,
+                          Point,
+                          Segment)
+from hypothesis import given
+
+from orient.hints import Region
+from orient.planar import (contour_in_region,
+                           multisegment_in_region,
+                           point_in_region,
+                           region_in_region,
+                           segment_in_region)
+from orient.prepared import prepare
+from . import strategies
+
+
+@given(strategies.regions_with_points)
+def test_edges_index(region_with_point: Tuple[Region, Point]) -> None:
+    region, point = region_with_point
+
+    prepared = prepare(region)
+    result = prepared.edges_index.find_containing(point.y)
+
+    assert sorted(result) == [
+        index
+        for index, edge in enumerate(prepared.edges)
+        if (min(edge.start.y, edge.end.y) <= point.y
+            <= max(edge.start.y, edge.end.y))
+    ]
+
+
+@given(strategies.regions_with_segments)
+def test_edges_index_intersecting(region_with_segment: Tuple[Region, Segment]
+                                  ) -> None:
+    region, segment = region_with_segment
+    low, high = sorted((segment.start.y, segment.end.y))
+
+    prepared = prepare(region)
+    result = prepared.edges_index.find_intersecting(low, high)
+
+    assert sorted(result) == [
+        index
+        for index, edge in enumerate(prepared.edges)
+        if (min(edge.start.y, edge.end.y) <= high
+            and low <= max(edge.start.y, edge.end.y))
+    ]
+
+
+@given(strategies.regions_with_points)
+def test_point(region_with_point: Tuple[Region, Point]) -> None:
+    region, point = region_with_point
+
+    result = point_in_region(point, prepare(region))
+
+    assert result is point_in_region(point, region)
+
+
+@given(strategies.regions_with_segments)
+def test_segment(region_with_segment: Tuple[Region, Segment]) -> None:
+    region, segment = region_with_segment
+
+    result = segment_in_region(segment, prepare(region))
+
+    assert result is segment_in_region(segment, region)
+
+
+@given(strategies.regions_with_multisegments)
+def test_multisegment(region_with_multisegment: Tuple[Region, Multisegment]
+                      ) -> None:
+    region, multisegment = region_with_multisegment
+
+    result = multisegment_in_region(multisegment, prepare(region))
+
+    assert result is multisegment_in_region(multisegment, region)
+
+
+@given(strategies.regions_with_contours)
+def test_contour(region_with_contour: Tuple[Region, Contour]) -> None:
+    region, contour = region_with_contour
+
+    result = contour_in_region(contour, prepare(region))
+
+    assert result is contour_in_region(contour, region)
+
+
+@given(strategies.regions_pairs)
+def test_region(regions_pair: Tuple[Region, Region]) -> None:
+    goal, test = regions_pair
+
+    result = region_in_region(test, prepare(goal))
+
+    assert result is region_in_region(test, goal)
@@ -0,0 +1,24 @@
+from typing import (List,
+                    Tuple)
+
+from ground.hints import Scalar
+from hypothesis import strategies
+from hypothesis_geometry import planar
+
+from orient.join import Geometry
+from tests.strategies import coordinates_strategies
+from tests.utils import Strategy
+
+
+def to_goals_with_tests(coordinates: Strategy[Scalar]
+                        ) -> Strategy[Tuple[Geometry, List[Geometry]]]:
+    return strategies.tuples(planar.segments(coordinates)
+                             | planar.polygons(coordinates)
+                             | planar.multipolygons(coordinates),
+                             strategies.lists(planar.segments(coordinates)
+                                              | planar.polygons(coordinates),
+                                              max_size=5))
+
+
+goals_with_tests = coordinates_strategies.flatmap(to_goals_with_tests)
+chunks_sizes = strategies.integers(1, 5)
@@ -0,0 +1,44 @@
+from typing import (Iterator,
+                    List,
+                    Tuple)
+
+from hypothesis import given
+
+from orient.join import (Geometry,
+                         relate_pairs)
+from orient.stream import relate_stream
+from . import strategies
+
+
+@given(strategies.goals_with_tests, strategies.chunks_sizes)
+def test_connection_with_join(goal_with_tests: Tuple[Geometry,
+                                                     List[Geometry]],
+                              chunk_size: int) -> None:
+    goal, tests = goal_with_tests
+
+    result = relate_stream(goal, iter(tests),
+                           chunk_size=chunk_size)
+
+    assert list(result) == [relation
+                            for _, _, relation in relate_pairs(
+                                    tests, [goal],
+                                    skip_disjoint=False
+                            )]
+
+
+@given(strategies.goals_with_tests, strategies.chunks_sizes)
+def test_laziness(goal_with_tests: Tuple[Geometry, List[Geometry]],
+                  chunk_size: int) -> None:
+    goal, tests = goal_with_tests
+    consumed = []
+
+    def stream() -> Iterator[Geometry]:
+        for test in tests:
+            consumed.append(test)
+            yield test
+
+    result = relate_stream(goal, stream(),
+                           chunk_size=chunk_size)
+
+    for related_count, _ in enumerate(result, 1):
+        assert related_count <= len(consumed) < related_count + chunk_size
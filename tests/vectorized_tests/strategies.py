@@ -0,0 +1,46 @@
+from typing import (List,
+                    Tuple)
+
+from ground.hints import (Point,
+                          Polygon,
+                          Scalar)
+from hypothesis import strategies
+from hypothesis_geometry import planar
+
+from orient.hints import Region
+from tests.strategies import coordinates_strategies
+from tests.utils import Strategy
+
+
+def to_regions_with_points_lists(coordinates: Strategy[Scalar]
+                                 ) -> Strategy[Tuple[Region, List[Point]]]:
+    return (planar.contours(coordinates)
+            .flatmap(lambda region: strategies.tuples(
+                    strategies.just(region),
+                    to_points_lists(coordinates, region.vertices))))
+
+
+def to_polygons_with_points_lists(coordinates: Strategy[Scalar]
+                                  ) -> Strategy[Tuple[Polygon, List[Point]]]:
+    return (planar.polygons(coordinates)
+            .flatmap(lambda polygon: strategies.tuples(
+                    strategies.just(polygon),
+                    to_points_lists(coordinates,
+                                    [vertex
+                                     for region in [polygon.border,
+                                                    *polygon.holes]
+                                     for vertex in region.vertices]))))
+
+
+def to_points_lists(coordinates: Strategy[Scalar],
+                    vertices: List[Point]) -> Strategy[List[Point]]:
+    return strategies.lists(planar.points(coordinates)
+                            | strategies.sampled_from(vertices))
+
+
+regions_with_points_lists = coordinates_strategies.flatmap(
+        to_regions_with_points_lists
+)
+polygons_with_points_lists = coordinates_strategies.flatmap(
+        to_polygons_with_points_lists
+)
@@ -0,0 +1,37 @@
+from typing import (List,
+                    Tuple)
+
+import numpy as np
+from ground.base import Location
+from ground.hints import (Point,
+                          Polygon)
+from hypothesis import given
+
+from orient.planar import point_in_polygon
+from orient.vectorized import points_in_polygon
+from . import strategies
+from .utils import to_points_array
+
+
+@given(strategies.polygons_with_points_lists)
+def test_basic(polygon_with_points: Tuple[Polygon, List[Point]]) -> None:
+    polygon, points = polygon_with_points
+
+    result = points_in_polygon(to_points_array(points), polygon)
+
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == np.uint8
+    assert result.shape == (len(points),)
+
+
+@given(strategies.polygons_with_points_lists)
+def test_connection_with_point_in_polygon(
+        polygon_with_points: Tuple[Polygon, List[Point]]
+) -> None:
+    polygon, points = polygon_with_points
+
+    result = points_in_polygon(to_points_array(points), polygon)
+
+    assert [Location(code) for code in result] == [
+        point_in_polygon(point, polygon) for point in points
+    ]
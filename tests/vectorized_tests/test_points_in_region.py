@@ -0,0 +1,37 @@
+from typing import (List,
+                    Tuple)
+
+import numpy as np
+from ground.base import Location
+from ground.hints import Point
+from hypothesis import given
+
+from orient.hints import Region
+from orient.planar import point_in_region
+from orient.vectorized import points_in_region
+from . import strategies
+from .utils import to_points_array
+
+
+@given(strategies.regions_with_points_lists)
+def test_basic(region_with_points: Tuple[Region, List[Point]]) -> None:
+    region, points = region_with_points
+
+    result = points_in_region(to_points_array(points), region)
+
+    assert isinstance(result, np.ndarray)
+    assert result.dtype == np.uint8
+    assert result.shape == (len(points),)
+
+
+@given(strategies.regions_with_points_lists)
+def test_connection_with_point_in_region(
+        region_with_points: Tuple[Region, List[Point]]
+) -> None:
+    region, points = region_with_points
+
+    result = points_in_region(to_points_array(points), region)
+
+    assert [Location(code) for code in result] == [
+        point_in_region(point, region) for point in points
+    ]
@@ -0,0 +1,8 @@
+from typing import List
+
+import numpy as np
+from ground.hints import Point
+
+
+def to_points_array(points: List[Point]) -> np.ndarray:
+    return np.array([(point.x, point.y) for point in points]).reshape(-1, 2)